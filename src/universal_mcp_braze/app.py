@@ -1,11 +1,184 @@
-from typing import Any, Optional, List
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from typing import Any, Iterable, Iterator, Optional, List
+import httpx
 from universal_mcp.applications import APIApplication
 from universal_mcp.integrations import Integration
 
+from universal_mcp_braze.bulk import BulkResult, SendResult, chunked, dispatch, error_detail, hoist_properties, record_chunk, resending
+from universal_mcp_braze.cache import SeriesCache, credential_namespace
+from universal_mcp_braze.coalescing import SingleFlight, request_key
+from universal_mcp_braze.control_group import ControlGroupIndex, alias_key
+from universal_mcp_braze.decoding import JsonLoads, decode_response, default_json_loads, is_write
+from universal_mcp_braze.export import CallbackReceiver, fetch_export, stream_export
+from universal_mcp_braze.pagination import iter_concurrently, iter_offsets, iter_pages, page_items, split_date_range, unique_records
+from universal_mcp_braze.ratelimit import RateLimit, RateLimiter
+from universal_mcp_braze.retry import RetryPolicy
+from universal_mcp_braze.series_frame import SeriesFrame
+from universal_mcp_braze.timeseries import SERIES_METRICS
+
+# Items per page returned by the page-numbered list endpoints; the event and product
+# name lists return larger pages.
+LIST_PAGE_SIZE = 100
+NAME_LIST_PAGE_SIZE = 250
+
+# Largest `limit` accepted by the offset-paginated list endpoints.
+EMAIL_LIST_LIMIT = 500
+TEMPLATE_LIST_LIMIT = 1000
+SUBSCRIPTION_LIST_LIMIT = 100
+
+# Largest number of items Braze accepts in one catalog items request.
+CATALOG_ITEMS_PER_REQUEST = 50
+
+# Largest number of identifiers Braze accepts in one /users/export/ids request.
+USER_IDS_PER_EXPORT = 50
+
+# Largest number of external IDs, or of user aliases, Braze accepts in one send request.
+RECIPIENTS_PER_SEND = 50
+
+# Metrics of SERIES_METRICS fetched for every app by kpi_snapshot.
+KPI_SNAPSHOT_METRICS = ('dau', 'mau', 'new_users', 'uninstalls', 'sessions')
+
+def _user_key(identifier: Any) -> str:
+    if isinstance(identifier, str):
+        return identifier
+    if isinstance(identifier, dict) and identifier.get('alias_name') is not None and identifier.get('alias_label') is not None:
+        return alias_key(identifier['alias_label'], identifier['alias_name'])
+    raise ValueError(f"Invalid user identifier {identifier!r}; expected an external ID or a user alias.")
+
+def _trigger_recipient(recipient: Any) -> dict[str, Any]:
+    if isinstance(recipient, str):
+        return {'external_user_id': recipient}
+    if isinstance(recipient, dict) and 'alias_name' in recipient and 'alias_label' in recipient:
+        return {'user_alias': recipient}
+    if isinstance(recipient, dict) and ('external_user_id' in recipient or 'user_alias' in recipient):
+        return dict(recipient)
+    raise ValueError(f"Invalid recipient {recipient!r}; expected an external ID, a user alias or a recipient object.")
+
+def _recipient_key(recipient: dict[str, Any]) -> str:
+    if 'external_user_id' in recipient:
+        return recipient['external_user_id']
+    return _user_key(recipient['user_alias'])
+
 class BrazeApp(APIApplication):
-    def __init__(self, integration: Integration = None, **kwargs) -> None:
+    def __init__(self, integration: Integration = None, max_connections: int = 100, max_keepalive_connections: int = 20, keepalive_expiry: float = 30.0, http2: bool = False, rate_limits: Optional[dict[str, Optional[RateLimit]]] = None, rate_limiter: Optional[RateLimiter] = None, retry_policy: Optional[RetryPolicy] = None, json_loads: JsonLoads = default_json_loads, decode_writes: bool = True, series_cache: Optional[SeriesCache] = None, coalesce_reads: bool = True, **kwargs) -> None:
+        """
+        Args:
+            integration: Integration providing the Braze REST API key.
+            max_connections: Upper bound on concurrent connections in the shared pool.
+            max_keepalive_connections: Idle connections kept open for reuse.
+            keepalive_expiry: Seconds an idle connection stays in the pool.
+            http2: Multiplex requests over HTTP/2 (requires the 'http2' extra).
+            rate_limits: Per-workspace overrides merged over Braze's default endpoint quotas,
+                keyed by "METHOD /path/template" or "/path/template".
+            rate_limiter: A RateLimiter to share with other clients of the same workspace;
+                takes precedence over rate_limits.
+            retry_policy: When to resend requests that hit 429, 5xx or transport errors;
+                defaults to RetryPolicy().
+            json_loads: Parser applied to raw response bytes; orjson when installed.
+            decode_writes: When False, write endpoints whose body is only a status message
+                (such as /users/track) skip parsing it and return None, for fire-and-forget
+                ingestion. Writes that return IDs, such as sends, are always decoded.
+            series_cache: Caches analytics data series responses; closed windows are
+                kept for good and recent ones briefly.
+            coalesce_reads: Let concurrent identical GET requests share one in-flight
+                request and its response.
+        """
         super().__init__(name='braze', integration=integration, **kwargs)
         self.base_url = "https://rest.iad-01.braze.com"
+        self.limits = httpx.Limits(max_connections=max_connections, max_keepalive_connections=max_keepalive_connections, keepalive_expiry=keepalive_expiry)
+        self.http2 = http2
+        self.rate_limiter = rate_limiter if rate_limiter is not None else RateLimiter(rate_limits)
+        self.retry_policy = retry_policy if retry_policy is not None else RetryPolicy()
+        self.json_loads = json_loads
+        self.decode_writes = decode_writes
+        self.series_cache = series_cache
+        self._reads = SingleFlight() if coalesce_reads else None
+        self._client: Optional[httpx.Client] = None
+        self._client_lock = threading.Lock()
+
+    @property
+    def client(self) -> httpx.Client:
+        if self._client is None:
+            with self._client_lock:
+                if self._client is None:
+                    self._client = httpx.Client(base_url=self.base_url, headers=self._get_headers(), timeout=self.default_timeout, limits=self.limits, http2=self.http2)
+        return self._client
+
+    @contextmanager
+    def get_sync_client(self) -> Iterator[httpx.Client]:
+        yield self.client
+
+    def close(self) -> None:
+        with self._client_lock:
+            if self._client is not None:
+                self._client.close()
+                self._client = None
+
+    def __enter__(self) -> 'BrazeApp':
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def _request(self, method: str, url: str, data: Any = None, params: Optional[dict[str, Any]] = None, content_type: str = 'application/json', files: Optional[dict[str, Any]] = None) -> httpx.Response:
+        attempt = 0
+        while True:
+            attempt += 1
+            self.rate_limiter.acquire(method, url)
+            try:
+                response = self._send(method, url, data=data, params=params, content_type=content_type, files=files)
+            except httpx.TransportError as exc:
+                delay = self.retry_policy.retry_delay(attempt, method, url, error=exc)
+                if delay is None:
+                    raise
+            else:
+                delay = self.retry_policy.retry_delay(attempt, method, url, response=response)
+                if delay is None:
+                    return response
+            time.sleep(delay)
+
+    def _send(self, method: str, url: str, data: Any = None, params: Optional[dict[str, Any]] = None, content_type: str = 'application/json', files: Optional[dict[str, Any]] = None) -> httpx.Response:
+        if data is None and files is None:
+            return self.client.request(method, url, params=params)
+        if content_type == 'application/json':
+            return self.client.request(method, url, json=data, params=params)
+        if content_type == 'multipart/form-data':
+            return self.client.request(method, url, data=data, files=files, params=params)
+        if content_type == 'application/x-www-form-urlencoded':
+            return self.client.request(method, url, data=data, params=params, headers={'Content-Type': content_type})
+        return self.client.request(method, url, content=data, params=params, headers={'Content-Type': content_type})
+
+    def _handle_response(self, response: httpx.Response) -> Any:
+        return decode_response(response, self.json_loads, skip_body=not self.decode_writes and is_write(response))
+
+    def _get(self, url: str, params: Optional[dict[str, Any]] = None) -> httpx.Response:
+        if self.series_cache is not None:
+            namespace = credential_namespace(self.client.headers)
+            cached = self.series_cache.lookup(url, params, namespace)
+            if cached is not None:
+                return cached
+        if self._reads is None:
+            response = self._request('GET', url, params=params)
+        else:
+            response = self._reads.do(request_key(url, params), lambda: self._request('GET', url, params=params))
+        if self.series_cache is not None:
+            self.series_cache.store(url, params, response, namespace)
+        return response
+
+    def _post(self, url: str, data: Any, params: Optional[dict[str, Any]] = None, content_type: str = 'application/json', files: Optional[dict[str, Any]] = None) -> httpx.Response:
+        return self._request('POST', url, data=data, params=params, content_type=content_type, files=files)
+
+    def _put(self, url: str, data: Any, params: Optional[dict[str, Any]] = None, content_type: str = 'application/json', files: Optional[dict[str, Any]] = None) -> httpx.Response:
+        return self._request('PUT', url, data=data, params=params, content_type=content_type, files=files)
+
+    def _patch(self, url: str, data: Any, params: Optional[dict[str, Any]] = None, content_type: str = 'application/json', files: Optional[dict[str, Any]] = None) -> httpx.Response:
+        return self._request('PATCH', url, data=data, params=params, content_type=content_type, files=files)
+
+    def _delete(self, url: str, params: Optional[dict[str, Any]] = None, data: Any = None) -> httpx.Response:
+        return self._request('DELETE', url, data=data, params=params)
 
     def update_email_template(self, email_template_id: Optional[str] = None, template_name: Optional[str] = None, subject: Optional[str] = None, body: Optional[str] = None, plaintext_body: Optional[str] = None, preheader: Optional[str] = None, tags: Optional[List[str]] = None) -> dict[str, Any]:
         """
@@ -44,13 +217,7 @@ class BrazeApp(APIApplication):
         url = f"{self.base_url}/templates/email/update"
         query_params = {}
         response = self._post(url, data=request_body_data, params=query_params, content_type='application/json')
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._handle_response(response)
 
     def track_user_activity(self, attributes: Optional[List[dict[str, Any]]] = None, events: Optional[List[dict[str, Any]]] = None, purchases: Optional[List[dict[str, Any]]] = None) -> dict[str, Any]:
         """
@@ -81,13 +248,7 @@ class BrazeApp(APIApplication):
         url = f"{self.base_url}/users/track"
         query_params = {}
         response = self._post(url, data=request_body_data, params=query_params, content_type='application/json')
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._handle_response(response)
 
     def delete_catalog_by_name(self, catalog_name: str) -> dict[str, Any]:
         """
@@ -111,13 +272,7 @@ class BrazeApp(APIApplication):
         url = f"{self.base_url}/catalogs/{catalog_name}"
         query_params = {}
         response = self._delete(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._handle_response(response)
 
     def list_catalogs(self) -> dict[str, Any]:
         """
@@ -136,13 +291,7 @@ class BrazeApp(APIApplication):
         url = f"{self.base_url}/catalogs"
         query_params = {}
         response = self._get(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._handle_response(response)
 
     def create_catalog(self, catalogs: Optional[List[dict[str, Any]]] = None) -> dict[str, Any]:
         """
@@ -169,20 +318,15 @@ class BrazeApp(APIApplication):
         url = f"{self.base_url}/catalogs"
         query_params = {}
         response = self._post(url, data=request_body_data, params=query_params, content_type='application/json')
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._handle_response(response)
 
-    def delete_catalog_item(self, catalog_name: str) -> dict[str, Any]:
+    def delete_catalog_item(self, catalog_name: str, items: Optional[List[dict[str, Any]]] = None) -> dict[str, Any]:
         """
         Delete Multiple Catalog Items
 
         Args:
             catalog_name (string): catalog_name
+            items (array): items Example: [{'id': 'restaurant1'}].
 
         Returns:
             dict[str, Any]: Successful response
@@ -196,16 +340,15 @@ class BrazeApp(APIApplication):
         """
         if catalog_name is None:
             raise ValueError("Missing required parameter 'catalog_name'.")
+        request_body_data = None
+        request_body_data = {
+            'items': items,
+        }
+        request_body_data = {k: v for k, v in request_body_data.items() if v is not None}
         url = f"{self.base_url}/catalogs/{catalog_name}/items"
         query_params = {}
-        response = self._delete(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        response = self._delete(url, params=query_params, data=request_body_data)
+        return self._handle_response(response)
 
     def edit_catalog_item(self, catalog_name: str, items: Optional[List[dict[str, Any]]] = None) -> dict[str, Any]:
         """
@@ -235,13 +378,7 @@ class BrazeApp(APIApplication):
         url = f"{self.base_url}/catalogs/{catalog_name}/items"
         query_params = {}
         response = self._patch(url, data=request_body_data, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._handle_response(response)
 
     def create_catalog_item(self, catalog_name: str, items: Optional[List[dict[str, Any]]] = None) -> dict[str, Any]:
         """
@@ -271,13 +408,7 @@ class BrazeApp(APIApplication):
         url = f"{self.base_url}/catalogs/{catalog_name}/items"
         query_params = {}
         response = self._post(url, data=request_body_data, params=query_params, content_type='application/json')
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._handle_response(response)
 
     def update_catalog_items(self, catalog_name: str, items: Optional[List[dict[str, Any]]] = None) -> dict[str, Any]:
         """
@@ -307,13 +438,7 @@ class BrazeApp(APIApplication):
         url = f"{self.base_url}/catalogs/{catalog_name}/items"
         query_params = {}
         response = self._put(url, data=request_body_data, params=query_params, content_type='application/json')
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._handle_response(response)
 
     def list_catalog_items(self, catalog_name: str) -> dict[str, Any]:
         """
@@ -337,13 +462,7 @@ class BrazeApp(APIApplication):
         url = f"{self.base_url}/catalogs/{catalog_name}/items"
         query_params = {}
         response = self._get(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._handle_response(response)
 
     def delete_catalog_item_by_id(self, catalog_name: str, item_id: str) -> dict[str, Any]:
         """
@@ -370,13 +489,7 @@ class BrazeApp(APIApplication):
         url = f"{self.base_url}/catalogs/{catalog_name}/items/{item_id}"
         query_params = {}
         response = self._delete(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._handle_response(response)
 
     def get_item_detail(self, catalog_name: str, item_id: str) -> dict[str, Any]:
         """
@@ -403,13 +516,7 @@ class BrazeApp(APIApplication):
         url = f"{self.base_url}/catalogs/{catalog_name}/items/{item_id}"
         query_params = {}
         response = self._get(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._handle_response(response)
 
     def update_catalog_item_by_id(self, catalog_name: str, item_id: str, items: Optional[List[dict[str, Any]]] = None) -> dict[str, Any]:
         """
@@ -442,13 +549,7 @@ class BrazeApp(APIApplication):
         url = f"{self.base_url}/catalogs/{catalog_name}/items/{item_id}"
         query_params = {}
         response = self._patch(url, data=request_body_data, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._handle_response(response)
 
     def add_catalog_item_by_id(self, catalog_name: str, item_id: str, items: Optional[List[dict[str, Any]]] = None) -> dict[str, Any]:
         """
@@ -481,13 +582,7 @@ class BrazeApp(APIApplication):
         url = f"{self.base_url}/catalogs/{catalog_name}/items/{item_id}"
         query_params = {}
         response = self._post(url, data=request_body_data, params=query_params, content_type='application/json')
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._handle_response(response)
 
     def update_catalog_item(self, catalog_name: str, item_id: str, items: Optional[List[dict[str, Any]]] = None) -> dict[str, Any]:
         """
@@ -520,13 +615,7 @@ class BrazeApp(APIApplication):
         url = f"{self.base_url}/catalogs/{catalog_name}/items/{item_id}"
         query_params = {}
         response = self._put(url, data=request_body_data, params=query_params, content_type='application/json')
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._handle_response(response)
 
     def list_hard_bounces(self, start_date: Optional[str] = None, end_date: Optional[str] = None, limit: Optional[int] = None, offset: Optional[int] = None, email: Optional[str] = None) -> dict[str, Any]:
         """
@@ -552,13 +641,7 @@ class BrazeApp(APIApplication):
         url = f"{self.base_url}/email/hard_bounces"
         query_params = {k: v for k, v in [('start_date', start_date), ('end_date', end_date), ('limit', limit), ('offset', offset), ('email', email)] if v is not None}
         response = self._get(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._handle_response(response)
 
     def list_unsubscribes(self, start_date: Optional[str] = None, end_date: Optional[str] = None, limit: Optional[int] = None, offset: Optional[int] = None, sort_direction: Optional[str] = None, email: Optional[str] = None) -> dict[str, Any]:
         """
@@ -585,13 +668,7 @@ class BrazeApp(APIApplication):
         url = f"{self.base_url}/email/unsubscribes"
         query_params = {k: v for k, v in [('start_date', start_date), ('end_date', end_date), ('limit', limit), ('offset', offset), ('sort_direction', sort_direction), ('email', email)] if v is not None}
         response = self._get(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._handle_response(response)
 
     def post_email_status(self, email: Optional[str] = None, subscription_state: Optional[str] = None) -> dict[str, Any]:
         """
@@ -620,13 +697,7 @@ class BrazeApp(APIApplication):
         url = f"{self.base_url}/email/status"
         query_params = {}
         response = self._post(url, data=request_body_data, params=query_params, content_type='application/json')
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._handle_response(response)
 
     def remove_bounced_email(self, email: Optional[str] = None) -> dict[str, Any]:
         """
@@ -653,13 +724,7 @@ class BrazeApp(APIApplication):
         url = f"{self.base_url}/email/bounce/remove"
         query_params = {}
         response = self._post(url, data=request_body_data, params=query_params, content_type='application/json')
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._handle_response(response)
 
     def remove_email_spam(self, email: Optional[str] = None) -> dict[str, Any]:
         """
@@ -686,13 +751,7 @@ class BrazeApp(APIApplication):
         url = f"{self.base_url}/email/spam/remove"
         query_params = {}
         response = self._post(url, data=request_body_data, params=query_params, content_type='application/json')
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._handle_response(response)
 
     def add_email_to_blocklist(self, email: Optional[List[str]] = None) -> dict[str, Any]:
         """
@@ -719,13 +778,7 @@ class BrazeApp(APIApplication):
         url = f"{self.base_url}/email/blocklist"
         query_params = {}
         response = self._post(url, data=request_body_data, params=query_params, content_type='application/json')
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._handle_response(response)
 
     def add_to_blacklist(self, email: Optional[List[str]] = None) -> dict[str, Any]:
         """
@@ -752,13 +805,7 @@ class BrazeApp(APIApplication):
         url = f"{self.base_url}/email/blacklist"
         query_params = {}
         response = self._post(url, data=request_body_data, params=query_params, content_type='application/json')
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._handle_response(response)
 
     def get_campaign_data_series(self, campaign_id: Optional[str] = None, length: Optional[int] = None, ending_at: Optional[str] = None) -> dict[str, Any]:
         """
@@ -782,13 +829,7 @@ class BrazeApp(APIApplication):
         url = f"{self.base_url}/campaigns/data_series"
         query_params = {k: v for k, v in [('campaign_id', campaign_id), ('length', length), ('ending_at', ending_at)] if v is not None}
         response = self._get(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._handle_response(response)
 
     def get_campaign_details(self, campaign_id: Optional[str] = None) -> dict[str, Any]:
         """
@@ -810,13 +851,7 @@ class BrazeApp(APIApplication):
         url = f"{self.base_url}/campaigns/details"
         query_params = {k: v for k, v in [('campaign_id', campaign_id)] if v is not None}
         response = self._get(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._handle_response(response)
 
     def list_campaigns(self, page: Optional[int] = None, include_archived: Optional[bool] = None, sort_direction: Optional[str] = None, last_edit_time_gt: Optional[str] = None) -> dict[str, Any]:
         """
@@ -842,13 +877,7 @@ class BrazeApp(APIApplication):
         url = f"{self.base_url}/campaigns/list"
         query_params = {k: v for k, v in [('page', page), ('include_archived', include_archived), ('sort_direction', sort_direction), ('last_edit.time[gt]', last_edit_time_gt)] if v is not None}
         response = self._get(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._handle_response(response)
 
     def get_send_data_series(self, campaign_id: Optional[str] = None, send_id: Optional[str] = None, length: Optional[int] = None, ending_at: Optional[str] = None) -> dict[str, Any]:
         """
@@ -873,13 +902,7 @@ class BrazeApp(APIApplication):
         url = f"{self.base_url}/sends/data_series"
         query_params = {k: v for k, v in [('campaign_id', campaign_id), ('send_id', send_id), ('length', length), ('ending_at', ending_at)] if v is not None}
         response = self._get(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._handle_response(response)
 
     def get_canvas_data_series(self, canvas_id: Optional[str] = None, ending_at: Optional[str] = None, starting_at: Optional[str] = None, length: Optional[int] = None, include_variant_breakdown: Optional[bool] = None, include_step_breakdown: Optional[bool] = None, include_deleted_step_data: Optional[bool] = None) -> dict[str, Any]:
         """
@@ -907,13 +930,7 @@ class BrazeApp(APIApplication):
         url = f"{self.base_url}/canvas/data_series"
         query_params = {k: v for k, v in [('canvas_id', canvas_id), ('ending_at', ending_at), ('starting_at', starting_at), ('length', length), ('include_variant_breakdown', include_variant_breakdown), ('include_step_breakdown', include_step_breakdown), ('include_deleted_step_data', include_deleted_step_data)] if v is not None}
         response = self._get(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._handle_response(response)
 
     def fetch_canvas_data_summary(self, canvas_id: Optional[str] = None, ending_at: Optional[str] = None, starting_at: Optional[str] = None, length: Optional[int] = None, include_variant_breakdown: Optional[bool] = None, include_step_breakdown: Optional[bool] = None, include_deleted_step_data: Optional[bool] = None) -> dict[str, Any]:
         """
@@ -942,13 +959,7 @@ class BrazeApp(APIApplication):
         url = f"{self.base_url}/canvas/data_summary"
         query_params = {k: v for k, v in [('canvas_id', canvas_id), ('ending_at', ending_at), ('starting_at', starting_at), ('length', length), ('include_variant_breakdown', include_variant_breakdown), ('include_step_breakdown', include_step_breakdown), ('include_deleted_step_data', include_deleted_step_data)] if v is not None}
         response = self._get(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._handle_response(response)
 
     def get_canvas_details(self, canvas_id: Optional[str] = None) -> dict[str, Any]:
         """
@@ -970,13 +981,7 @@ class BrazeApp(APIApplication):
         url = f"{self.base_url}/canvas/details"
         query_params = {k: v for k, v in [('canvas_id', canvas_id)] if v is not None}
         response = self._get(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._handle_response(response)
 
     def list_canvas(self, page: Optional[int] = None, include_archived: Optional[bool] = None, sort_direction: Optional[str] = None, last_edit_time_gt: Optional[str] = None) -> dict[str, Any]:
         """
@@ -1002,13 +1007,7 @@ class BrazeApp(APIApplication):
         url = f"{self.base_url}/canvas/list"
         query_params = {k: v for k, v in [('page', page), ('include_archived', include_archived), ('sort_direction', sort_direction), ('last_edit.time[gt]', last_edit_time_gt)] if v is not None}
         response = self._get(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._handle_response(response)
 
     def list_events(self, page: Optional[int] = None) -> dict[str, Any]:
         """
@@ -1030,13 +1029,7 @@ class BrazeApp(APIApplication):
         url = f"{self.base_url}/events/list"
         query_params = {k: v for k, v in [('page', page)] if v is not None}
         response = self._get(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._handle_response(response)
 
     def fetch_event_series_data(self, event: Optional[str] = None, length: Optional[int] = None, unit: Optional[str] = None, ending_at: Optional[str] = None, app_id: Optional[str] = None, segment_id: Optional[str] = None) -> dict[str, Any]:
         """
@@ -1063,13 +1056,7 @@ class BrazeApp(APIApplication):
         url = f"{self.base_url}/events/data_series"
         query_params = {k: v for k, v in [('event', event), ('length', length), ('unit', unit), ('ending_at', ending_at), ('app_id', app_id), ('segment_id', segment_id)] if v is not None}
         response = self._get(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._handle_response(response)
 
     def list_new_user_kpi_series(self, length: Optional[int] = None, ending_at: Optional[str] = None, app_id: Optional[str] = None) -> dict[str, Any]:
         """
@@ -1093,13 +1080,7 @@ class BrazeApp(APIApplication):
         url = f"{self.base_url}/kpi/new_users/data_series"
         query_params = {k: v for k, v in [('length', length), ('ending_at', ending_at), ('app_id', app_id)] if v is not None}
         response = self._get(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._handle_response(response)
 
     def get_daily_active_users_series(self, length: Optional[int] = None, ending_at: Optional[str] = None, app_id: Optional[str] = None) -> dict[str, Any]:
         """
@@ -1124,13 +1105,7 @@ class BrazeApp(APIApplication):
         url = f"{self.base_url}/kpi/dau/data_series"
         query_params = {k: v for k, v in [('length', length), ('ending_at', ending_at), ('app_id', app_id)] if v is not None}
         response = self._get(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._handle_response(response)
 
     def get_kpimau_data_series(self, length: Optional[int] = None, ending_at: Optional[str] = None, app_id: Optional[str] = None) -> dict[str, Any]:
         """
@@ -1154,13 +1129,7 @@ class BrazeApp(APIApplication):
         url = f"{self.base_url}/kpi/mau/data_series"
         query_params = {k: v for k, v in [('length', length), ('ending_at', ending_at), ('app_id', app_id)] if v is not None}
         response = self._get(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._handle_response(response)
 
     def get_kpi_uninstalls_data_series(self, length: Optional[int] = None, ending_at: Optional[str] = None, app_id: Optional[str] = None) -> dict[str, Any]:
         """
@@ -1184,13 +1153,7 @@ class BrazeApp(APIApplication):
         url = f"{self.base_url}/kpi/uninstalls/data_series"
         query_params = {k: v for k, v in [('length', length), ('ending_at', ending_at), ('app_id', app_id)] if v is not None}
         response = self._get(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._handle_response(response)
 
     def get_feed_data_series(self, card_id: Optional[str] = None, length: Optional[int] = None, unit: Optional[str] = None, ending_at: Optional[str] = None) -> dict[str, Any]:
         """
@@ -1215,13 +1178,7 @@ class BrazeApp(APIApplication):
         url = f"{self.base_url}/feed/data_series"
         query_params = {k: v for k, v in [('card_id', card_id), ('length', length), ('unit', unit), ('ending_at', ending_at)] if v is not None}
         response = self._get(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._handle_response(response)
 
     def get_feed_details(self, card_id: Optional[str] = None) -> dict[str, Any]:
         """
@@ -1243,13 +1200,7 @@ class BrazeApp(APIApplication):
         url = f"{self.base_url}/feed/details"
         query_params = {k: v for k, v in [('card_id', card_id)] if v is not None}
         response = self._get(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._handle_response(response)
 
     def list_feed(self, page: Optional[int] = None, include_archived: Optional[bool] = None, sort_direction: Optional[str] = None) -> dict[str, Any]:
         """
@@ -1274,13 +1225,7 @@ class BrazeApp(APIApplication):
         url = f"{self.base_url}/feed/list"
         query_params = {k: v for k, v in [('page', page), ('include_archived', include_archived), ('sort_direction', sort_direction)] if v is not None}
         response = self._get(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._handle_response(response)
 
     def list_products(self, page: Optional[int] = None) -> dict[str, Any]:
         """
@@ -1302,13 +1247,7 @@ class BrazeApp(APIApplication):
         url = f"{self.base_url}/purchases/product_list"
         query_params = {k: v for k, v in [('page', page)] if v is not None}
         response = self._get(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._handle_response(response)
 
     def get_purchase_quantity_series(self, ending_at: Optional[str] = None, length: Optional[int] = None, unit: Optional[int] = None, app_id: Optional[str] = None, product: Optional[str] = None) -> dict[str, Any]:
         """
@@ -1339,13 +1278,7 @@ class BrazeApp(APIApplication):
         url = f"{self.base_url}/purchases/quantity_series"
         query_params = {k: v for k, v in [('ending_at', ending_at), ('length', length), ('unit', unit), ('app_id', app_id), ('product', product)] if v is not None}
         response = self._get(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._handle_response(response)
 
     def get_purchases_revenue_series(self, ending_at: Optional[str] = None, length: Optional[int] = None, unit: Optional[int] = None, app_id: Optional[str] = None, product: Optional[str] = None) -> dict[str, Any]:
         """
@@ -1376,13 +1309,7 @@ class BrazeApp(APIApplication):
         url = f"{self.base_url}/purchases/revenue_series"
         query_params = {k: v for k, v in [('ending_at', ending_at), ('length', length), ('unit', unit), ('app_id', app_id), ('product', product)] if v is not None}
         response = self._get(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._handle_response(response)
 
     def list_segments(self, page: Optional[int] = None, sort_direction: Optional[str] = None) -> dict[str, Any]:
         """
@@ -1406,13 +1333,7 @@ class BrazeApp(APIApplication):
         url = f"{self.base_url}/segments/list"
         query_params = {k: v for k, v in [('page', page), ('sort_direction', sort_direction)] if v is not None}
         response = self._get(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._handle_response(response)
 
     def get_segments_data_series(self, segment_id: Optional[str] = None, length: Optional[int] = None, ending_at: Optional[str] = None) -> dict[str, Any]:
         """
@@ -1436,13 +1357,7 @@ class BrazeApp(APIApplication):
         url = f"{self.base_url}/segments/data_series"
         query_params = {k: v for k, v in [('segment_id', segment_id), ('length', length), ('ending_at', ending_at)] if v is not None}
         response = self._get(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._handle_response(response)
 
     def get_segment_details(self, segment_id: Optional[str] = None) -> dict[str, Any]:
         """
@@ -1464,13 +1379,7 @@ class BrazeApp(APIApplication):
         url = f"{self.base_url}/segments/details"
         query_params = {k: v for k, v in [('segment_id', segment_id)] if v is not None}
         response = self._get(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._handle_response(response)
 
     def get_sessions_data_series(self, length: Optional[int] = None, unit: Optional[str] = None, ending_at: Optional[str] = None, app_id: Optional[str] = None, segment_id: Optional[str] = None) -> dict[str, Any]:
         """
@@ -1496,13 +1405,7 @@ class BrazeApp(APIApplication):
         url = f"{self.base_url}/sessions/data_series"
         query_params = {k: v for k, v in [('length', length), ('unit', unit), ('ending_at', ending_at), ('app_id', app_id), ('segment_id', segment_id)] if v is not None}
         response = self._get(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._handle_response(response)
 
     def export_user_ids_by_post(self, external_ids: Optional[List[str]] = None, user_aliases: Optional[List[dict[str, Any]]] = None, device_id: Optional[str] = None, braze_id: Optional[str] = None, email_address: Optional[str] = None, phone: Optional[str] = None, fields_to_export: Optional[List[str]] = None) -> dict[str, Any]:
         """
@@ -1541,13 +1444,7 @@ class BrazeApp(APIApplication):
         url = f"{self.base_url}/users/export/ids"
         query_params = {}
         response = self._post(url, data=request_body_data, params=query_params, content_type='application/json')
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._handle_response(response)
 
     def export_users_by_segment_post(self, segment_id: Optional[str] = None, callback_endpoint: Optional[str] = None, fields_to_export: Optional[List[str]] = None, output_format: Optional[str] = None) -> dict[str, Any]:
         """
@@ -1580,13 +1477,7 @@ class BrazeApp(APIApplication):
         url = f"{self.base_url}/users/export/segment"
         query_params = {}
         response = self._post(url, data=request_body_data, params=query_params, content_type='application/json')
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._handle_response(response)
 
     def export_global_control_group_users(self, callback_endpoint: Optional[str] = None, fields_to_export: Optional[List[str]] = None, output_format: Optional[str] = None) -> dict[str, Any]:
         """
@@ -1617,13 +1508,7 @@ class BrazeApp(APIApplication):
         url = f"{self.base_url}/users/export/global_control_group"
         query_params = {}
         response = self._post(url, data=request_body_data, params=query_params, content_type='application/json')
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._handle_response(response)
 
     def update_live_activity_message(self, app_id: Optional[str] = None, activity_id: Optional[str] = None, content_state: Optional[dict[str, Any]] = None, end_activity: Optional[bool] = None, dismissal_date: Optional[str] = None, stale_date: Optional[str] = None, notification: Optional[dict[str, Any]] = None) -> dict[str, Any]:
         """
@@ -1662,13 +1547,7 @@ class BrazeApp(APIApplication):
         url = f"{self.base_url}/messages/live_activity/update"
         query_params = {}
         response = self._post(url, data=request_body_data, params=query_params, content_type='application/json')
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._handle_response(response)
 
     def list_scheduled_broadcasts(self, end_time: Optional[str] = None) -> dict[str, Any]:
         """
@@ -1690,13 +1569,7 @@ class BrazeApp(APIApplication):
         url = f"{self.base_url}/messages/scheduled_broadcasts"
         query_params = {k: v for k, v in [('end_time', end_time)] if v is not None}
         response = self._get(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._handle_response(response)
 
     def delete_scheduled_message(self, schedule_id: Optional[str] = None) -> dict[str, Any]:
         """
@@ -1723,13 +1596,7 @@ class BrazeApp(APIApplication):
         url = f"{self.base_url}/messages/schedule/delete"
         query_params = {}
         response = self._post(url, data=request_body_data, params=query_params, content_type='application/json')
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._handle_response(response)
 
     def schedule_delete_canvas_trigger(self, canvas_id: Optional[str] = None, schedule_id: Optional[str] = None) -> dict[str, Any]:
         """
@@ -1758,13 +1625,7 @@ class BrazeApp(APIApplication):
         url = f"{self.base_url}/canvas/trigger/schedule/delete"
         query_params = {}
         response = self._post(url, data=request_body_data, params=query_params, content_type='application/json')
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._handle_response(response)
 
     def delete_campaign_schedule(self, campaign_id: Optional[str] = None, schedule_id: Optional[str] = None) -> dict[str, Any]:
         """
@@ -1793,13 +1654,7 @@ class BrazeApp(APIApplication):
         url = f"{self.base_url}/campaigns/trigger/schedule/delete"
         query_params = {}
         response = self._post(url, data=request_body_data, params=query_params, content_type='application/json')
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._handle_response(response)
 
     def create_scheduled_message(self, broadcast: Optional[bool] = None, external_user_ids: Optional[str] = None, user_aliases: Optional[dict[str, Any]] = None, segment_id: Optional[str] = None, audience: Optional[dict[str, Any]] = None, campaign_id: Optional[str] = None, send_id: Optional[str] = None, override_messaging_limits: Optional[bool] = None, recipient_subscription_state: Optional[str] = None, schedule: Optional[dict[str, Any]] = None, messages: Optional[dict[str, Any]] = None) -> dict[str, Any]:
         """
@@ -1846,13 +1701,7 @@ class BrazeApp(APIApplication):
         url = f"{self.base_url}/messages/schedule/create"
         query_params = {}
         response = self._post(url, data=request_body_data, params=query_params, content_type='application/json')
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._handle_response(response)
 
     def create_schedule(self, campaign_id: Optional[str] = None, send_id: Optional[str] = None, recipients: Optional[List[dict[str, Any]]] = None, audience: Optional[dict[str, Any]] = None, broadcast: Optional[bool] = None, trigger_properties: Optional[dict[str, Any]] = None, schedule: Optional[dict[str, Any]] = None) -> dict[str, Any]:
         """
@@ -1891,13 +1740,7 @@ class BrazeApp(APIApplication):
         url = f"{self.base_url}/campaigns/trigger/schedule/create"
         query_params = {}
         response = self._post(url, data=request_body_data, params=query_params, content_type='application/json')
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._handle_response(response)
 
     def create_schedule_trigger(self, canvas_id: Optional[str] = None, recipients: Optional[List[dict[str, Any]]] = None, audience: Optional[dict[str, Any]] = None, broadcast: Optional[bool] = None, canvas_entry_properties: Optional[dict[str, Any]] = None, schedule: Optional[dict[str, Any]] = None) -> dict[str, Any]:
         """
@@ -1934,13 +1777,7 @@ class BrazeApp(APIApplication):
         url = f"{self.base_url}/canvas/trigger/schedule/create"
         query_params = {}
         response = self._post(url, data=request_body_data, params=query_params, content_type='application/json')
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._handle_response(response)
 
     def schedule_message_update(self, schedule_id: Optional[str] = None, schedule: Optional[dict[str, Any]] = None, messages: Optional[dict[str, Any]] = None) -> dict[str, Any]:
         """
@@ -1971,13 +1808,7 @@ class BrazeApp(APIApplication):
         url = f"{self.base_url}/messages/schedule/update"
         query_params = {}
         response = self._post(url, data=request_body_data, params=query_params, content_type='application/json')
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._handle_response(response)
 
     def update_campaign_trigger_schedule(self, campaign_id: Optional[str] = None, schedule_id: Optional[str] = None, schedule: Optional[dict[str, Any]] = None) -> dict[str, Any]:
         """
@@ -2008,13 +1839,7 @@ class BrazeApp(APIApplication):
         url = f"{self.base_url}/campaigns/trigger/schedule/update"
         query_params = {}
         response = self._post(url, data=request_body_data, params=query_params, content_type='application/json')
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._handle_response(response)
 
     def update_canvas_trigger_schedule(self, canvas_id: Optional[str] = None, schedule_id: Optional[str] = None, schedule: Optional[dict[str, Any]] = None) -> dict[str, Any]:
         """
@@ -2045,13 +1870,7 @@ class BrazeApp(APIApplication):
         url = f"{self.base_url}/canvas/trigger/schedule/update"
         query_params = {}
         response = self._post(url, data=request_body_data, params=query_params, content_type='application/json')
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._handle_response(response)
 
     def create_send_by_id(self, campaign_id: Optional[str] = None, send_id: Optional[str] = None) -> dict[str, Any]:
         """
@@ -2080,13 +1899,7 @@ class BrazeApp(APIApplication):
         url = f"{self.base_url}/sends/id/create"
         query_params = {}
         response = self._post(url, data=request_body_data, params=query_params, content_type='application/json')
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._handle_response(response)
 
     def send_message(self, broadcast: Optional[str] = None, external_user_ids: Optional[str] = None, user_aliases: Optional[dict[str, Any]] = None, segment_id: Optional[str] = None, audience: Optional[dict[str, Any]] = None, campaign_id: Optional[str] = None, send_id: Optional[str] = None, override_frequency_capping: Optional[str] = None, recipient_subscription_state: Optional[str] = None, messages: Optional[dict[str, Any]] = None) -> dict[str, Any]:
         """
@@ -2131,13 +1944,7 @@ class BrazeApp(APIApplication):
         url = f"{self.base_url}/messages/send"
         query_params = {}
         response = self._post(url, data=request_body_data, params=query_params, content_type='application/json')
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._handle_response(response)
 
     def send_campaign_transactional(self, campaign_id: str, external_send_id: Optional[str] = None, trigger_properties: Optional[dict[str, Any]] = None, recipient: Optional[List[dict[str, Any]]] = None) -> dict[str, Any]:
         """
@@ -2171,13 +1978,7 @@ class BrazeApp(APIApplication):
         url = f"{self.base_url}/transactional/v1/campaigns/{campaign_id}/send"
         query_params = {}
         response = self._post(url, data=request_body_data, params=query_params, content_type='application/json')
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._handle_response(response)
 
     def send_campaign_trigger(self, campaign_id: Optional[str] = None, send_id: Optional[str] = None, trigger_properties: Optional[dict[str, Any]] = None, broadcast: Optional[bool] = None, audience: Optional[dict[str, Any]] = None, recipients: Optional[List[dict[str, Any]]] = None) -> dict[str, Any]:
         """
@@ -2214,13 +2015,7 @@ class BrazeApp(APIApplication):
         url = f"{self.base_url}/campaigns/trigger/send"
         query_params = {}
         response = self._post(url, data=request_body_data, params=query_params, content_type='application/json')
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._handle_response(response)
 
     def send_canvas_trigger_post(self, canvas_id: Optional[str] = None, canvas_entry_properties: Optional[dict[str, Any]] = None, broadcast: Optional[bool] = None, audience: Optional[dict[str, Any]] = None, recipients: Optional[List[dict[str, Any]]] = None) -> dict[str, Any]:
         """
@@ -2255,13 +2050,7 @@ class BrazeApp(APIApplication):
         url = f"{self.base_url}/canvas/trigger/send"
         query_params = {}
         response = self._post(url, data=request_body_data, params=query_params, content_type='application/json')
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._handle_response(response)
 
     def get_preference_center_url_by_user_id(self, PreferenceCenterExternalID: str, UserID: str, preference_center_api_id: Optional[str] = None, external_id: Optional[str] = None) -> dict[str, Any]:
         """
@@ -2290,13 +2079,7 @@ class BrazeApp(APIApplication):
         url = f"{self.base_url}/preference_center_v1/{PreferenceCenterExternalID}/url/{UserID}"
         query_params = {k: v for k, v in [('preference_center_api_id', preference_center_api_id), ('external_id', external_id)] if v is not None}
         response = self._get(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._handle_response(response)
 
     def list_preferences(self) -> dict[str, Any]:
         """
@@ -2315,13 +2098,7 @@ class BrazeApp(APIApplication):
         url = f"{self.base_url}/preference_center/v1/list"
         query_params = {}
         response = self._get(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._handle_response(response)
 
     def get_preference_center_by_id(self, PreferenceCenterExternalID: str) -> dict[str, Any]:
         """
@@ -2345,13 +2122,7 @@ class BrazeApp(APIApplication):
         url = f"{self.base_url}/preference_center/v1/{PreferenceCenterExternalID}"
         query_params = {}
         response = self._get(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._handle_response(response)
 
     def update_preference_center_by_id(self, PreferenceCenterExternalID: str, external_send_id: Optional[str] = None, trigger_properties: Optional[dict[str, Any]] = None, recipient: Optional[List[dict[str, Any]]] = None) -> dict[str, Any]:
         """
@@ -2385,13 +2156,7 @@ class BrazeApp(APIApplication):
         url = f"{self.base_url}/preference_center/v1/{PreferenceCenterExternalID}"
         query_params = {}
         response = self._put(url, data=request_body_data, params=query_params, content_type='application/json')
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._handle_response(response)
 
     def create_preference_center_entry(self, name: Optional[str] = None, preference_center_title: Optional[str] = None, preference_center_page_html: Optional[str] = None, confirmation_page_html: Optional[str] = None, state: Optional[str] = None, options: Optional[dict[str, Any]] = None) -> dict[str, Any]:
         """
@@ -2428,13 +2193,7 @@ class BrazeApp(APIApplication):
         url = f"{self.base_url}/preference_center/v1"
         query_params = {}
         response = self._post(url, data=request_body_data, params=query_params, content_type='application/json')
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._handle_response(response)
 
     def delete_user_by_id(self, id: str) -> dict[str, Any]:
         """
@@ -2458,13 +2217,7 @@ class BrazeApp(APIApplication):
         url = f"{self.base_url}/scim/v2/Users/{id}"
         query_params = {}
         response = self._delete(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._handle_response(response)
 
     def get_user_by_id(self, id: str) -> dict[str, Any]:
         """
@@ -2488,13 +2241,7 @@ class BrazeApp(APIApplication):
         url = f"{self.base_url}/scim/v2/Users/{id}"
         query_params = {}
         response = self._get(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._handle_response(response)
 
     def update_user_by_id(self, id: str, schemas: Optional[List[str]] = None, name: Optional[dict[str, Any]] = None, department: Optional[str] = None, permissions: Optional[dict[str, Any]] = None) -> dict[str, Any]:
         """
@@ -2530,13 +2277,7 @@ class BrazeApp(APIApplication):
         url = f"{self.base_url}/scim/v2/Users/{id}"
         query_params = {}
         response = self._put(url, data=request_body_data, params=query_params, content_type='application/json')
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._handle_response(response)
 
     def list_users(self, filter: Optional[str] = None) -> dict[str, Any]:
         """
@@ -2558,13 +2299,7 @@ class BrazeApp(APIApplication):
         url = f"{self.base_url}/scim/v2/Users"
         query_params = {k: v for k, v in [('filter', filter)] if v is not None}
         response = self._get(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._handle_response(response)
 
     def create_user(self, schemas: Optional[List[str]] = None, userName: Optional[str] = None, name: Optional[dict[str, Any]] = None, department: Optional[str] = None, permissions: Optional[dict[str, Any]] = None) -> dict[str, Any]:
         """
@@ -2599,13 +2334,7 @@ class BrazeApp(APIApplication):
         url = f"{self.base_url}/scim/v2/Users"
         query_params = {}
         response = self._post(url, data=request_body_data, params=query_params, content_type='application/json')
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._handle_response(response)
 
     def list_invalid_phone_numbers(self, start_date: Optional[str] = None, end_date: Optional[str] = None, limit: Optional[int] = None, offset: Optional[int] = None, phone_numbers: Optional[int] = None) -> dict[str, Any]:
         """
@@ -2634,13 +2363,7 @@ class BrazeApp(APIApplication):
         url = f"{self.base_url}/sms/invalid_phone_numbers"
         query_params = {k: v for k, v in [('start_date', start_date), ('end_date', end_date), ('limit', limit), ('offset', offset), ('phone_numbers', phone_numbers)] if v is not None}
         response = self._get(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._handle_response(response)
 
     def remove_invalid_phone_numbers(self, phone_numbers: Optional[List[str]] = None) -> dict[str, Any]:
         """
@@ -2667,13 +2390,7 @@ class BrazeApp(APIApplication):
         url = f"{self.base_url}/sms/invalid_phone_numbers/remove"
         query_params = {}
         response = self._post(url, data=request_body_data, params=query_params, content_type='application/json')
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._handle_response(response)
 
     def get_subscription_status(self, subscription_group_id: Optional[str] = None, external_id: Optional[str] = None, phone: Optional[str] = None) -> dict[str, Any]:
         """
@@ -2697,13 +2414,7 @@ class BrazeApp(APIApplication):
         url = f"{self.base_url}/subscription/status/get"
         query_params = {k: v for k, v in [('subscription_group_id', subscription_group_id), ('external_id', external_id), ('phone', phone)] if v is not None}
         response = self._get(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._handle_response(response)
 
     def get_subscription_user_status(self, external_id: Optional[str] = None, limit: Optional[int] = None, offset: Optional[int] = None, phone: Optional[str] = None) -> dict[str, Any]:
         """
@@ -2728,13 +2439,7 @@ class BrazeApp(APIApplication):
         url = f"{self.base_url}/subscription/user/status"
         query_params = {k: v for k, v in [('external_id', external_id), ('limit', limit), ('offset', offset), ('phone', phone)] if v is not None}
         response = self._get(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._handle_response(response)
 
     def set_subscription_status(self, subscription_group_id: Optional[str] = None, subscription_state: Optional[str] = None, external_id: Optional[str] = None, phone: Optional[List[str]] = None) -> dict[str, Any]:
         """
@@ -2767,13 +2472,7 @@ class BrazeApp(APIApplication):
         url = f"{self.base_url}/subscription/status/set"
         query_params = {}
         response = self._post(url, data=request_body_data, params=query_params, content_type='application/json')
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._handle_response(response)
 
     def set_subscription_status_post(self, subscription_groups: Optional[List[dict[str, Any]]] = None) -> dict[str, Any]:
         """
@@ -2800,13 +2499,7 @@ class BrazeApp(APIApplication):
         url = f"{self.base_url}/v2/subscription/status/set"
         query_params = {}
         response = self._post(url, data=request_body_data, params=query_params, content_type='application/json')
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._handle_response(response)
 
     def list_content_blocks(self, modified_after: Optional[str] = None, modified_before: Optional[str] = None, limit: Optional[int] = None, offset: Optional[int] = None) -> dict[str, Any]:
         """
@@ -2831,13 +2524,7 @@ class BrazeApp(APIApplication):
         url = f"{self.base_url}/content_blocks/list"
         query_params = {k: v for k, v in [('modified_after', modified_after), ('modified_before', modified_before), ('limit', limit), ('offset', offset)] if v is not None}
         response = self._get(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._handle_response(response)
 
     def get_info_content_block(self, content_block_id: Optional[str] = None, include_inclusion_data: Optional[bool] = None) -> dict[str, Any]:
         """
@@ -2860,13 +2547,7 @@ class BrazeApp(APIApplication):
         url = f"{self.base_url}/content_blocks/info"
         query_params = {k: v for k, v in [('content_block_id', content_block_id), ('include_inclusion_data', include_inclusion_data)] if v is not None}
         response = self._get(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._handle_response(response)
 
     def create_content_block(self, name: Optional[str] = None, description: Optional[str] = None, content: Optional[str] = None, state: Optional[str] = None, tags: Optional[List[str]] = None) -> dict[str, Any]:
         """
@@ -2901,13 +2582,7 @@ class BrazeApp(APIApplication):
         url = f"{self.base_url}/content_blocks/create"
         query_params = {}
         response = self._post(url, data=request_body_data, params=query_params, content_type='application/json')
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._handle_response(response)
 
     def update_content_block(self, content_block_id: Optional[str] = None, name: Optional[str] = None, description: Optional[str] = None, content: Optional[str] = None, state: Optional[str] = None, tags: Optional[List[str]] = None) -> dict[str, Any]:
         """
@@ -2944,13 +2619,7 @@ class BrazeApp(APIApplication):
         url = f"{self.base_url}/content_blocks/update"
         query_params = {}
         response = self._post(url, data=request_body_data, params=query_params, content_type='application/json')
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._handle_response(response)
 
     def list_email_templates(self, modified_after: Optional[str] = None, modified_before: Optional[str] = None, limit: Optional[int] = None, offset: Optional[int] = None) -> dict[str, Any]:
         """
@@ -2975,13 +2644,7 @@ class BrazeApp(APIApplication):
         url = f"{self.base_url}/templates/email/list"
         query_params = {k: v for k, v in [('modified_after', modified_after), ('modified_before', modified_before), ('limit', limit), ('offset', offset)] if v is not None}
         response = self._get(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._handle_response(response)
 
     def get_email_template_info(self, email_template_id: Optional[str] = None) -> dict[str, Any]:
         """
@@ -3003,13 +2666,7 @@ class BrazeApp(APIApplication):
         url = f"{self.base_url}/templates/email/info"
         query_params = {k: v for k, v in [('email_template_id', email_template_id)] if v is not None}
         response = self._get(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._handle_response(response)
 
     def create_email_template(self, template_name: Optional[str] = None, subject: Optional[str] = None, body: Optional[str] = None, plaintext_body: Optional[str] = None, preheader: Optional[str] = None, tags: Optional[List[str]] = None) -> dict[str, Any]:
         """
@@ -3046,13 +2703,7 @@ class BrazeApp(APIApplication):
         url = f"{self.base_url}/templates/email/create"
         query_params = {}
         response = self._post(url, data=request_body_data, params=query_params, content_type='application/json')
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._handle_response(response)
 
     def rename_external_id(self, external_id_renames: Optional[List[dict[str, Any]]] = None) -> dict[str, Any]:
         """
@@ -3079,13 +2730,7 @@ class BrazeApp(APIApplication):
         url = f"{self.base_url}/users/external_ids/rename"
         query_params = {}
         response = self._post(url, data=request_body_data, params=query_params, content_type='application/json')
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._handle_response(response)
 
     def remove_external_id(self, external_ids: Optional[List[str]] = None) -> dict[str, Any]:
         """
@@ -3112,13 +2757,7 @@ class BrazeApp(APIApplication):
         url = f"{self.base_url}/users/external_ids/remove"
         query_params = {}
         response = self._post(url, data=request_body_data, params=query_params, content_type='application/json')
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._handle_response(response)
 
     def update_user_alias(self, alias_updates: Optional[List[dict[str, Any]]] = None) -> dict[str, Any]:
         """
@@ -3145,13 +2784,7 @@ class BrazeApp(APIApplication):
         url = f"{self.base_url}/users/alias/update"
         query_params = {}
         response = self._post(url, data=request_body_data, params=query_params, content_type='application/json')
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._handle_response(response)
 
     def create_user_alias_new(self, user_aliases: Optional[List[dict[str, Any]]] = None) -> dict[str, Any]:
         """
@@ -3178,13 +2811,7 @@ class BrazeApp(APIApplication):
         url = f"{self.base_url}/users/alias/new"
         query_params = {}
         response = self._post(url, data=request_body_data, params=query_params, content_type='application/json')
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._handle_response(response)
 
     def delete_user(self, external_ids: Optional[List[str]] = None, braze_ids: Optional[List[str]] = None, user_aliases: Optional[List[dict[str, Any]]] = None) -> dict[str, Any]:
         """
@@ -3215,13 +2842,7 @@ class BrazeApp(APIApplication):
         url = f"{self.base_url}/users/delete"
         query_params = {}
         response = self._post(url, data=request_body_data, params=query_params, content_type='application/json')
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._handle_response(response)
 
     def identify_user(self, aliases_to_identify: Optional[List[dict[str, Any]]] = None) -> dict[str, Any]:
         """
@@ -3248,13 +2869,7 @@ class BrazeApp(APIApplication):
         url = f"{self.base_url}/users/identify"
         query_params = {}
         response = self._post(url, data=request_body_data, params=query_params, content_type='application/json')
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._handle_response(response)
 
     def merge_users_post(self, merge_updates: Optional[List[dict[str, Any]]] = None) -> dict[str, Any]:
         """
@@ -3281,13 +2896,693 @@ class BrazeApp(APIApplication):
         url = f"{self.base_url}/users/merge"
         query_params = {}
         response = self._post(url, data=request_body_data, params=query_params, content_type='application/json')
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._handle_response(response)
+
+    def iter_campaigns(self, include_archived: Optional[bool] = None, sort_direction: Optional[str] = None, last_edit_time_gt: Optional[str] = None, prefetch: int = 0) -> Iterator[dict[str, Any]]:
+        """
+        Iterates over every campaign, following list_campaigns page by page.
+
+        Args:
+            include_archived (boolean): Include archived campaigns.
+            sort_direction (string): 'desc' for newest first.
+            last_edit_time_gt (string): Only campaigns edited after this time.
+            prefetch (integer): Pages to fetch ahead of the one being consumed.
+
+        Yields:
+            dict[str, Any]: One campaign summary per item.
+        """
+        return iter_pages(lambda page: page_items(self.list_campaigns(page=page, include_archived=include_archived, sort_direction=sort_direction, last_edit_time_gt=last_edit_time_gt), 'campaigns'), LIST_PAGE_SIZE, prefetch=prefetch)
+
+    def iter_canvases(self, include_archived: Optional[bool] = None, sort_direction: Optional[str] = None, last_edit_time_gt: Optional[str] = None, prefetch: int = 0) -> Iterator[dict[str, Any]]:
+        """
+        Iterates over every Canvas, following list_canvas page by page.
+
+        Args:
+            include_archived (boolean): Include archived Canvases.
+            sort_direction (string): 'desc' for newest first.
+            last_edit_time_gt (string): Only Canvases edited after this time.
+            prefetch (integer): Pages to fetch ahead of the one being consumed.
+
+        Yields:
+            dict[str, Any]: One Canvas summary per item.
+        """
+        return iter_pages(lambda page: page_items(self.list_canvas(page=page, include_archived=include_archived, sort_direction=sort_direction, last_edit_time_gt=last_edit_time_gt), 'canvases'), LIST_PAGE_SIZE, prefetch=prefetch)
+
+    def iter_segments(self, sort_direction: Optional[str] = None, prefetch: int = 0) -> Iterator[dict[str, Any]]:
+        """
+        Iterates over every segment, following list_segments page by page.
+
+        Args:
+            sort_direction (string): 'desc' for newest first.
+            prefetch (integer): Pages to fetch ahead of the one being consumed.
+
+        Yields:
+            dict[str, Any]: One segment summary per item.
+        """
+        return iter_pages(lambda page: page_items(self.list_segments(page=page, sort_direction=sort_direction), 'segments'), LIST_PAGE_SIZE, prefetch=prefetch)
+
+    def iter_events(self, prefetch: int = 0) -> Iterator[str]:
+        """
+        Iterates over every custom event name, following list_events page by page.
+
+        Args:
+            prefetch (integer): Pages to fetch ahead of the one being consumed.
+
+        Yields:
+            str: One custom event name per item.
+        """
+        return iter_pages(lambda page: page_items(self.list_events(page=page), 'events'), NAME_LIST_PAGE_SIZE, prefetch=prefetch)
+
+    def iter_feed_cards(self, include_archived: Optional[bool] = None, sort_direction: Optional[str] = None, prefetch: int = 0) -> Iterator[dict[str, Any]]:
+        """
+        Iterates over every News Feed card, following list_feed page by page.
+
+        Args:
+            include_archived (boolean): Include archived cards.
+            sort_direction (string): 'desc' for newest first.
+            prefetch (integer): Pages to fetch ahead of the one being consumed.
+
+        Yields:
+            dict[str, Any]: One card summary per item.
+        """
+        return iter_pages(lambda page: page_items(self.list_feed(page=page, include_archived=include_archived, sort_direction=sort_direction), 'cards'), LIST_PAGE_SIZE, prefetch=prefetch)
+
+    def iter_products(self, prefetch: int = 0) -> Iterator[str]:
+        """
+        Iterates over every product ID, following list_products page by page.
+
+        Args:
+            prefetch (integer): Pages to fetch ahead of the one being consumed.
+
+        Yields:
+            str: One product ID per item.
+        """
+        return iter_pages(lambda page: page_items(self.list_products(page=page), 'products'), NAME_LIST_PAGE_SIZE, prefetch=prefetch)
+
+    def _iter_windows(self, list_method: Any, key: str, limit: int, parallel: int, date_splits: int = 1, start_date: Optional[str] = None, end_date: Optional[str] = None, **params: Any) -> Iterator[Any]:
+        if date_splits > 1 and (start_date is None or end_date is None):
+            raise ValueError("'start_date' and 'end_date' are required when 'date_splits' is greater than 1.")
+        if start_date is not None or end_date is not None:
+            params.update(start_date=start_date, end_date=end_date)
+        ranges = split_date_range(start_date, end_date, date_splits) if date_splits > 1 else [(start_date, end_date)]
+
+        def walk(range_start: Optional[str], range_end: Optional[str]) -> Iterator[Any]:
+            if 'start_date' in params:
+                params_for_range = {**params, 'start_date': range_start, 'end_date': range_end}
+            else:
+                params_for_range = params
+            return iter_offsets(lambda offset, count: page_items(list_method(offset=offset, limit=count, **params_for_range), key), limit, parallel=parallel)
+
+        records = iter_concurrently([lambda bounds=bounds: walk(*bounds) for bounds in ranges])
+        # Neighbouring sub-ranges share their boundary date, so drop records both returned.
+        return unique_records(records) if len(ranges) > 1 else records
+
+    def iter_catalog_items(self, catalog_name: str) -> Iterator[dict[str, Any]]:
+        """
+        Iterates over every item of a catalog, following the cursor in each page's Link header.
+
+        Only one page (at most 50 items) is held at a time, so catalogs of any size can be
+        streamed.
+
+        Args:
+            catalog_name (string): catalog_name
+
+        Yields:
+            dict[str, Any]: One catalog item per item.
+        """
+        if catalog_name is None:
+            raise ValueError("Missing required parameter 'catalog_name'.")
+        url = f"{self.base_url}/catalogs/{catalog_name}/items"
+        while url:
+            response = self._get(url)
+            yield from page_items(self._handle_response(response), 'items')
+            url = response.links.get('next', {}).get('url')
+
+    def upsert_catalog_items(self, catalog_name: str, items: Iterable[dict[str, Any]], mode: str = 'update', chunk_size: int = CATALOG_ITEMS_PER_REQUEST, max_workers: int = 4) -> BulkResult:
+        """
+        Writes any number of catalog items, chunked to Braze's per-request maximum and sent concurrently.
+
+        Items are drawn from `items` lazily, so generators of any length can be streamed.
+        Requests are paced by the client's rate limiter under the shared catalog items quota.
+        Braze applies these writes asynchronously; success means the request was accepted.
+
+        Args:
+            catalog_name (string): catalog_name
+            items (iterable): Catalog items, each with an 'id'.
+            mode (string): 'update' (PUT, create or replace), 'create' (POST) or 'edit' (PATCH).
+            chunk_size (integer): Items per request, at most 50.
+            max_workers (integer): Requests in flight at once.
+
+        Returns:
+            BulkResult: Item IDs that were accepted and the error for each rejected one. Items
+            without an 'id' are not sent; their positions in `items` are listed in `invalid`.
+        """
+        if catalog_name is None:
+            raise ValueError("Missing required parameter 'catalog_name'.")
+        writers = {'update': self.update_catalog_items, 'create': self.create_catalog_item, 'edit': self.edit_catalog_item}
+        if mode not in writers:
+            raise ValueError(f"Invalid mode '{mode}'; expected one of {sorted(writers)}.")
+        write = writers[mode]
+
+        def send(chunk: List[dict[str, Any]]) -> Any:
+            return write(catalog_name=catalog_name, items=chunk)
+
+        result = BulkResult()
+
+        def identified(items: Iterable[dict[str, Any]]) -> Iterator[dict[str, Any]]:
+            for position, item in enumerate(items):
+                if isinstance(item, dict) and item.get('id') is not None:
+                    yield item
+                else:
+                    result.invalid.append(position)
+
+        def key(item: dict[str, Any]) -> str:
+            return item['id']
+
+        for chunk, outcomes, error in dispatch(resending(send, key), chunked(identified(items), min(chunk_size, CATALOG_ITEMS_PER_REQUEST)), max_workers):
+            for elements, response, request_error in outcomes or [(chunk, None, error)]:
+                record_chunk(result, elements, response, request_error, key)
+        return result
+
+    def delete_catalog_items(self, catalog_name: str, item_ids: Iterable[str], chunk_size: int = CATALOG_ITEMS_PER_REQUEST, max_workers: int = 4) -> BulkResult:
+        """
+        Deletes any number of catalog items, packing IDs into full delete_catalog_item requests sent concurrently.
+
+        Args:
+            catalog_name (string): catalog_name
+            item_ids (iterable): IDs of the items to delete.
+            chunk_size (integer): IDs per request, at most 50.
+            max_workers (integer): Requests in flight at once.
+
+        Returns:
+            BulkResult: Item IDs whose deletion was accepted and the error for each rejected one.
+        """
+        if catalog_name is None:
+            raise ValueError("Missing required parameter 'catalog_name'.")
+
+        def send(chunk: List[str]) -> Any:
+            return self.delete_catalog_item(catalog_name=catalog_name, items=[{'id': item_id} for item_id in chunk])
+
+        result = BulkResult()
+
+        def key(item_id: str) -> str:
+            return item_id
+
+        for chunk, outcomes, error in dispatch(resending(send, key), chunked(item_ids, min(chunk_size, CATALOG_ITEMS_PER_REQUEST)), max_workers):
+            for elements, response, request_error in outcomes or [(chunk, None, error)]:
+                record_chunk(result, elements, response, request_error, key)
+        return result
+
+    def send_messages(self, recipients: Iterable[Any], messages: dict[str, Any], campaign_id: Optional[str] = None, send_id: Optional[str] = None, override_frequency_capping: Optional[bool] = None, recipient_subscription_state: Optional[str] = None, chunk_size: int = RECIPIENTS_PER_SEND, max_workers: int = 4) -> SendResult:
+        """
+        Sends a message to any number of users, split into full send_message requests sent concurrently.
+
+        Recipients are drawn lazily and deduplicated, so generators of any length can be
+        streamed; one that is neither an external ID nor a user alias is reported in
+        `failures` and skipped. Requests are paced by the client's rate limiter under the
+        shared messaging quota. Failed requests are not resent, so no user receives the
+        message twice.
+
+        Args:
+            recipients (iterable): External IDs and/or user aliases.
+            messages (object): The messages object, as for send_message.
+            campaign_id (string): Campaign to attribute the sends to.
+            send_id (string): Send to track the messages under.
+            override_frequency_capping (boolean): Ignore the campaign's frequency capping.
+            recipient_subscription_state (string): 'opted_in', 'subscribed' or 'all'.
+            chunk_size (integer): Recipients per request, at most 50.
+            max_workers (integer): Requests in flight at once.
+
+        Returns:
+            SendResult: The dispatch IDs of the accepted requests and the recipients of each failed one.
+        """
+        result = SendResult()
+
+        def distinct(identifiers: Iterable[Any]) -> Iterator[Any]:
+            seen = set()
+            for identifier in identifiers:
+                try:
+                    key = _user_key(identifier)
+                except ValueError as error:
+                    result.record([identifier], None, error)
+                    continue
+                if key not in seen:
+                    seen.add(key)
+                    yield identifier
+
+        def send(chunk: List[Any]) -> Any:
+            external_user_ids = [identifier for identifier in chunk if isinstance(identifier, str)]
+            user_aliases = [identifier for identifier in chunk if isinstance(identifier, dict)]
+            return self.send_message(external_user_ids=external_user_ids or None, user_aliases=user_aliases or None, campaign_id=campaign_id, send_id=send_id, override_frequency_capping=override_frequency_capping, recipient_subscription_state=recipient_subscription_state, messages=messages)
+
+        for chunk, response, error in dispatch(send, chunked(distinct(recipients), min(chunk_size, RECIPIENTS_PER_SEND)), max_workers):
+            result.record([_user_key(identifier) for identifier in chunk], response, error)
+        return result
+
+    def _send_triggers(self, send: Any, recipients: Iterable[tuple[Any, Optional[dict[str, Any]]]], shared: Optional[dict[str, Any]], field: str, chunk_size: int, max_workers: int) -> SendResult:
+        result = SendResult()
+
+        def normalized(pairs: Iterable[tuple[Any, Optional[dict[str, Any]]]]) -> Iterator[tuple[dict[str, Any], Optional[dict[str, Any]]]]:
+            for recipient, recipient_properties in pairs:
+                try:
+                    recipient_object = _trigger_recipient(recipient)
+                    _recipient_key(recipient_object)
+                except ValueError as error:
+                    result.record([recipient], None, error)
+                    continue
+                yield recipient_object, recipient_properties
+
+        def pack(pairs: List[tuple[dict[str, Any], Optional[dict[str, Any]]]]) -> tuple[dict[str, Any], List[dict[str, Any]]]:
+            objects, properties = [], []
+            for recipient, recipient_properties in pairs:
+                properties.append({**(recipient.pop(field, None) or {}), **(recipient_properties or {})})
+                objects.append(recipient)
+            top, remaining = hoist_properties(properties, shared)
+            for recipient, recipient_properties in zip(objects, remaining):
+                if recipient_properties:
+                    recipient[field] = recipient_properties
+            return top, objects
+
+        requests = (pack(pairs) for pairs in chunked(normalized(recipients), min(chunk_size, RECIPIENTS_PER_SEND)))
+        for (top, objects), response, error in dispatch(lambda request: send(*request), requests, max_workers):
+            result.record([_recipient_key(recipient) for recipient in objects], response, error)
+        return result
+
+    def send_campaign_triggers(self, campaign_id: str, recipients: Iterable[tuple[Any, Optional[dict[str, Any]]]], trigger_properties: Optional[dict[str, Any]] = None, send_id: Optional[str] = None, chunk_size: int = RECIPIENTS_PER_SEND, max_workers: int = 4) -> SendResult:
+        """
+        Triggers an API-triggered campaign for any number of users, packed into full send_campaign_trigger requests sent concurrently.
+
+        Properties that every recipient of a request shares are sent once at the top level
+        instead of per recipient. Pairs are drawn lazily, so generators of any length can
+        be streamed; an invalid recipient is reported in `failures` and skipped. Failed
+        requests are not resent.
+
+        Args:
+            campaign_id (string): The campaign to trigger.
+            recipients (iterable): (recipient, trigger_properties) pairs; a recipient is an external ID, a user alias or a recipient object.
+            trigger_properties (object): Properties for every recipient; per-recipient values take precedence.
+            send_id (string): Send to track the messages under.
+            chunk_size (integer): Recipients per request, at most 50.
+            max_workers (integer): Requests in flight at once.
+
+        Returns:
+            SendResult: The dispatch IDs of the accepted requests and the recipients of each failed one.
+        """
+        if campaign_id is None:
+            raise ValueError("Missing required parameter 'campaign_id'.")
+
+        def send(top: dict[str, Any], objects: List[dict[str, Any]]) -> Any:
+            return self.send_campaign_trigger(campaign_id=campaign_id, send_id=send_id, trigger_properties=top or None, recipients=objects)
+
+        return self._send_triggers(send, recipients, trigger_properties, 'trigger_properties', chunk_size, max_workers)
+
+    def send_canvas_triggers(self, canvas_id: str, recipients: Iterable[tuple[Any, Optional[dict[str, Any]]]], canvas_entry_properties: Optional[dict[str, Any]] = None, chunk_size: int = RECIPIENTS_PER_SEND, max_workers: int = 4) -> SendResult:
+        """
+        Triggers an API-triggered Canvas for any number of users, packed into full send_canvas_trigger_post requests sent concurrently.
+
+        Entry properties that every recipient of a request shares are sent once at the top
+        level instead of per recipient. Pairs are drawn lazily, so generators of any length
+        can be streamed; an invalid recipient is reported in `failures` and skipped. Failed
+        requests are not resent.
+
+        Args:
+            canvas_id (string): The Canvas to trigger.
+            recipients (iterable): (recipient, canvas_entry_properties) pairs; a recipient is an external ID, a user alias or a recipient object.
+            canvas_entry_properties (object): Entry properties for every recipient; per-recipient values take precedence.
+            chunk_size (integer): Recipients per request, at most 50.
+            max_workers (integer): Requests in flight at once.
+
+        Returns:
+            SendResult: The dispatch IDs of the accepted requests and the recipients of each failed one.
+        """
+        if canvas_id is None:
+            raise ValueError("Missing required parameter 'canvas_id'.")
+
+        def send(top: dict[str, Any], objects: List[dict[str, Any]]) -> Any:
+            return self.send_canvas_trigger_post(canvas_id=canvas_id, canvas_entry_properties=top or None, recipients=objects)
+
+        return self._send_triggers(send, recipients, canvas_entry_properties, 'canvas_entry_properties', chunk_size, max_workers)
+
+    def lookup_users(self, ids: List[Any], fields: Optional[List[str]] = None, max_workers: int = 4) -> dict[str, Any]:
+        """
+        Look Up User Profiles in Bulk
+
+        Exports the profiles of any number of users, deduplicating the identifiers, packing them 50
+        to a request and running the requests concurrently within the /users/export/ids quota.
+
+        Args:
+            ids (array): External IDs and/or user aliases Example: ['user_identifier1', {'alias_name': 'example_alias', 'alias_label': 'example_label'}].
+            fields (array): Profile fields to export; all fields when omitted Example: ['first_name', 'email', 'purchases'].
+            max_workers (integer): Requests in flight at once.
+
+        Returns:
+            dict[str, Any]: 'users' maps each identifier (the external ID, or for aliases the label's length, the label and the name joined by ':', e.g. '3:crm:x9') to its profile, 'invalid_user_ids' lists identifiers Braze did not find, and 'errors' lists failed requests with their identifiers.
+
+        Raises:
+            ValueError: Raised when an identifier is neither a string nor a user alias.
+
+        Tags:
+            Export > Users
+        """
+        identifiers = {}
+        for identifier in ids:
+            identifiers.setdefault(_user_key(identifier), identifier)
+        if fields is not None:
+            fields = list(dict.fromkeys([*fields, 'external_id', 'user_aliases']))
+
+        def send(chunk: List[Any]) -> Any:
+            external_ids = [identifier for identifier in chunk if isinstance(identifier, str)]
+            user_aliases = [identifier for identifier in chunk if isinstance(identifier, dict)]
+            return self.export_user_ids_by_post(external_ids=external_ids or None, user_aliases=user_aliases or None, fields_to_export=fields)
+
+        result = {'users': {}, 'invalid_user_ids': [], 'errors': []}
+        for chunk, response, error in dispatch(send, chunked(identifiers.values(), USER_IDS_PER_EXPORT), max_workers):
+            if error is not None:
+                result['errors'].append({'ids': [_user_key(identifier) for identifier in chunk], 'error': error_detail(error)})
+                continue
+            body = response or {}
+            result['invalid_user_ids'].extend(body.get('invalid_user_ids') or [])
+            for user in body.get('users') or []:
+                for key in [user.get('external_id'), *(_user_key(alias) for alias in user.get('user_aliases') or [])]:
+                    if key in identifiers:
+                        result['users'][key] = user
+        return result
+
+    def _fan_out(self, ids: List[str], fetchers: dict[str, Any], max_workers: int) -> tuple[dict[str, dict[str, Any]], List[dict[str, Any]]]:
+        """Calls every fetcher for every distinct ID concurrently; returns results by ID and endpoint, and the failures."""
+        ids = list(dict.fromkeys(ids))
+        results = {item_id: {} for item_id in ids}
+        errors = []
+        payloads = ((item_id, name) for item_id in ids for name in fetchers)
+        for (item_id, name), response, error in dispatch(lambda payload: fetchers[payload[1]](payload[0]), payloads, max_workers):
+            if error is not None:
+                errors.append({'id': item_id, 'endpoint': name, 'error': error_detail(error)})
+            else:
+                results[item_id][name] = response
+        return results, errors
+
+    def get_campaigns_analytics(self, campaign_ids: List[str], length: int = 7, ending_at: Optional[str] = None, include_details: bool = True, max_workers: int = 8) -> dict[str, Any]:
+        """
+        Export Analytics for Many Campaigns
+
+        Fetches the details and data series of many campaigns concurrently. Each request is paced by
+        the client's per-endpoint rate limits, and a failure only affects the campaign and endpoint it
+        belongs to.
+
+        Args:
+            campaign_ids (array): The campaigns to report on Example: ['campaign_identifier1', 'campaign_identifier2'].
+            length (integer): Days before `ending_at` to include in each series, 1 to 100 Example: '7'.
+            ending_at (string): ISO 8601 end of the series; defaults to now Example: '2020-06-28T23:59:59-05:00'.
+            include_details (boolean): Also fetch each campaign's details.
+            max_workers (integer): Requests in flight at once.
+
+        Returns:
+            dict[str, Any]: 'campaigns' maps each campaign ID to its 'details' and 'data_series' responses, and 'errors' lists the failed requests with 'id', 'endpoint' and 'error'.
+
+        Tags:
+            Export > Campaign
+        """
+        fetchers = {'data_series': lambda campaign_id: self.get_campaign_data_series(campaign_id=campaign_id, length=length, ending_at=ending_at)}
+        if include_details:
+            fetchers['details'] = lambda campaign_id: self.get_campaign_details(campaign_id=campaign_id)
+        campaigns, errors = self._fan_out(campaign_ids, fetchers, max_workers)
+        return {'campaigns': campaigns, 'errors': errors}
+
+    def get_canvases_analytics(self, canvas_ids: List[str], ending_at: Optional[str] = None, length: Optional[int] = 7, starting_at: Optional[str] = None, include_details: bool = True, max_workers: int = 8) -> dict[str, Any]:
+        """
+        Export Analytics for Many Canvases
+
+        Fetches the details and data summaries of many Canvases concurrently. Each request is paced by
+        the client's per-endpoint rate limits, and a failure only affects the Canvas and endpoint it
+        belongs to.
+
+        Args:
+            canvas_ids (array): The Canvases to report on Example: ['canvas_identifier1', 'canvas_identifier2'].
+            ending_at (string): ISO 8601 end of the summaries; defaults to now Example: '2018-05-30T23:59:59-05:00'.
+            length (integer): Days before `ending_at` to summarize, 1 to 14; ignored when `starting_at` is given Example: '7'.
+            starting_at (string): ISO 8601 start of the summaries Example: '2018-05-28T23:59:59-05:00'.
+            include_details (boolean): Also fetch each Canvas's details.
+            max_workers (integer): Requests in flight at once.
+
+        Returns:
+            dict[str, Any]: 'canvases' maps each Canvas ID to its 'details' and 'data_summary' responses, and 'errors' lists the failed requests with 'id', 'endpoint' and 'error'.
+
+        Tags:
+            Export > Canvas
+        """
+        if ending_at is None:
+            ending_at = datetime.now(timezone.utc).isoformat(timespec='seconds')
+        if starting_at is not None:
+            length = None
+        fetchers = {'data_summary': lambda canvas_id: self.fetch_canvas_data_summary(canvas_id=canvas_id, ending_at=ending_at, starting_at=starting_at, length=length)}
+        if include_details:
+            fetchers['details'] = lambda canvas_id: self.get_canvas_details(canvas_id=canvas_id)
+        canvases, errors = self._fan_out(canvas_ids, fetchers, max_workers)
+        return {'canvases': canvases, 'errors': errors}
+
+    def kpi_snapshot(self, app_ids: List[str], length: int = 30, ending_at: Optional[str] = None, max_workers: int = 10) -> dict[str, Any]:
+        """
+        Export a KPI Snapshot Across Apps
+
+        Fetches the daily active users, monthly active users, new users, uninstalls and sessions series
+        of every app concurrently and aligns them on one date index.
+
+        Args:
+            app_ids (array): The apps to include Example: ['app_identifier1', 'app_identifier2'].
+            length (integer): Days before `ending_at` to include, 1 to 100 Example: '30'.
+            ending_at (string): ISO 8601 end of the series; defaults to now Example: '2018-06-28T23:59:59-05:00'.
+            max_workers (integer): Requests in flight at once.
+
+        Returns:
+            dict[str, Any]: 'dates' is the sorted date index, 'metrics' the metric names, 'values' maps each app ID and metric to a list aligned with 'dates' (None where Braze returned no point), and 'errors' lists failed requests with 'app_id', 'metric' and 'error'.
+
+        Tags:
+            Export > KPI
+        """
+        app_ids = list(dict.fromkeys(app_ids))
+        points = {app_id: {metric: {} for metric in KPI_SNAPSHOT_METRICS} for app_id in app_ids}
+        errors = []
+
+        def fetch(payload: tuple[str, str]) -> Any:
+            app_id, metric = payload
+            return getattr(self, SERIES_METRICS[metric][0])(length=length, ending_at=ending_at, app_id=app_id)
+
+        payloads = ((app_id, metric) for app_id in app_ids for metric in KPI_SNAPSHOT_METRICS)
+        for (app_id, metric), response, error in dispatch(fetch, payloads, max_workers):
+            if error is not None:
+                errors.append({'app_id': app_id, 'metric': metric, 'error': error_detail(error)})
+                continue
+            value_key = SERIES_METRICS[metric][1]
+            for point in (response or {}).get('data') or []:
+                points[app_id][metric][str(point.get('time', ''))[:10]] = point.get(value_key)
+
+        dates = sorted({day for by_metric in points.values() for series in by_metric.values() for day in series})
+        values = {
+            app_id: {metric: [series.get(day) for day in dates] for metric, series in by_metric.items()}
+            for app_id, by_metric in points.items()
+        }
+        return {'dates': dates, 'metrics': list(KPI_SNAPSHOT_METRICS), 'values': values, 'errors': errors}
+
+    def iter_segment_export(self, segment_id: str, fields_to_export: Optional[List[str]] = None, callback: Optional[CallbackReceiver] = None, poll_interval: float = 5.0, timeout: float = 3600.0, archive_path: Optional[str] = None) -> Iterator[dict[str, Any]]:
+        """
+        Exports a segment and streams the exported user records once the archive is ready.
+
+        The export is started on the first iteration. The download URL is polled with
+        backoff, and a `callback` ends the wait as soon as Braze reports completion. The
+        archive is streamed to disk and its part files are parsed line by line.
+
+        Args:
+            segment_id (string): The segment to export.
+            fields_to_export (array): Profile fields to include Example: ['first_name', 'email', 'purchases'].
+            callback (CallbackReceiver): Receiver Braze notifies when the export is done.
+            poll_interval (number): First delay between polls of the download URL.
+            timeout (number): Seconds to wait for the export to finish.
+            archive_path (string): Keep the downloaded archive at this path.
+
+        Yields:
+            dict[str, Any]: One exported user per item.
+        """
+        if segment_id is None:
+            raise ValueError("Missing required parameter 'segment_id'.")
+        return stream_export(lambda callback_endpoint: self.export_users_by_segment_post(segment_id=segment_id, callback_endpoint=callback_endpoint, fields_to_export=fields_to_export, output_format='zip'), callback=callback, poll_interval=poll_interval, timeout=timeout, archive_path=archive_path)
+
+    def iter_global_control_group_export(self, fields_to_export: Optional[List[str]] = None, callback: Optional[CallbackReceiver] = None, poll_interval: float = 5.0, timeout: float = 3600.0, archive_path: Optional[str] = None) -> Iterator[dict[str, Any]]:
+        """
+        Exports the Global Control Group and streams its members once the archive is ready.
+
+        Args:
+            fields_to_export (array): Profile fields to include Example: ['email', 'braze_id'].
+            callback (CallbackReceiver): Receiver Braze notifies when the export is done.
+            poll_interval (number): First delay between polls of the download URL.
+            timeout (number): Seconds to wait for the export to finish.
+            archive_path (string): Keep the downloaded archive at this path.
+
+        Yields:
+            dict[str, Any]: One exported user per item.
+        """
+        return stream_export(lambda callback_endpoint: self.export_global_control_group_users(callback_endpoint=callback_endpoint, fields_to_export=fields_to_export, output_format='zip'), callback=callback, poll_interval=poll_interval, timeout=timeout, archive_path=archive_path)
+
+    def campaign_series_frame(self, campaign_id: str, length: int, ending_at: Optional[str] = None) -> SeriesFrame:
+        """
+        Fetches a campaign's data series as a SeriesFrame of NumPy columns.
+
+        Args:
+            campaign_id (string): The campaign.
+            length (integer): Days before `ending_at` to include, 1 to 100.
+            ending_at (string): ISO 8601 end of the series; defaults to now.
+
+        Returns:
+            SeriesFrame: One row per day, one column per channel, variation and metric.
+        """
+        return SeriesFrame.from_response(self.get_campaign_data_series(campaign_id=campaign_id, length=length, ending_at=ending_at))
+
+    def canvas_series_frame(self, canvas_id: str, ending_at: str, starting_at: Optional[str] = None, length: Optional[int] = None, include_variant_breakdown: Optional[bool] = None, include_step_breakdown: Optional[bool] = None) -> SeriesFrame:
+        """
+        Fetches a Canvas's data series as a SeriesFrame of NumPy columns.
+
+        Args:
+            canvas_id (string): The Canvas.
+            ending_at (string): ISO 8601 end of the series.
+            starting_at (string): ISO 8601 start of the series; or pass `length`.
+            length (integer): Days before `ending_at` to include, 1 to 14.
+            include_variant_breakdown (boolean): Add per-variant columns.
+            include_step_breakdown (boolean): Add per-step columns.
+
+        Returns:
+            SeriesFrame: One row per day, with 'total_stats.*', 'variant_stats.*' and 'step_stats.*' columns.
+        """
+        return SeriesFrame.from_response(self.get_canvas_data_series(canvas_id=canvas_id, ending_at=ending_at, starting_at=starting_at, length=length, include_variant_breakdown=include_variant_breakdown, include_step_breakdown=include_step_breakdown))
+
+    def build_control_group_index(self, path: str, callback: Optional[CallbackReceiver] = None, poll_interval: float = 5.0, timeout: float = 3600.0) -> ControlGroupIndex:
+        """
+        Exports the Global Control Group and writes a memory-mapped membership index of it.
+
+        Reopen the file later with `ControlGroupIndex.open` to check holdouts without a
+        network call; rebuild it whenever the control group may have changed.
+
+        Args:
+            path (string): Where the index is written.
+            callback (CallbackReceiver): Receiver Braze notifies when the export is done.
+            poll_interval (number): First delay between polls of the download URL.
+            timeout (number): Seconds to wait for the export to finish.
+
+        Returns:
+            ControlGroupIndex: The opened index.
+        """
+        members = self.iter_global_control_group_export(fields_to_export=['external_id', 'braze_id', 'user_aliases'], callback=callback, poll_interval=poll_interval, timeout=timeout)
+        return ControlGroupIndex.build(members, path)
+
+    def download_segment_export(self, segment_id: str, destination: str, fields_to_export: Optional[List[str]] = None, callback: Optional[CallbackReceiver] = None, poll_interval: float = 5.0, timeout: float = 3600.0) -> str:
+        """
+        Exports a segment and downloads the finished archive without parsing it.
+
+        The archive can then be converted in parallel with `universal_mcp_braze.columnar`.
+
+        Args:
+            segment_id (string): The segment to export.
+            destination (string): Path the archive is written to.
+            fields_to_export (array): Profile fields to include Example: ['first_name', 'email', 'purchases'].
+            callback (CallbackReceiver): Receiver Braze notifies when the export is done.
+            poll_interval (number): First delay between polls of the download URL.
+            timeout (number): Seconds to wait for the export to finish.
+
+        Returns:
+            str: The path of the downloaded archive.
+        """
+        if segment_id is None:
+            raise ValueError("Missing required parameter 'segment_id'.")
+        return fetch_export(lambda callback_endpoint: self.export_users_by_segment_post(segment_id=segment_id, callback_endpoint=callback_endpoint, fields_to_export=fields_to_export, output_format='zip'), destination, callback=callback, poll_interval=poll_interval, timeout=timeout)
+
+    def iter_hard_bounces(self, start_date: Optional[str] = None, end_date: Optional[str] = None, email: Optional[str] = None, parallel: int = 1, date_splits: int = 1) -> Iterator[dict[str, Any]]:
+        """
+        Iterates over every hard bounced email in a date range, following list_hard_bounces window by window.
+
+        Args:
+            start_date (string): Start of the range, YYYY-MM-DD.
+            end_date (string): End of the range, YYYY-MM-DD.
+            email (string): Only this email address.
+            parallel (integer): Offset windows fetched concurrently per date range.
+            date_splits (integer): Sub-ranges of the date range walked concurrently.
+
+        Yields:
+            dict[str, Any]: One hard bounce per item, oldest sub-range first.
+        """
+        return self._iter_windows(self.list_hard_bounces, 'emails', EMAIL_LIST_LIMIT, parallel, date_splits, start_date, end_date, email=email)
+
+    def iter_unsubscribes(self, start_date: Optional[str] = None, end_date: Optional[str] = None, sort_direction: Optional[str] = None, email: Optional[str] = None, parallel: int = 1, date_splits: int = 1) -> Iterator[dict[str, Any]]:
+        """
+        Iterates over every unsubscribed email in a date range, following list_unsubscribes window by window.
+
+        Args:
+            start_date (string): Start of the range, YYYY-MM-DD.
+            end_date (string): End of the range, YYYY-MM-DD.
+            sort_direction (string): 'asc' for oldest first within each sub-range.
+            email (string): Only this email address.
+            parallel (integer): Offset windows fetched concurrently per date range.
+            date_splits (integer): Sub-ranges of the date range walked concurrently.
+
+        Yields:
+            dict[str, Any]: One unsubscribe per item, oldest sub-range first.
+        """
+        return self._iter_windows(self.list_unsubscribes, 'emails', EMAIL_LIST_LIMIT, parallel, date_splits, start_date, end_date, sort_direction=sort_direction, email=email)
+
+    def iter_invalid_phone_numbers(self, start_date: Optional[str] = None, end_date: Optional[str] = None, phone_numbers: Optional[int] = None, parallel: int = 1, date_splits: int = 1) -> Iterator[dict[str, Any]]:
+        """
+        Iterates over every invalid phone number in a date range, following list_invalid_phone_numbers window by window.
+
+        Args:
+            start_date (string): Start of the range, YYYY-MM-DD.
+            end_date (string): End of the range, YYYY-MM-DD.
+            phone_numbers (integer): Only this phone number.
+            parallel (integer): Offset windows fetched concurrently per date range.
+            date_splits (integer): Sub-ranges of the date range walked concurrently.
+
+        Yields:
+            dict[str, Any]: One invalid phone number record per item, oldest sub-range first.
+        """
+        return self._iter_windows(self.list_invalid_phone_numbers, 'sms', EMAIL_LIST_LIMIT, parallel, date_splits, start_date, end_date, phone_numbers=phone_numbers)
+
+    def iter_content_blocks(self, modified_after: Optional[str] = None, modified_before: Optional[str] = None, parallel: int = 1) -> Iterator[dict[str, Any]]:
+        """
+        Iterates over every Content Block, following list_content_blocks window by window.
+
+        Args:
+            modified_after (string): Only blocks modified after this ISO 8601 time.
+            modified_before (string): Only blocks modified before this ISO 8601 time.
+            parallel (integer): Offset windows fetched concurrently.
+
+        Yields:
+            dict[str, Any]: One Content Block summary per item.
+        """
+        return self._iter_windows(self.list_content_blocks, 'content_blocks', TEMPLATE_LIST_LIMIT, parallel, modified_after=modified_after, modified_before=modified_before)
+
+    def iter_email_templates(self, modified_after: Optional[str] = None, modified_before: Optional[str] = None, parallel: int = 1) -> Iterator[dict[str, Any]]:
+        """
+        Iterates over every email template, following list_email_templates window by window.
+
+        Args:
+            modified_after (string): Only templates modified after this ISO 8601 time.
+            modified_before (string): Only templates modified before this ISO 8601 time.
+            parallel (integer): Offset windows fetched concurrently.
+
+        Yields:
+            dict[str, Any]: One email template summary per item.
+        """
+        return self._iter_windows(self.list_email_templates, 'templates', TEMPLATE_LIST_LIMIT, parallel, modified_after=modified_after, modified_before=modified_before)
+
+    def iter_subscription_user_status(self, external_id: Optional[str] = None, phone: Optional[str] = None, parallel: int = 1) -> Iterator[dict[str, Any]]:
+        """
+        Iterates over every subscription group record of a user, following get_subscription_user_status window by window.
+
+        Args:
+            external_id (string): The user's external ID.
+            phone (string): The user's phone number in E.164 format.
+            parallel (integer): Offset windows fetched concurrently.
+
+        Yields:
+            dict[str, Any]: One subscription group record per item.
+        """
+        return self._iter_windows(self.get_subscription_user_status, 'users', SUBSCRIPTION_LIST_LIMIT, parallel, external_id=external_id, phone=phone)
 
     def list_tools(self):
         return [
@@ -3385,5 +3680,9 @@ class BrazeApp(APIApplication):
             self.create_user_alias_new,
             self.delete_user,
             self.identify_user,
-            self.merge_users_post
+            self.merge_users_post,
+            self.lookup_users,
+            self.get_campaigns_analytics,
+            self.get_canvases_analytics,
+            self.kpi_snapshot
         ]
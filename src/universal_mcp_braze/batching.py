@@ -0,0 +1,145 @@
+import logging
+import threading
+import time
+from collections import deque
+from typing import TYPE_CHECKING, Any, Callable, Deque, Dict, List, Optional, Tuple
+
+if TYPE_CHECKING:
+    from universal_mcp_braze.app import BrazeApp
+
+logger = logging.getLogger(__name__)
+
+TRACK_OBJECT_TYPES = ('attributes', 'events', 'purchases')
+MAX_OBJECTS_PER_TYPE = 75
+
+
+class TrackBatcher:
+    """
+    Buffers individual /users/track objects and sends them as maximally full requests.
+
+    Attributes, events and purchases are queued independently and packed into payloads of
+    up to `max_per_type` objects of each type. A payload is sent as soon as any type has a
+    full request's worth of objects queued, or once the oldest queued object has waited
+    `max_wait` seconds. Sending happens on `workers` background threads, so `add_*` calls
+    only block when `max_buffered` objects are already waiting.
+
+    Example:
+        with TrackBatcher(app) as batcher:
+            batcher.add_event({'external_id': 'user_1', 'name': 'rented_movie', 'time': '2022-12-06T19:20:45+01:00'})
+    """
+
+    def __init__(self, app: 'BrazeApp', max_per_type: int = MAX_OBJECTS_PER_TYPE, max_wait: float = 1.0, max_buffered: int = MAX_OBJECTS_PER_TYPE * 100, workers: int = 1, on_error: Optional[Callable[[Exception, Dict[str, List[dict[str, Any]]]], None]] = None) -> None:
+        if max_per_type < 1:
+            raise ValueError("'max_per_type' must be at least 1.")
+        if workers < 1:
+            raise ValueError("'workers' must be at least 1.")
+        self.app = app
+        self.max_per_type = max_per_type
+        self.max_wait = max_wait
+        self.max_buffered = max_buffered
+        self.on_error = on_error
+        self._queues: Dict[str, Deque[Tuple[float, dict[str, Any]]]] = {kind: deque() for kind in TRACK_OBJECT_TYPES}
+        self._buffered = 0
+        self._closed = False
+        self._condition = threading.Condition()
+        self._workers = [
+            threading.Thread(target=self._run, name=f'braze-track-batcher-{i}', daemon=True)
+            for i in range(workers)
+        ]
+        for worker in self._workers:
+            worker.start()
+
+    def add_attributes(self, attributes: dict[str, Any]) -> None:
+        """Queues one user attributes object."""
+        self._add('attributes', attributes)
+
+    def add_event(self, event: dict[str, Any]) -> None:
+        """Queues one event object."""
+        self._add('events', event)
+
+    def add_purchase(self, purchase: dict[str, Any]) -> None:
+        """Queues one purchase object."""
+        self._add('purchases', purchase)
+
+    def flush(self) -> None:
+        """Sends everything queued so far from the calling thread."""
+        while True:
+            with self._condition:
+                payload = self._take()
+            if not payload:
+                return
+            self._send(payload)
+
+    def close(self) -> None:
+        """Stops accepting objects, sends whatever is still queued and joins the workers."""
+        with self._condition:
+            if self._closed:
+                return
+            self._closed = True
+            self._condition.notify_all()
+        for worker in self._workers:
+            worker.join()
+
+    def __enter__(self) -> 'TrackBatcher':
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def _add(self, kind: str, obj: dict[str, Any]) -> None:
+        if obj is None:
+            raise ValueError("Missing required parameter 'obj'.")
+        with self._condition:
+            while self._buffered >= self.max_buffered and not self._closed:
+                self._condition.wait()
+            if self._closed:
+                raise RuntimeError('TrackBatcher is closed.')
+            queue = self._queues[kind]
+            queue.append((time.monotonic(), obj))
+            self._buffered += 1
+            if len(queue) == 1 or len(queue) >= self.max_per_type:
+                self._condition.notify_all()
+
+    def _deadline(self) -> Optional[float]:
+        oldest = [queue[0][0] for queue in self._queues.values() if queue]
+        if not oldest:
+            return None
+        return min(oldest) + self.max_wait
+
+    def _ready(self) -> bool:
+        if self._buffered == 0:
+            return False
+        if self._closed or any(len(queue) >= self.max_per_type for queue in self._queues.values()):
+            return True
+        return time.monotonic() >= self._deadline()
+
+    def _take(self) -> Dict[str, List[dict[str, Any]]]:
+        payload = {}
+        for kind, queue in self._queues.items():
+            count = min(len(queue), self.max_per_type)
+            if count:
+                payload[kind] = [queue.popleft()[1] for _ in range(count)]
+                self._buffered -= count
+        if payload:
+            self._condition.notify_all()
+        return payload
+
+    def _run(self) -> None:
+        while True:
+            with self._condition:
+                while not self._ready():
+                    if self._closed and self._buffered == 0:
+                        return
+                    deadline = self._deadline()
+                    self._condition.wait(None if deadline is None else max(deadline - time.monotonic(), 0))
+                payload = self._take()
+            self._send(payload)
+
+    def _send(self, payload: Dict[str, List[dict[str, Any]]]) -> None:
+        try:
+            self.app.track_user_activity(**payload)
+        except Exception as exc:
+            if self.on_error is None:
+                logger.exception('Failed to send %d objects to /users/track', sum(len(v) for v in payload.values()))
+            else:
+                self.on_error(exc, payload)
@@ -0,0 +1,194 @@
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from itertools import islice
+from typing import Any, Callable, Dict, Hashable, Iterable, Iterator, List, Optional, Set, Tuple, TypeVar
+
+import httpx
+
+T = TypeVar('T')
+R = TypeVar('R')
+
+_EXHAUSTED = object()
+
+
+@dataclass
+class BulkResult:
+    """
+    Outcome of a bulk operation, keyed by the identifier of each input (item ID, user ID...).
+
+    Attributes:
+        succeeded: Identifiers Braze accepted, in completion order.
+        failed: Identifier to the error that rejected it: Braze's error object when the API
+            named that identifier, otherwise the request-level error body or message.
+        responses: Decoded responses of the successful requests.
+        invalid: Positions in the input of elements that were never sent because they
+            have no identifier.
+    """
+    succeeded: List[Hashable] = field(default_factory=list)
+    failed: Dict[Hashable, Any] = field(default_factory=dict)
+    responses: List[Any] = field(default_factory=list)
+    invalid: List[int] = field(default_factory=list)
+
+    @property
+    def ok(self) -> bool:
+        return not self.failed and not self.invalid
+
+
+@dataclass
+class SendResult:
+    """
+    Outcome of a message fan-out split over several send requests.
+
+    Attributes:
+        dispatch_ids: The dispatch_id Braze returned for each accepted request.
+        sent: Recipients in accepted requests.
+        failures: One entry per rejected request, or per invalid recipient that was never sent,
+            with its 'recipients' and the 'error'.
+    """
+    dispatch_ids: List[str] = field(default_factory=list)
+    sent: int = 0
+    failures: List[Dict[str, Any]] = field(default_factory=list)
+
+    @property
+    def ok(self) -> bool:
+        return not self.failures
+
+    def record(self, recipients: List[Any], response: Any, error: Optional[Exception]) -> None:
+        """Adds the outcome of one send request."""
+        if error is not None:
+            self.failures.append({'recipients': recipients, 'error': error_detail(error)})
+            return
+        self.sent += len(recipients)
+        dispatch_id = (response or {}).get('dispatch_id')
+        if dispatch_id is not None:
+            self.dispatch_ids.append(dispatch_id)
+
+
+def chunked(iterable: Iterable[T], size: int) -> Iterator[List[T]]:
+    """Splits an iterable into lists of at most `size` elements without materializing it."""
+    if size < 1:
+        raise ValueError("'size' must be at least 1.")
+    iterator = iter(iterable)
+    while True:
+        chunk = list(islice(iterator, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def dispatch(send: Callable[[T], R], payloads: Iterable[T], max_workers: int = 4) -> Iterator[Tuple[T, Optional[R], Optional[Exception]]]:
+    """
+    Calls `send` on each payload from a thread pool and yields (payload, result, error) as they finish.
+
+    At most 2 * `max_workers` payloads are drawn from `payloads` ahead of completion, so
+    arbitrarily long generators can be streamed through with bounded memory. Pacing against
+    Braze's quotas is left to the client's rate limiter.
+    """
+    payloads = iter(payloads)
+    with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='braze-bulk') as executor:
+        in_flight: Dict[Future, T] = {}
+
+        def fill() -> None:
+            while len(in_flight) < max_workers * 2:
+                payload = next(payloads, _EXHAUSTED)
+                if payload is _EXHAUSTED:
+                    return
+                in_flight[executor.submit(send, payload)] = payload
+
+        fill()
+        while in_flight:
+            done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+            for future in done:
+                payload = in_flight.pop(future)
+                error = future.exception()
+                yield payload, (None if error is not None else future.result()), error
+            fill()
+
+
+def error_detail(error: Exception) -> Any:
+    """Returns Braze's decoded error body for HTTP errors, or the exception message otherwise."""
+    if isinstance(error, httpx.HTTPStatusError):
+        try:
+            return error.response.json()
+        except ValueError:
+            return error.response.text or str(error)
+    return str(error)
+
+
+def rejected_ids(detail: Any, candidates: Set[Hashable]) -> Dict[Hashable, Any]:
+    """
+    Maps identifiers that Braze named in an error body back to the error that named them.
+
+    Braze lists offending values in `parameter_values` of each entry in `errors`; only
+    values that are among `candidates` are returned.
+    """
+    rejected = {}
+    if not isinstance(detail, dict):
+        return rejected
+    for entry in detail.get('errors') or []:
+        if not isinstance(entry, dict):
+            continue
+        for value in entry.get('parameter_values') or []:
+            if isinstance(value, Hashable) and value in candidates:
+                rejected[value] = entry
+    return rejected
+
+
+def resending(send: Callable[[List[T]], R], key: Callable[[T], Hashable]) -> Callable[[List[T]], List[Tuple[List[T], Optional[R], Optional[Exception]]]]:
+    """
+    Wraps `send` so that a chunk Braze rejected for some named elements is sent once more without them.
+
+    Braze rejects a whole request when any element fails validation. The wrapper runs in the
+    dispatch worker, so the second request never stalls the caller, and returns the
+    (elements, response, error) outcome of every request it made, for `record_chunk`.
+    """
+    def send_chunk(chunk: List[T]) -> List[Tuple[List[T], Optional[R], Optional[Exception]]]:
+        try:
+            return [(chunk, send(chunk), None)]
+        except Exception as exc:
+            error = exc
+        rejected = rejected_ids(error_detail(error), {key(element) for element in chunk})
+        named = [element for element in chunk if key(element) in rejected]
+        remaining = [element for element in chunk if key(element) not in rejected]
+        if not named or not remaining:
+            return [(chunk, None, error)]
+        try:
+            return [(named, None, error), (remaining, send(remaining), None)]
+        except Exception as exc:
+            return [(named, None, error), (remaining, None, exc)]
+
+    return send_chunk
+
+
+def record_chunk(result: BulkResult, chunk: List[T], response: Any, error: Optional[Exception], key: Callable[[T], Hashable]) -> None:
+    """
+    Adds the outcome of one request to `result`.
+
+    On error, elements the error body names get Braze's error object for them and the rest
+    of the chunk gets the request-level error.
+    """
+    ids = [key(element) for element in chunk]
+    if error is None:
+        result.succeeded.extend(ids)
+        result.responses.append(response)
+        return
+    detail = error_detail(error)
+    rejected = rejected_ids(detail, set(ids))
+    for element_id in ids:
+        result.failed[element_id] = rejected.get(element_id, detail)
+
+
+def hoist_properties(properties: List[Optional[Dict[str, Any]]], shared: Optional[Dict[str, Any]] = None) -> Tuple[Dict[str, Any], List[Dict[str, Any]]]:
+    """
+    Splits per-recipient properties into one top-level object and what remains per recipient.
+
+    Properties every recipient has with the same value join `shared` at the top level, and
+    are dropped from the recipients along with any copies of shared values. Braze merges the
+    top-level object into each recipient's, with recipient values taking precedence, so the
+    properties each user receives are unchanged.
+    """
+    present = [item or {} for item in properties]
+    top = dict(shared or {})
+    if present:
+        top.update({key: value for key, value in present[0].items() if all(key in item and item[key] == value for item in present[1:])})
+    return top, [{key: value for key, value in item.items() if key not in top or top[key] != value} for item in present]
@@ -0,0 +1,192 @@
+import hashlib
+import re
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from datetime import datetime, timedelta, timezone
+from typing import Any, Optional, Tuple
+from urllib.parse import urlencode
+
+import httpx
+
+# Analytics endpoints whose response depends only on the query, so a window that closed
+# long enough ago always returns the same body.
+SERIES_PATHS = frozenset({
+    '/campaigns/data_series',
+    '/canvas/data_series',
+    '/canvas/data_summary',
+    '/events/data_series',
+    '/feed/data_series',
+    '/kpi/dau/data_series',
+    '/kpi/mau/data_series',
+    '/kpi/new_users/data_series',
+    '/kpi/uninstalls/data_series',
+    '/purchases/quantity_series',
+    '/purchases/revenue_series',
+    '/segments/data_series',
+    '/sends/data_series',
+    '/sessions/data_series',
+})
+
+_SHORT_OFFSET = re.compile(r'([+-])(\d)(:\d\d)$')
+
+_SCHEMA = '''
+CREATE TABLE IF NOT EXISTS series_cache (
+    key TEXT PRIMARY KEY,
+    expires_at REAL,
+    body BLOB NOT NULL
+) WITHOUT ROWID
+'''
+
+
+class MemoryCache:
+    """An in-process LRU cache backend holding at most `max_entries` response bodies."""
+
+    def __init__(self, max_entries: int = 1024) -> None:
+        self.max_entries = max_entries
+        self._entries: 'OrderedDict[str, Tuple[Optional[float], bytes]]' = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[bytes]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, body = entry
+            if expires_at is not None and expires_at <= time.time():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return body
+
+    def set(self, key: str, body: bytes, ttl: Optional[float]) -> None:
+        with self._lock:
+            self._entries[key] = (None if ttl is None else time.time() + ttl, body)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+class SQLiteCache:
+    """An on-disk cache backend that survives restarts and can be shared by several processes."""
+
+    def __init__(self, path: str) -> None:
+        self.db = sqlite3.connect(path, check_same_thread=False)
+        self.db.execute(_SCHEMA)
+        self.db.commit()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[bytes]:
+        with self._lock:
+            row = self.db.execute('SELECT expires_at, body FROM series_cache WHERE key = ?', (key,)).fetchone()
+        if row is None or (row[0] is not None and row[0] <= time.time()):
+            return None
+        return row[1]
+
+    def set(self, key: str, body: bytes, ttl: Optional[float]) -> None:
+        with self._lock, self.db:
+            self.db.execute(
+                'INSERT OR REPLACE INTO series_cache (key, expires_at, body) VALUES (?, ?, ?)',
+                (key, None if ttl is None else time.time() + ttl, body),
+            )
+
+    def clear(self) -> None:
+        with self._lock, self.db:
+            self.db.execute('DELETE FROM series_cache')
+
+    def close(self) -> None:
+        self.db.close()
+
+
+def parse_ending_at(value: Any) -> Optional[datetime]:
+    """
+    Parses an `ending_at` parameter into an aware UTC datetime, or None if it cannot be read.
+
+    Braze's examples use offsets such as '-5:00', which are padded before parsing; values
+    without an offset are taken as UTC.
+    """
+    if not isinstance(value, str):
+        return None
+    try:
+        parsed = datetime.fromisoformat(_SHORT_OFFSET.sub(r'\g<1>0\2\3', value.strip()))
+    except ValueError:
+        return None
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed.astimezone(timezone.utc)
+
+
+def credential_namespace(headers: Any) -> str:
+    """A short digest of the Authorization header, so workspaces sharing a cache never see each other's entries."""
+    authorization = headers.get('Authorization') or ''
+    return hashlib.blake2b(authorization.encode('utf-8'), digest_size=16).hexdigest()
+
+
+def _normalize(value: Any) -> str:
+    if isinstance(value, bool):
+        return 'true' if value else 'false'
+    return str(value)
+
+
+class SeriesCache:
+    """
+    Caches the responses of Braze's analytics data series endpoints.
+
+    A series whose `ending_at` lies more than `settle_period` in the past describes a closed
+    window that Braze will not revise, so it is stored without expiry. Series ending later,
+    or at the time of the request (no `ending_at`), are stored for `recent_ttl` seconds.
+    Keys are the namespace (a digest of the API key, see `credential_namespace`), the
+    REST host, the endpoint path and its parameters, sorted and with `ending_at`
+    converted to UTC, so equivalent requests share an entry and workspaces sharing a
+    backend never do.
+
+    Args:
+        backend: Where bodies are kept; a MemoryCache by default, or a SQLiteCache.
+        recent_ttl: Seconds to keep series that may still change.
+        settle_period: How long after `ending_at` Braze's figures are considered final.
+    """
+
+    def __init__(self, backend: Any = None, recent_ttl: float = 300.0, settle_period: timedelta = timedelta(days=2)) -> None:
+        self.backend = backend if backend is not None else MemoryCache()
+        self.recent_ttl = recent_ttl
+        self.settle_period = settle_period
+
+    def key(self, url: str, params: Optional[dict[str, Any]], namespace: str = '') -> Optional[str]:
+        """The cache key of a GET request, or None if its endpoint is not cached."""
+        parsed = httpx.URL(url)
+        path = parsed.path
+        if path not in SERIES_PATHS:
+            return None
+        normalized = {}
+        for name, value in (params or {}).items():
+            if value is None:
+                continue
+            ending_at = parse_ending_at(value) if name == 'ending_at' else None
+            normalized[name] = ending_at.isoformat() if ending_at is not None else _normalize(value)
+        return f'{namespace}|{parsed.scheme}://{parsed.host}{path}?{urlencode(sorted(normalized.items()))}'
+
+    def ttl(self, params: Optional[dict[str, Any]]) -> Optional[float]:
+        """Seconds to keep a response for these parameters; None means for good."""
+        ending_at = parse_ending_at((params or {}).get('ending_at'))
+        if ending_at is not None and ending_at + self.settle_period <= datetime.now(timezone.utc):
+            return None
+        return self.recent_ttl
+
+    def lookup(self, url: str, params: Optional[dict[str, Any]], namespace: str = '') -> Optional[httpx.Response]:
+        """Returns the cached response for a GET request, rebuilt as an httpx.Response, if any."""
+        key = self.key(url, params, namespace)
+        body = self.backend.get(key) if key is not None else None
+        if body is None:
+            return None
+        return httpx.Response(200, content=body, headers={'Content-Type': 'application/json'}, request=httpx.Request('GET', url, params=params))
+
+    def store(self, url: str, params: Optional[dict[str, Any]], response: httpx.Response, namespace: str = '') -> None:
+        """Keeps a successful response to a cached endpoint."""
+        key = self.key(url, params, namespace)
+        if key is not None and response.status_code == 200:
+            self.backend.set(key, response.content, self.ttl(params))
@@ -0,0 +1,204 @@
+import hashlib
+import json
+import sqlite3
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+from universal_mcp_braze.bulk import BulkResult, chunked
+
+if TYPE_CHECKING:
+    from universal_mcp_braze.app import BrazeApp
+
+_SCHEMA = '''
+CREATE TABLE IF NOT EXISTS catalog_items (
+    catalog_name TEXT NOT NULL,
+    item_id TEXT NOT NULL,
+    content_hash BLOB NOT NULL,
+    PRIMARY KEY (catalog_name, item_id)
+) WITHOUT ROWID
+'''
+
+# IDs of the feed items read so far in the current pass; private to the connection.
+_SEEN_SCHEMA = 'CREATE TEMP TABLE IF NOT EXISTS seen_items (item_id TEXT PRIMARY KEY) WITHOUT ROWID'
+
+# Feed items compared per batched index lookup, below SQLite's default limit of 999 bound
+# parameters per statement.
+LOOKUP_CHUNK_SIZE = 500
+
+
+def content_hash(item: dict[str, Any], fields: Optional[Sequence[str]] = None) -> bytes:
+    """A 128-bit digest of an item's canonical JSON form, independent of key order; only 'id' and `fields` when given."""
+    if fields is not None:
+        item = {name: item[name] for name in ('id', *fields) if name in item}
+    canonical = json.dumps(item, sort_keys=True, separators=(',', ':'), ensure_ascii=False, default=str)
+    return hashlib.blake2b(canonical.encode('utf-8'), digest_size=16).digest()
+
+
+@dataclass
+class CatalogDiff:
+    """Items to create and update, and IDs to delete, so Braze matches a source feed."""
+    created: List[dict[str, Any]] = field(default_factory=list)
+    updated: List[dict[str, Any]] = field(default_factory=list)
+    deleted: List[str] = field(default_factory=list)
+    unchanged: int = 0
+
+
+@dataclass
+class CatalogSyncResult:
+    created: BulkResult = field(default_factory=BulkResult)
+    updated: BulkResult = field(default_factory=BulkResult)
+    deleted: BulkResult = field(default_factory=BulkResult)
+
+    @property
+    def ok(self) -> bool:
+        return self.created.ok and self.updated.ok and self.deleted.ok
+
+
+class CatalogMirror:
+    """
+    A local item_id -> content hash index of one Braze catalog, kept in SQLite.
+
+    `hydrate` fills the index from the catalog itself; after that, `sync` compares a full
+    source feed against the index and only sends the items that were added, changed or
+    (optionally) removed. The feed is streamed in chunks of LOOKUP_CHUNK_SIZE items, each
+    checked with one index query and written before the next is read. The index is updated
+    for every write Braze accepts, so an interrupted sync can simply be run again.
+
+    Braze may return items in a different form than they were written (added or coerced
+    fields), in which case hashes taken by `hydrate` never match the source and the first
+    sync rewrites those items. Pass `fields` to hash only the fields the source feed
+    controls.
+
+    Args:
+        app: The client used for reads and writes.
+        catalog_name: The catalog being mirrored.
+        path: SQLite database file; several catalogs can share one file.
+        fields: Item fields compared besides 'id'; all fields when None.
+    """
+
+    def __init__(self, app: 'BrazeApp', catalog_name: str, path: str = ':memory:', fields: Optional[Sequence[str]] = None) -> None:
+        if catalog_name is None:
+            raise ValueError("Missing required parameter 'catalog_name'.")
+        self.app = app
+        self.catalog_name = catalog_name
+        self.fields = list(fields) if fields is not None else None
+        self.db = sqlite3.connect(path)
+        self.db.execute(_SCHEMA)
+        self.db.execute(_SEEN_SCHEMA)
+        self.db.commit()
+
+    def __len__(self) -> int:
+        return self.db.execute('SELECT COUNT(*) FROM catalog_items WHERE catalog_name = ?', (self.catalog_name,)).fetchone()[0]
+
+    def close(self) -> None:
+        self.db.close()
+
+    def hydrate(self) -> int:
+        """Replaces the index with the hashes of every item currently in the catalog and returns the count."""
+        with self.db:
+            self.db.execute('DELETE FROM catalog_items WHERE catalog_name = ?', (self.catalog_name,))
+            for chunk in chunked(self.app.iter_catalog_items(self.catalog_name), 1000):
+                self._store(chunk)
+        return len(self)
+
+    def diff(self, items: Iterable[dict[str, Any]]) -> CatalogDiff:
+        """Compares a complete source feed with the index."""
+        result = CatalogDiff()
+        for created, updated, unchanged in self._changes(items):
+            result.created.extend(created)
+            result.updated.extend(updated)
+            result.unchanged += unchanged
+        result.deleted = list(self._missing_ids())
+        return result
+
+    def sync(self, items: Iterable[dict[str, Any]], delete_missing: bool = False, max_workers: int = 4) -> CatalogSyncResult:
+        """
+        Makes the catalog match a complete source feed with the fewest writes.
+
+        Args:
+            items: Every item the catalog should contain, each with an 'id'.
+            delete_missing: Also delete catalog items that are absent from `items`.
+            max_workers: Requests in flight at once.
+
+        Returns:
+            CatalogSyncResult: Per-item outcomes of the creates, updates and deletes.
+
+        Raises:
+            ValueError: Raised when an item has no 'id'; chunks before it have been synced.
+        """
+        result = CatalogSyncResult()
+        for created, updated, _ in self._changes(items):
+            if created:
+                written = self.app.upsert_catalog_items(self.catalog_name, created, mode='create', max_workers=max_workers)
+                self._commit_writes(created, written)
+                _merge(result.created, written)
+            if updated:
+                written = self.app.upsert_catalog_items(self.catalog_name, updated, mode='update', max_workers=max_workers)
+                self._commit_writes(updated, written)
+                _merge(result.updated, written)
+        if delete_missing:
+            missing = list(self._missing_ids())
+            if missing:
+                result.deleted = self.app.delete_catalog_items(self.catalog_name, missing, max_workers=max_workers)
+                with self.db:
+                    self.db.executemany('DELETE FROM catalog_items WHERE catalog_name = ? AND item_id = ?', [(self.catalog_name, item_id) for item_id in result.deleted.succeeded])
+        return result
+
+    def _changes(self, items: Iterable[dict[str, Any]]) -> Iterator[Tuple[List[dict[str, Any]], List[dict[str, Any]], int]]:
+        """Yields the created and updated items and the unchanged count of each chunk of the feed, recording the IDs seen."""
+        with self.db:
+            self.db.execute('DELETE FROM seen_items')
+        for chunk in chunked(items, LOOKUP_CHUNK_SIZE):
+            item_ids = []
+            for item in chunk:
+                item_id = item.get('id') if isinstance(item, dict) else None
+                if item_id is None:
+                    raise ValueError("Catalog items must have an 'id'.")
+                item_ids.append(item_id)
+            with self.db:
+                self.db.executemany('INSERT OR IGNORE INTO seen_items (item_id) VALUES (?)', ((item_id,) for item_id in item_ids))
+            stored = self._stored_hashes(item_ids)
+            created, updated, unchanged = [], [], 0
+            for item, item_id in zip(chunk, item_ids):
+                stored_hash = stored.get(str(item_id))
+                if stored_hash is None:
+                    created.append(item)
+                elif stored_hash != content_hash(item, self.fields):
+                    updated.append(item)
+                else:
+                    unchanged += 1
+            yield created, updated, unchanged
+
+    def _commit_writes(self, items: List[dict[str, Any]], result: BulkResult) -> None:
+        accepted = set(result.succeeded)
+        with self.db:
+            self._store(item for item in items if item['id'] in accepted)
+
+    def _store(self, items: Iterable[dict[str, Any]]) -> None:
+        self.db.executemany(
+            'INSERT OR REPLACE INTO catalog_items (catalog_name, item_id, content_hash) VALUES (?, ?, ?)',
+            ((self.catalog_name, item['id'], content_hash(item, self.fields)) for item in items),
+        )
+
+    def _stored_hashes(self, item_ids: List[Any]) -> Dict[str, bytes]:
+        placeholders = ', '.join('?' * len(item_ids))
+        rows: Iterable[Tuple[str, bytes]] = self.db.execute(
+            f'SELECT item_id, content_hash FROM catalog_items WHERE catalog_name = ? AND item_id IN ({placeholders})',
+            (self.catalog_name, *item_ids),
+        )
+        return dict(rows)
+
+    def _missing_ids(self) -> Iterator[str]:
+        """IDs in the index that the last pass over a feed did not see."""
+        rows: Iterable[Tuple[str]] = self.db.execute(
+            'SELECT item_id FROM catalog_items WHERE catalog_name = ? AND item_id NOT IN (SELECT item_id FROM seen_items)',
+            (self.catalog_name,),
+        )
+        return (row[0] for row in rows)
+
+
+def _merge(into: BulkResult, result: BulkResult) -> None:
+    into.succeeded.extend(result.succeeded)
+    into.failed.update(result.failed)
+    into.responses.extend(result.responses)
+    into.invalid.extend(result.invalid)
@@ -0,0 +1,78 @@
+import asyncio
+import threading
+from concurrent.futures import Future
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional, Tuple, TypeVar
+
+import httpx
+
+T = TypeVar('T')
+
+
+def request_key(url: str, params: Optional[dict[str, Any]]) -> Tuple[str, str]:
+    """
+    Identifies a GET request by its URL and its parameters, ignoring parameter order and None values.
+
+    Parameters are encoded the way httpx sends them, so values that httpx sends differently
+    (True and 'True', a list and its repr) never share a key.
+    """
+    params = params or {}
+    return url, str(httpx.QueryParams({name: params[name] for name in sorted(params) if params[name] is not None}))
+
+
+class SingleFlight:
+    """
+    Lets concurrent identical calls share one execution.
+
+    The first caller for a key runs the function; callers arriving while it is in flight
+    wait for it and receive the same result or exception. Once it finishes the key is
+    released, so later calls run afresh.
+    """
+
+    def __init__(self) -> None:
+        self._calls: Dict[Hashable, Future] = {}
+        self._lock = threading.Lock()
+
+    def do(self, key: Hashable, function: Callable[[], T]) -> T:
+        with self._lock:
+            future = self._calls.get(key)
+            leader = future is None
+            if leader:
+                future = self._calls[key] = Future()
+        if not leader:
+            return future.result()
+        try:
+            result = function()
+        except BaseException as exc:
+            future.set_exception(exc)
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            with self._lock:
+                del self._calls[key]
+
+
+class AsyncSingleFlight:
+    """
+    The asyncio counterpart of SingleFlight: concurrent identical calls await one task.
+
+    Each caller awaits the shared task through `asyncio.shield`, so a caller being
+    cancelled does not cancel the request for the others.
+    """
+
+    def __init__(self) -> None:
+        self._tasks: Dict[Hashable, asyncio.Future] = {}
+
+    async def do(self, key: Hashable, function: Callable[[], Awaitable[T]]) -> T:
+        task = self._tasks.get(key)
+        if task is None:
+            task = asyncio.ensure_future(function())
+            self._tasks[key] = task
+
+            def release(done: asyncio.Future) -> None:
+                if self._tasks.get(key) is done:
+                    del self._tasks[key]
+
+            task.add_done_callback(release)
+        return await asyncio.shield(task)
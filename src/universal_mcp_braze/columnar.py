@@ -0,0 +1,223 @@
+import json
+import os
+import zipfile
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from datetime import date, datetime, timezone
+from typing import Any, Deque, Dict, Iterator, List, Optional, Union
+
+from universal_mcp_braze.export import archive_members, iter_member_records
+
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    import pyarrow.parquet as pq
+except ImportError:  # pragma: no cover - optional dependency
+    pa = None
+    pc = None
+    pq = None
+
+# Column kinds of the profile fields Braze can export. Nested fields (lists and objects)
+# are stored as compact JSON text so that every column keeps a flat, fixed type.
+FIELD_KINDS: Dict[str, str] = {
+    'apps': 'json',
+    'attributed_ad': 'string',
+    'attributed_adgroup': 'string',
+    'attributed_campaign': 'string',
+    'attributed_source': 'string',
+    'braze_id': 'string',
+    'campaigns_received': 'json',
+    'canvases_received': 'json',
+    'cards_clicked': 'json',
+    'country': 'string',
+    'created_at': 'timestamp',
+    'custom_attributes': 'json',
+    'custom_events': 'json',
+    'devices': 'json',
+    'dob': 'date',
+    'email': 'string',
+    'email_opted_in_at': 'timestamp',
+    'email_subscribe': 'string',
+    'email_unsubscribed_at': 'timestamp',
+    'external_id': 'string',
+    'first_name': 'string',
+    'gender': 'string',
+    'home_city': 'string',
+    'language': 'string',
+    'last_coordinates': 'json',
+    'last_name': 'string',
+    'phone': 'string',
+    'purchases': 'json',
+    'push_opted_in_at': 'timestamp',
+    'push_subscribe': 'string',
+    'push_tokens': 'json',
+    'push_unsubscribed_at': 'timestamp',
+    'random_bucket': 'int64',
+    'time_zone': 'string',
+    'total_revenue': 'float64',
+    'uninstalled_at': 'timestamp',
+    'user_aliases': 'json',
+}
+
+
+def _require_pyarrow() -> None:
+    if pa is None:
+        raise ImportError("Columnar exports require pyarrow; install the 'columnar' extra.")
+
+
+def _arrow_type(kind: str) -> Any:
+    return {
+        'string': pa.string(),
+        'json': pa.string(),
+        'int64': pa.int64(),
+        'float64': pa.float64(),
+        'date': pa.date32(),
+        'timestamp': pa.timestamp('ms', tz='UTC'),
+    }[kind]
+
+
+def export_schema(fields_to_export: Optional[List[str]] = None) -> 'pa.Schema':
+    """
+    The Arrow schema of an export made with `fields_to_export` (every known field when None).
+
+    Fields this module does not know are kept as JSON text.
+    """
+    _require_pyarrow()
+    fields = list(fields_to_export) if fields_to_export else list(FIELD_KINDS)
+    return pa.schema([(name, _arrow_type(FIELD_KINDS.get(name, 'json'))) for name in fields])
+
+
+def _parse_temporal(value: Any, kind: str) -> Optional[Union[date, datetime]]:
+    if not isinstance(value, str):
+        return None
+    text = value.strip()
+    if text.endswith(' UTC'):
+        text = text[:-4] + '+00:00'
+    try:
+        parsed = datetime.fromisoformat(text)
+    except ValueError:
+        return None
+    if kind == 'date':
+        return parsed.date()
+    return parsed if parsed.tzinfo is not None else parsed.replace(tzinfo=timezone.utc)
+
+
+def _temporal_array(column: List[Any], kind: str) -> 'pa.Array':
+    """
+    Parses a column of date or time text, with null for values that cannot be read.
+
+    Braze writes ISO 8601 text, or times such as '2020-07-10 15:00:00.000 UTC'; after
+    rewriting that suffix Arrow parses the column in bulk, at microsecond precision so
+    finer values are truncated rather than rejected. A column with any other form falls
+    back to parsing value by value.
+    """
+    target = _arrow_type(kind)
+    text = pc.replace_substring_regex(pa.array(column, pa.string()), ' UTC$', 'Z')
+    try:
+        if kind == 'date':
+            return text.cast(target)
+        return text.cast(pa.timestamp('us', tz='UTC')).cast(target, safe=False)
+    except (pa.ArrowInvalid, pa.ArrowNotImplementedError):
+        return pa.array([_parse_temporal(value, kind) for value in column], target)
+
+
+def _parse_part(path: str, name: str, fields: List[str]) -> 'pa.Table':
+    """Parses one part file into a table; runs in a worker process."""
+    kinds = [FIELD_KINDS.get(field, 'json') for field in fields]
+    columns: List[List[Any]] = [[] for _ in fields]
+    with zipfile.ZipFile(path) as archive:
+        for record in iter_member_records(archive, name):
+            for field, kind, column in zip(fields, kinds, columns):
+                value = record.get(field)
+                if kind == 'json' and value is not None:
+                    value = json.dumps(value, separators=(',', ':'), ensure_ascii=False)
+                column.append(value)
+    arrays = []
+    for kind, column in zip(kinds, columns):
+        if kind in ('date', 'timestamp'):
+            arrays.append(_temporal_array(column, kind))
+        else:
+            arrays.append(pa.array(column, _arrow_type(kind)))
+    return pa.Table.from_arrays(arrays, schema=export_schema(fields))
+
+
+def iter_part_tables(path: str, fields_to_export: Optional[List[str]] = None, max_workers: Optional[int] = None) -> Iterator['pa.Table']:
+    """
+    Parses the part files of an export archive on a process pool and yields one table per part.
+
+    Tables are yielded in archive order. At most 2 * `max_workers` parts are parsed ahead of
+    the consumer, so peak memory is bounded by a few part files rather than the archive.
+
+    Args:
+        path: A downloaded export archive.
+        fields_to_export: The fields the export was made with; they become the columns.
+        max_workers: Worker processes; defaults to the number of CPUs.
+    """
+    _require_pyarrow()
+    fields = list(export_schema(fields_to_export).names)
+    names = archive_members(path)
+    max_workers = max_workers or os.cpu_count() or 1
+    if max_workers == 1 or len(names) <= 1:
+        for name in names:
+            yield _parse_part(path, name, fields)
+        return
+
+    with ProcessPoolExecutor(max_workers=min(max_workers, len(names))) as executor:
+        remaining = iter(names)
+        pending: Deque[Future] = deque()
+        try:
+            for name in remaining:
+                pending.append(executor.submit(_parse_part, path, name, fields))
+                if len(pending) >= max_workers * 2:
+                    break
+            while pending:
+                table = pending.popleft().result()
+                name = next(remaining, None)
+                if name is not None:
+                    pending.append(executor.submit(_parse_part, path, name, fields))
+                yield table
+        finally:
+            for future in pending:
+                future.cancel()
+
+
+def archive_to_table(path: str, fields_to_export: Optional[List[str]] = None, max_workers: Optional[int] = None) -> 'pa.Table':
+    """Parses a whole export archive into one Arrow table with the schema of `fields_to_export`."""
+    tables = list(iter_part_tables(path, fields_to_export, max_workers))
+    if not tables:
+        return export_schema(fields_to_export).empty_table()
+    return pa.concat_tables(tables)
+
+
+def archive_to_parquet(path: str, destination: str, fields_to_export: Optional[List[str]] = None, max_workers: Optional[int] = None, compression: str = 'zstd') -> int:
+    """
+    Converts an export archive into a Parquet file, writing one row group per part file.
+
+    Args:
+        path: A downloaded export archive.
+        destination: The Parquet file to write.
+        fields_to_export: The fields the export was made with; they become the columns.
+        max_workers: Worker processes; defaults to the number of CPUs.
+        compression: Parquet compression codec.
+
+    Returns:
+        int: The number of rows written.
+    """
+    schema = export_schema(fields_to_export)
+    rows = 0
+    with pq.ParquetWriter(destination, schema, compression=compression) as writer:
+        for table in iter_part_tables(path, fields_to_export, max_workers):
+            writer.write_table(table)
+            rows += table.num_rows
+    return rows
+
+
+def archive_to_numpy(path: str, fields_to_export: Optional[List[str]] = None, max_workers: Optional[int] = None) -> Dict[str, Any]:
+    """
+    Parses an export archive into NumPy arrays keyed by field.
+
+    Numeric columns with missing values become float arrays with NaN, timestamps become
+    datetime64 arrays with NaT, and text and JSON columns become object arrays.
+    """
+    table = archive_to_table(path, fields_to_export, max_workers)
+    return {name: table.column(name).to_numpy() for name in table.column_names}
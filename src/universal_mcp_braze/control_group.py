@@ -0,0 +1,133 @@
+import bisect
+import hashlib
+import mmap
+import os
+import struct
+import sys
+from array import array
+from typing import Any, Iterable, Iterator, List, Optional
+
+# Bumped whenever the key encoding changes, so stale indexes are rejected rather than misread.
+_MAGIC = b'BRZCGI02'
+_HEADER = struct.Struct('<8sQ')
+
+
+def alias_key(alias_label: Any, alias_name: Any) -> str:
+    """
+    A string identifying a user alias.
+
+    The label is length-prefixed so that labels and names containing ':' cannot combine
+    into the same key.
+    """
+    label = str(alias_label)
+    return f"{len(label)}:{label}:{alias_name}"
+
+
+def member_keys(member: dict[str, Any]) -> Iterator[str]:
+    """The identifiers a control group member can be looked up by, each tagged with its kind."""
+    if member.get('external_id') is not None:
+        yield f"external_id:{member['external_id']}"
+    if member.get('braze_id') is not None:
+        yield f"braze_id:{member['braze_id']}"
+    for alias in member.get('user_aliases') or []:
+        if isinstance(alias, dict) and alias.get('alias_label') is not None and alias.get('alias_name') is not None:
+            yield f"user_alias:{alias_key(alias['alias_label'], alias['alias_name'])}"
+
+
+def key_hash(key: str) -> int:
+    """A 64-bit digest of an identifier key; collisions among a few million members are negligible."""
+    return int.from_bytes(hashlib.blake2b(key.encode('utf-8'), digest_size=8).digest(), 'little')
+
+
+class ControlGroupIndex:
+    """
+    A persisted, memory-mapped index of Global Control Group membership.
+
+    The file holds a small header followed by the sorted 64-bit hashes of every member's
+    external ID, Braze ID and aliases. Opening it maps the file instead of reading it, so
+    loading is constant time, and each lookup is a binary search over the mapped hashes
+    with no network call. A false positive needs a 64-bit hash collision.
+
+    Use `build` to write an index from an export and `open` to load one.
+    """
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        with open(path, 'rb') as file:
+            self._mmap = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) if os.fstat(file.fileno()).st_size else None
+        if self._mmap is None or len(self._mmap) < _HEADER.size:
+            self.close()
+            raise ValueError(f'{path} is not a control group index.')
+        magic, count = _HEADER.unpack_from(self._mmap)
+        if magic != _MAGIC or len(self._mmap) != _HEADER.size + count * 8:
+            self.close()
+            raise ValueError(f'{path} is not a control group index.')
+        self._view = memoryview(self._mmap)[_HEADER.size:]
+        if sys.byteorder == 'little':
+            self._hashes = self._view.cast('Q')
+        else:  # pragma: no cover - hashes are stored little-endian
+            self._hashes = array('Q', self._view.tobytes())
+            self._hashes.byteswap()
+
+    @classmethod
+    def open(cls, path: str) -> 'ControlGroupIndex':
+        return cls(path)
+
+    @classmethod
+    def build(cls, members: Iterable[dict[str, Any]], path: str) -> 'ControlGroupIndex':
+        """
+        Writes an index of `members` (records of a Global Control Group export) to `path` and opens it.
+
+        The file is written next to `path` and moved into place, so readers never see a
+        partial index.
+        """
+        hashes = array('Q', sorted({key_hash(key) for member in members for key in member_keys(member)}))
+        if sys.byteorder != 'little':  # pragma: no cover
+            hashes.byteswap()
+        temporary = f'{path}.tmp'
+        with open(temporary, 'wb') as file:
+            file.write(_HEADER.pack(_MAGIC, len(hashes)))
+            hashes.tofile(file)
+        os.replace(temporary, path)
+        return cls(path)
+
+    def __len__(self) -> int:
+        """The number of indexed identifiers (a member with an alias counts more than once)."""
+        return len(self._hashes)
+
+    def _contains_key(self, key: str) -> bool:
+        target = key_hash(key)
+        position = bisect.bisect_left(self._hashes, target)
+        return position < len(self._hashes) and self._hashes[position] == target
+
+    def contains(self, external_id: Optional[str] = None, braze_id: Optional[str] = None, user_alias: Optional[dict[str, str]] = None) -> bool:
+        """Whether the user identified by any of the given identifiers is in the control group."""
+        if external_id is None and braze_id is None and user_alias is None:
+            raise ValueError('Pass an external_id, braze_id or user_alias.')
+        return any(self._contains_key(key) for key in member_keys({
+            'external_id': external_id,
+            'braze_id': braze_id,
+            'user_aliases': [user_alias] if user_alias else [],
+        }))
+
+    def __contains__(self, external_id: object) -> bool:
+        return isinstance(external_id, str) and self._contains_key(f'external_id:{external_id}')
+
+    def exclude(self, external_ids: Iterable[str]) -> List[str]:
+        """Drops the control group members from a list of external IDs, keeping the order."""
+        return [external_id for external_id in external_ids if external_id not in self]
+
+    def close(self) -> None:
+        for view in (getattr(self, '_hashes', None), getattr(self, '_view', None)):
+            if isinstance(view, memoryview):
+                view.release()
+        self._hashes = array('Q')
+        if self._mmap is not None:
+            self._mmap.close()
+            self._mmap = None
+
+    def __enter__(self) -> 'ControlGroupIndex':
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
@@ -0,0 +1,54 @@
+import json
+import re
+from typing import Any, Callable
+
+import httpx
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
+
+JsonLoads = Callable[[bytes], Any]
+
+# orjson parses straight from bytes and is several times faster on large catalog and
+# data-series bodies; the stdlib parser is the fallback when it is not installed.
+default_json_loads: JsonLoads = orjson.loads if orjson is not None else json.loads
+
+# Write endpoints whose successful response is only a status message. Every other write
+# (sends, schedules, exports, template and content block creation, SCIM...) returns IDs
+# or results such as dispatch_id and schedule_id, so its body is always decoded.
+_ACKNOWLEDGEMENT_PATHS = re.compile(
+    r'/users/(track|identify|merge|alias/new|alias/update)'
+    r'|/email/(status|bounce/remove|spam/remove|blocklist|blacklist)'
+    r'|/sms/invalid_phone_numbers/remove'
+    r'|(/v2)?/subscription/status/set'
+    r'|/catalogs/[^/]+(/items(/[^/]+)?)?'
+    r'|/messages/live_activity/update'
+    r'|/(messages|campaigns/trigger|canvas/trigger)/schedule/(update|delete)'
+)
+
+
+def is_write(response: httpx.Response) -> bool:
+    """Whether the response acknowledges a write, i.e. its body is only a status message."""
+    request = response.request
+    return request.method != 'GET' and _ACKNOWLEDGEMENT_PATHS.fullmatch(request.url.path) is not None
+
+
+def decode_response(response: httpx.Response, json_loads: JsonLoads = default_json_loads, skip_body: bool = False) -> Any:
+    """
+    Raises for error statuses and parses the JSON body straight from the raw bytes.
+
+    Returns None for 204s, empty or whitespace-only bodies, bodies that are not JSON, and
+    when `skip_body` is set.
+    """
+    response.raise_for_status()
+    if skip_body or response.status_code == 204:
+        return None
+    content = response.content
+    if not content or content.isspace():
+        return None
+    try:
+        return json_loads(content)
+    except ValueError:
+        return None
@@ -0,0 +1,262 @@
+import gzip
+import io
+import ipaddress
+import json
+import os
+import secrets
+import shutil
+import tempfile
+import threading
+import time
+import zipfile
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable, Iterator, List, Optional
+
+import httpx
+
+DOWNLOAD_CHUNK_SIZE = 1 << 20
+
+
+def _is_loopback(host: str) -> bool:
+    if host == 'localhost':
+        return True
+    try:
+        return ipaddress.ip_address(host).is_loopback
+    except ValueError:
+        return False
+
+
+class CallbackReceiver:
+    """
+    A minimal local HTTP server that receives Braze's export-finished callback.
+
+    Braze POSTs `{"success": ..., "url": ..., "time": ...}` to the `callback_endpoint` given
+    when an export is started. The server listens on loopback by default; to let Braze
+    reach it, listen on another interface and pass the externally visible origin (such as
+    a tunnel) as `public_url`. Every export gets a fresh random token in the callback
+    path, and requests without the current token are rejected.
+
+    Args:
+        host: Interface to listen on. Interfaces other than loopback require `public_url`.
+        port: Port to listen on; 0 picks a free one.
+        path: Path prefix the callback is expected on.
+        public_url: Origin handed to Braze instead of the local address, e.g.
+            'https://hooks.example.com'; the callback path is appended to it.
+    """
+
+    def __init__(self, host: str = '127.0.0.1', port: int = 0, path: str = '/braze/export-callback', public_url: Optional[str] = None) -> None:
+        if public_url is None and not _is_loopback(host):
+            raise ValueError("Listening on a non-loopback interface requires 'public_url', the address Braze should call.")
+        self.path = path.rstrip('/')
+        self.public_url = public_url
+        self.payload: Optional[dict[str, Any]] = None
+        self._received = threading.Event()
+        self._token = secrets.token_urlsafe(16)
+        receiver = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_POST(self) -> None:
+                if not secrets.compare_digest(self.path.split('?', 1)[0], receiver.callback_path):
+                    self.send_response(404)
+                    self.end_headers()
+                    return
+                body = self.rfile.read(int(self.headers.get('Content-Length') or 0))
+                try:
+                    payload = json.loads(body or b'{}')
+                except ValueError:
+                    self.send_response(400)
+                    self.end_headers()
+                    return
+                if not receiver._received.is_set():
+                    receiver.payload = payload
+                    receiver._received.set()
+                self.send_response(200)
+                self.end_headers()
+
+            def log_message(self, format: str, *args: Any) -> None:
+                pass
+
+        self._server = ThreadingHTTPServer((host, port), Handler)
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def callback_path(self) -> str:
+        return f'{self.path}/{self._token}'
+
+    @property
+    def url(self) -> str:
+        if self.public_url is not None:
+            return f'{self.public_url.rstrip("/")}{self.callback_path}'
+        host, port = self._server.server_address[:2]
+        return f'http://{host}:{port}{self.callback_path}'
+
+    def start(self) -> 'CallbackReceiver':
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._server.serve_forever, name='braze-export-callback', daemon=True)
+            self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        if self._thread is not None:
+            self._server.shutdown()
+            self._thread.join()
+            self._thread = None
+        self._server.server_close()
+
+    def reset(self) -> None:
+        """Forgets the previous callback and issues a new token; call before each export."""
+        self._received.clear()
+        self.payload = None
+        self._token = secrets.token_urlsafe(16)
+
+    def received(self, timeout: float = 0.0) -> Optional[dict[str, Any]]:
+        """Waits up to `timeout` seconds and returns the callback payload, or None if none arrived."""
+        return self.payload if self._received.wait(timeout) else None
+
+    def wait(self, timeout: Optional[float] = None) -> dict[str, Any]:
+        """Blocks until the callback arrives and returns its payload."""
+        if not self._received.wait(timeout):
+            raise TimeoutError('Timed out waiting for the Braze export callback.')
+        return self.payload
+
+    def __enter__(self) -> 'CallbackReceiver':
+        return self.start()
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.stop()
+
+
+def _check_callback(payload: dict[str, Any]) -> None:
+    if payload.get('success') is False:
+        raise RuntimeError(f'Braze reported a failed export: {payload}')
+
+
+def wait_for_archive(url: str, client: httpx.Client, poll_interval: float = 5.0, max_poll_interval: float = 60.0, timeout: float = 3600.0, callback: Optional[CallbackReceiver] = None) -> None:
+    """
+    Polls an export's download URL until the archive exists, backing off between attempts.
+
+    Pre-signed object storage URLs are only valid for GET, so each poll requests the first
+    byte of the file. 403 and 404 mean the export is still running. With a `callback`, the
+    wait between polls ends early when Braze reports the export finished.
+    """
+    deadline = time.monotonic() + timeout
+    interval = poll_interval
+    while True:
+        payload = callback.received() if callback is not None else None
+        if payload is not None:
+            _check_callback(payload)
+            return
+        response = client.get(url, headers={'Range': 'bytes=0-0'})
+        if response.status_code in (200, 206):
+            return
+        if response.status_code not in (403, 404):
+            response.raise_for_status()
+        if time.monotonic() + interval > deadline:
+            raise TimeoutError(f'Export archive was not ready after {timeout:.0f} seconds.')
+        if callback is not None:
+            callback.received(interval)
+        else:
+            time.sleep(interval)
+        interval = min(interval * 2, max_poll_interval)
+
+
+def download_archive(url: str, destination: str, client: httpx.Client) -> str:
+    """Streams the archive at `url` to `destination` in fixed-size chunks and returns the path."""
+    with client.stream('GET', url) as response:
+        response.raise_for_status()
+        with open(destination, 'wb') as file:
+            for chunk in response.iter_bytes(DOWNLOAD_CHUNK_SIZE):
+                file.write(chunk)
+    return destination
+
+
+def archive_members(path: str) -> List[str]:
+    """Names of the part files in an export archive, in the order their records are read."""
+    with zipfile.ZipFile(path) as archive:
+        return sorted(name for name in archive.namelist() if not name.endswith('/'))
+
+
+def iter_member_records(archive: zipfile.ZipFile, name: str) -> Iterator[dict[str, Any]]:
+    """Yields the user records of one JSON-lines part file, decompressing gzip parts as a stream."""
+    with archive.open(name) as member:
+        stream = gzip.GzipFile(fileobj=member) if name.endswith('.gz') else member
+        for line in io.TextIOWrapper(stream, encoding='utf-8'):
+            if line.strip():
+                yield json.loads(line)
+
+
+def iter_archive_records(path: str) -> Iterator[dict[str, Any]]:
+    """
+    Yields the user records of a downloaded export archive one line at a time.
+
+    The archive holds one or more JSON-lines part files (optionally gzip-compressed); each
+    part is decompressed as a stream, so no part file is ever held in memory whole.
+    """
+    with zipfile.ZipFile(path) as archive:
+        for name in archive_members(path):
+            yield from iter_member_records(archive, name)
+
+
+def fetch_export(start: Callable[[Optional[str]], Optional[dict[str, Any]]], destination: str, callback: Optional[CallbackReceiver] = None, http_client: Optional[httpx.Client] = None, poll_interval: float = 5.0, max_poll_interval: float = 60.0, timeout: float = 3600.0) -> str:
+    """
+    Starts a user export, waits for it to finish and downloads the archive to `destination`.
+
+    Args:
+        start: Starts the export given the callback URL (or None) and returns Braze's response.
+        destination: Path the archive is written to.
+        callback: A receiver Braze notifies when the export is done. The download URL from
+            Braze's response is still polled, so a callback that never arrives only
+            costs the polling delay.
+        http_client: Client for polling and downloading. It must not carry Braze credentials,
+            since the archive lives in object storage.
+        poll_interval: First delay between polls, doubled up to `max_poll_interval`.
+        max_poll_interval: Longest delay between polls.
+        timeout: Seconds to wait for the export to finish.
+
+    Returns:
+        str: The path of the downloaded archive.
+    """
+    if callback is not None:
+        callback.start()
+        callback.reset()
+    response = start(callback.url if callback is not None else None) or {}
+    # The URL in Braze's API response is trusted over the one in the callback body; the
+    # callback only ends the wait early.
+    url = response.get('url')
+    poll = url is not None
+    if url is None and callback is not None:
+        payload = callback.wait(timeout)
+        _check_callback(payload)
+        url = payload.get('url')
+    if not url:
+        raise RuntimeError('Braze did not return a download URL; exports written to your own storage bucket must be fetched from there.')
+
+    client = http_client if http_client is not None else httpx.Client(timeout=httpx.Timeout(60.0, read=300.0), follow_redirects=True)
+    try:
+        if poll:
+            wait_for_archive(url, client, poll_interval, max_poll_interval, timeout, callback)
+        return download_archive(url, destination, client)
+    finally:
+        if http_client is None:
+            client.close()
+
+
+def stream_export(start: Callable[[Optional[str]], Optional[dict[str, Any]]], callback: Optional[CallbackReceiver] = None, http_client: Optional[httpx.Client] = None, poll_interval: float = 5.0, max_poll_interval: float = 60.0, timeout: float = 3600.0, archive_path: Optional[str] = None) -> Iterator[dict[str, Any]]:
+    """
+    Starts a user export, waits for it to finish, downloads the archive and yields its records.
+
+    Takes the arguments of `fetch_export`; `archive_path` keeps the downloaded archive at
+    that path instead of a temporary file.
+
+    Yields:
+        dict[str, Any]: One exported user per item.
+    """
+    options = dict(callback=callback, http_client=http_client, poll_interval=poll_interval, max_poll_interval=max_poll_interval, timeout=timeout)
+    if archive_path is not None:
+        yield from iter_archive_records(fetch_export(start, archive_path, **options))
+        return
+    directory = tempfile.mkdtemp(prefix='braze-export-')
+    try:
+        yield from iter_archive_records(fetch_export(start, os.path.join(directory, 'export.zip'), **options))
+    finally:
+        shutil.rmtree(directory, ignore_errors=True)
@@ -0,0 +1,135 @@
+import logging
+import threading
+import time
+from datetime import datetime, timezone
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Set
+
+if TYPE_CHECKING:
+    from universal_mcp_braze.app import BrazeApp
+
+logger = logging.getLogger(__name__)
+
+# Kind -> BrazeApp iterator that lists it.
+_ITERATORS = {'campaigns': 'iter_campaigns', 'canvases': 'iter_canvases'}
+
+
+def _edited_at(item: dict[str, Any]) -> Optional[datetime]:
+    value = item.get('last_edited')
+    if not isinstance(value, str):
+        return None
+    try:
+        parsed = datetime.fromisoformat(value)
+    except ValueError:
+        return None
+    return parsed if parsed.tzinfo is not None else parsed.replace(tzinfo=timezone.utc)
+
+
+class Inventory:
+    """
+    An in-memory index of a workspace's campaigns or Canvases, refreshed incrementally.
+
+    The first refresh lists everything; later ones pass the newest `last_edited` seen so
+    far as `last_edit_time_gt`, so only items edited since then are fetched. Items can be
+    looked up by ID, by name (case-insensitive) and by tag in constant time.
+
+    Deleted items are never reported by the list endpoints, so they linger until a full
+    refresh (`refresh(full=True)`).
+
+    Args:
+        app: The client used for reads.
+        kind: 'campaigns' or 'canvases'.
+        include_archived: Also index archived items.
+        max_age: Seconds after which a lookup refreshes the index first; None refreshes
+            only when `refresh` is called (or on the first lookup).
+    """
+
+    def __init__(self, app: 'BrazeApp', kind: str = 'campaigns', include_archived: bool = False, max_age: Optional[float] = None) -> None:
+        if kind not in _ITERATORS:
+            raise ValueError("'kind' must be 'campaigns' or 'canvases'.")
+        self.app = app
+        self.kind = kind
+        self.include_archived = include_archived
+        self.max_age = max_age
+        self.high_water_mark: Optional[str] = None
+        self.refreshed_at: Optional[float] = None
+        self._items: Dict[str, dict[str, Any]] = {}
+        self._by_name: Dict[str, Set[str]] = {}
+        self._by_tag: Dict[str, Set[str]] = {}
+        self._lock = threading.RLock()
+
+    def __len__(self) -> int:
+        self._ensure_fresh()
+        return len(self._items)
+
+    def refresh(self, full: bool = False) -> int:
+        """Fetches the items edited since the last refresh (all items on the first or a full refresh) and returns how many changed."""
+        with self._lock:
+            if full:
+                self._items, self._by_name, self._by_tag = {}, {}, {}
+                self.high_water_mark = None
+            newest = _edited_at({'last_edited': self.high_water_mark})
+            iterate = getattr(self.app, _ITERATORS[self.kind])
+            changed = 0
+            unparseable = []
+            for item in iterate(include_archived=self.include_archived or None, last_edit_time_gt=self.high_water_mark):
+                if item.get('id') is None:
+                    continue
+                self._put(item)
+                changed += 1
+                edited_at = _edited_at(item)
+                if edited_at is None and item.get('last_edited') is not None:
+                    unparseable.append(item['last_edited'])
+                elif edited_at is not None and (newest is None or edited_at > newest):
+                    newest = edited_at
+                    self.high_water_mark = item['last_edited']
+            if unparseable:
+                logger.warning(
+                    "Could not parse 'last_edited' of %d %s (e.g. %r); they do not advance the high-water mark%s.",
+                    len(unparseable), self.kind, unparseable[0], '' if newest is not None else ', so the next refresh lists everything again',
+                )
+            self.refreshed_at = time.monotonic()
+            return changed
+
+    def _put(self, item: dict[str, Any]) -> None:
+        previous = self._items.get(item['id'])
+        if previous is not None:
+            self._unindex(previous)
+        self._items[item['id']] = item
+        if item.get('name') is not None:
+            self._by_name.setdefault(str(item['name']).casefold(), set()).add(item['id'])
+        for tag in item.get('tags') or []:
+            self._by_tag.setdefault(tag, set()).add(item['id'])
+
+    def _unindex(self, item: dict[str, Any]) -> None:
+        if item.get('name') is not None:
+            self._by_name.get(str(item['name']).casefold(), set()).discard(item['id'])
+        for tag in item.get('tags') or []:
+            self._by_tag.get(tag, set()).discard(item['id'])
+
+    def _ensure_fresh(self) -> None:
+        if self.refreshed_at is None or (self.max_age is not None and time.monotonic() - self.refreshed_at >= self.max_age):
+            self.refresh()
+
+    def get(self, item_id: str) -> Optional[dict[str, Any]]:
+        """The list entry of one item, or None if it is not known."""
+        self._ensure_fresh()
+        return self._items.get(item_id)
+
+    def find_by_name(self, name: str) -> List[dict[str, Any]]:
+        """Items whose name matches `name` ignoring case; names are not unique in Braze."""
+        self._ensure_fresh()
+        with self._lock:
+            return [self._items[item_id] for item_id in self._by_name.get(name.casefold(), ())]
+
+    def id_for(self, name: str) -> Optional[str]:
+        """The ID of the item named `name`, or None; raises ValueError when several share the name."""
+        matches = self.find_by_name(name)
+        if len(matches) > 1:
+            raise ValueError(f"{len(matches)} {self.kind} are named '{name}'.")
+        return matches[0]['id'] if matches else None
+
+    def find_by_tag(self, tag: str) -> List[dict[str, Any]]:
+        """Items carrying `tag`."""
+        self._ensure_fresh()
+        with self._lock:
+            return [self._items[item_id] for item_id in self._by_tag.get(tag, ())]
@@ -0,0 +1,159 @@
+import hashlib
+import json
+import queue
+import threading
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from datetime import date, timedelta
+from typing import Any, Callable, Deque, Iterator, List, Optional, Tuple
+
+
+def page_items(response: Optional[dict[str, Any]], key: str) -> List[Any]:
+    """Returns the list stored under `key` in a list endpoint's response, or [] for an empty body."""
+    if not response:
+        return []
+    return response.get(key) or []
+
+
+def iter_pages(fetch: Callable[[int], List[Any]], page_size: int, start_page: int = 0, prefetch: int = 0) -> Iterator[Any]:
+    """
+    Yields the items of consecutive pages until a page comes back short.
+
+    Args:
+        fetch: Returns the items of one page given its number.
+        page_size: Items on a full page; a page with fewer items is the last one.
+        start_page: Number of the first page to fetch.
+        prefetch: Pages to request ahead of the one being consumed, on a thread pool. The
+            pages past the last one are fetched speculatively and discarded.
+
+    Yields:
+        Items in page order.
+    """
+    if prefetch <= 0:
+        page = start_page
+        while True:
+            items = fetch(page)
+            yield from items
+            if len(items) < page_size:
+                return
+            page += 1
+
+    with ThreadPoolExecutor(max_workers=prefetch + 1, thread_name_prefix='braze-page') as executor:
+        pending: Deque[Future] = deque(executor.submit(fetch, page) for page in range(start_page, start_page + prefetch + 1))
+        next_page = start_page + prefetch + 1
+        try:
+            while pending:
+                items = pending.popleft().result()
+                if len(items) < page_size:
+                    yield from items
+                    return
+                pending.append(executor.submit(fetch, next_page))
+                next_page += 1
+                yield from items
+        finally:
+            for future in pending:
+                future.cancel()
+
+
+
+def iter_offsets(fetch: Callable[[int, int], List[Any]], limit: int, start: int = 0, parallel: int = 1) -> Iterator[Any]:
+    """
+    Yields the rows of consecutive `limit`/`offset` windows until a window comes back short.
+
+    Args:
+        fetch: Returns the rows of one window given its offset and limit.
+        limit: Rows per window; a window with fewer rows is the last one.
+        start: Offset of the first window.
+        parallel: Windows in flight at once. Rows are still yielded in offset order.
+
+    Yields:
+        Rows in offset order.
+    """
+    return iter_pages(lambda index: fetch(start + index * limit, limit), limit, prefetch=parallel - 1)
+
+
+def split_date_range(start_date: str, end_date: str, parts: int) -> List[Tuple[str, str]]:
+    """
+    Splits a YYYY-MM-DD range into up to `parts` contiguous sub-ranges of whole days.
+
+    Braze treats both ends of a date range as midnight UTC, so each sub-range starts on the
+    date the previous one ends on. A record stamped exactly at a shared midnight is
+    returned by both neighbouring sub-ranges; pass the combined rows through
+    `unique_records`.
+    """
+    start, end = date.fromisoformat(start_date), date.fromisoformat(end_date)
+    days = (end - start).days
+    if days <= 0 or parts <= 1:
+        return [(start_date, end_date)]
+    parts = min(parts, days)
+    bounds = [start + timedelta(days=round(i * days / parts)) for i in range(parts + 1)]
+    return [(bounds[i].isoformat(), bounds[i + 1].isoformat()) for i in range(parts)]
+
+
+def unique_records(records: Iterator[Any]) -> Iterator[Any]:
+    """
+    Yields records, skipping exact repeats of ones already yielded.
+
+    Records are compared by a 128-bit digest of their canonical JSON, so memory grows by
+    a fixed few dozen bytes per distinct record.
+    """
+    seen = set()
+    for record in records:
+        canonical = json.dumps(record, sort_keys=True, separators=(',', ':'), default=str)
+        digest = hashlib.blake2b(canonical.encode('utf-8'), digest_size=16).digest()
+        if digest not in seen:
+            seen.add(digest)
+            yield record
+
+
+_DONE = object()
+
+
+def iter_concurrently(iterators: List[Callable[[], Iterator[Any]]], buffer: int = 1000) -> Iterator[Any]:
+    """
+    Runs several iterators on their own threads and yields their items one iterator after another.
+
+    Each iterator may run up to `buffer` items ahead of the consumer, so later ones fill
+    their buffers while earlier ones are being drained. Exceptions are re-raised in order.
+    """
+    if len(iterators) == 1:
+        yield from iterators[0]()
+        return
+    stop = threading.Event()
+    queues: List[queue.Queue] = [queue.Queue(maxsize=buffer) for _ in iterators]
+
+    def put(target: queue.Queue, item: Any) -> bool:
+        while not stop.is_set():
+            try:
+                target.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def produce(make_iterator: Callable[[], Iterator[Any]], target: queue.Queue) -> None:
+        try:
+            for item in make_iterator():
+                if not put(target, (item, None)):
+                    return
+            put(target, (_DONE, None))
+        except Exception as exc:
+            put(target, (_DONE, exc))
+
+    threads = [
+        threading.Thread(target=produce, args=(make_iterator, target), name='braze-range', daemon=True)
+        for make_iterator, target in zip(iterators, queues)
+    ]
+    for thread in threads:
+        thread.start()
+    try:
+        for target in queues:
+            while True:
+                item, error = target.get()
+                if error is not None:
+                    raise error
+                if item is _DONE:
+                    break
+                yield item
+    finally:
+        stop.set()
@@ -0,0 +1,140 @@
+import asyncio
+import re
+import threading
+import time
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Pattern, Tuple
+
+import httpx
+
+
+@dataclass(frozen=True)
+class RateLimit:
+    """
+    A quota of `requests` calls per `period` seconds.
+
+    Endpoints that Braze counts against one shared quota use the same `bucket` name; when
+    `bucket` is None the endpoint template gets a quota of its own.
+    """
+    requests: int
+    period: float
+    bucket: Optional[str] = None
+
+
+MINUTE = 60.0
+HOUR = 3600.0
+DAY = 86400.0
+
+# Braze's published default limits, keyed by "METHOD /path/template" or "/path/template"
+# (any method). Workspaces with negotiated limits can override entries per instance.
+DEFAULT_RATE_LIMITS: Dict[str, RateLimit] = {
+    'POST /users/track': RateLimit(3000, 3.0),
+    'POST /users/export/ids': RateLimit(250, MINUTE),
+    'POST /users/delete': RateLimit(20000, MINUTE, bucket='users-identity'),
+    'POST /users/alias/new': RateLimit(20000, MINUTE, bucket='users-identity'),
+    'POST /users/alias/update': RateLimit(20000, MINUTE, bucket='users-identity'),
+    'POST /users/identify': RateLimit(20000, MINUTE, bucket='users-identity'),
+    'POST /users/merge': RateLimit(20000, MINUTE, bucket='users-identity'),
+    'POST /users/external_ids/rename': RateLimit(1000, MINUTE, bucket='users-external-ids'),
+    'POST /users/external_ids/remove': RateLimit(1000, MINUTE, bucket='users-external-ids'),
+    'GET /events/list': RateLimit(1000, HOUR, bucket='events-products-list'),
+    'GET /purchases/product_list': RateLimit(1000, HOUR, bucket='events-products-list'),
+    'POST /messages/send': RateLimit(250000, HOUR, bucket='messages-send'),
+    'POST /campaigns/trigger/send': RateLimit(250000, HOUR, bucket='messages-send'),
+    'POST /canvas/trigger/send': RateLimit(250000, HOUR, bucket='messages-send'),
+    'POST /sends/id/create': RateLimit(100, DAY),
+    'POST /subscription/status/set': RateLimit(5000, MINUTE, bucket='subscription-status-set'),
+    'POST /v2/subscription/status/set': RateLimit(5000, MINUTE, bucket='subscription-status-set'),
+    'GET /catalogs': RateLimit(5, MINUTE, bucket='catalogs-sync'),
+    'POST /catalogs': RateLimit(5, MINUTE, bucket='catalogs-sync'),
+    '/catalogs/{catalog_name}': RateLimit(5, MINUTE, bucket='catalogs-sync'),
+    'GET /catalogs/{catalog_name}/items': RateLimit(50, MINUTE, bucket='catalog-item-sync'),
+    '/catalogs/{catalog_name}/items/{item_id}': RateLimit(50, MINUTE, bucket='catalog-item-sync'),
+    '/catalogs/{catalog_name}/items': RateLimit(100, MINUTE, bucket='catalog-items-async'),
+    '/scim/v2/Users': RateLimit(5000, DAY, bucket='scim'),
+    '/scim/v2/Users/{id}': RateLimit(5000, DAY, bucket='scim'),
+}
+
+# Applied to every endpoint without a published limit of its own.
+DEFAULT_RATE_LIMIT = RateLimit(250000, HOUR, bucket='default')
+
+
+class _TokenBucket:
+    def __init__(self, limit: RateLimit) -> None:
+        self.capacity = float(limit.requests)
+        self.rate = limit.requests / limit.period
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+
+    def reserve(self) -> float:
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+        self.tokens -= 1
+        return 0.0 if self.tokens >= 0 else -self.tokens / self.rate
+
+
+def _compile_template(template: str) -> Pattern[str]:
+    parts = re.split(r'\{[^/{}]+\}', template)
+    return re.compile('[^/]+'.join(re.escape(part) for part in parts) + '/?')
+
+
+class RateLimiter:
+    """
+    Client-side token buckets keyed by the Braze URL path template of each request.
+
+    Calls are paced rather than rejected: `acquire` reserves a slot and sleeps until it is
+    due, so bursts beyond an endpoint's quota are spread over its window instead of coming
+    back as 429s. One limiter can be shared by several BrazeApp instances that talk to the
+    same workspace.
+
+    Args:
+        limits: Entries merged over DEFAULT_RATE_LIMITS, keyed like it. A value of None
+            removes the client-side limit for that template.
+        default: Limit for templates that have no entry; None leaves them unlimited.
+    """
+
+    def __init__(self, limits: Optional[Dict[str, Optional[RateLimit]]] = None, default: Optional[RateLimit] = DEFAULT_RATE_LIMIT) -> None:
+        merged = {**DEFAULT_RATE_LIMITS, **(limits or {})}
+        self.default = default
+        self._rules: List[Tuple[Optional[str], Pattern[str], Optional[RateLimit], str]] = []
+        for key, limit in merged.items():
+            method, _, template = key.rpartition(' ')
+            self._rules.append((method.upper() or None, _compile_template(template), limit, template))
+        # Method-specific entries win over method-agnostic ones for the same path.
+        self._rules.sort(key=lambda rule: rule[0] is None)
+        self._buckets: Dict[str, _TokenBucket] = {}
+        self._lock = threading.Lock()
+
+    def resolve(self, method: str, path: str) -> Tuple[Optional[str], Optional[RateLimit]]:
+        """Returns the bucket name and limit that apply to a request, or (None, None)."""
+        method = method.upper()
+        for rule_method, pattern, limit, template in self._rules:
+            if rule_method in (None, method) and pattern.fullmatch(path):
+                if limit is None:
+                    return None, None
+                return limit.bucket or f'{rule_method or "*"} {template}', limit
+        if self.default is None:
+            return None, None
+        return self.default.bucket or f'{method} {path}', self.default
+
+    def reserve(self, method: str, path: str) -> float:
+        """Takes one slot for the request and returns how many seconds to wait before sending it."""
+        name, limit = self.resolve(method, path)
+        if limit is None:
+            return 0.0
+        with self._lock:
+            bucket = self._buckets.get(name)
+            if bucket is None:
+                bucket = self._buckets[name] = _TokenBucket(limit)
+            return bucket.reserve()
+
+    def acquire(self, method: str, url: str) -> None:
+        delay = self.reserve(method, httpx.URL(url).path)
+        if delay > 0:
+            time.sleep(delay)
+
+    async def acquire_async(self, method: str, url: str) -> None:
+        delay = self.reserve(method, httpx.URL(url).path)
+        if delay > 0:
+            await asyncio.sleep(delay)
@@ -0,0 +1,94 @@
+import random
+import time
+from dataclasses import dataclass, field
+from email.utils import parsedate_to_datetime
+from typing import FrozenSet, Optional
+
+import httpx
+
+RETRYABLE_SERVER_ERRORS = frozenset({500, 502, 503, 504})
+IDEMPOTENT_METHODS = frozenset({'GET', 'HEAD', 'OPTIONS', 'PUT', 'DELETE'})
+
+# POST endpoints that only read data, so resending them cannot duplicate a write.
+READ_ONLY_POST_PATHS = frozenset({'/users/export/ids'})
+
+# Errors raised before the request reached Braze; resending is safe for any method.
+_NOT_SENT_ERRORS = (httpx.ConnectError, httpx.ConnectTimeout, httpx.PoolTimeout)
+
+
+def _header_delay(response: httpx.Response) -> Optional[float]:
+    retry_after = response.headers.get('Retry-After')
+    if retry_after:
+        try:
+            return max(float(retry_after), 0.0)
+        except ValueError:
+            try:
+                return max(parsedate_to_datetime(retry_after).timestamp() - time.time(), 0.0)
+            except (TypeError, ValueError):
+                pass
+    reset = response.headers.get('X-RateLimit-Reset')
+    if reset:
+        try:
+            return max(float(reset) - time.time(), 0.0)
+        except ValueError:
+            pass
+    return None
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    """
+    Decides whether and when a failed Braze request is sent again.
+
+    A 429 is always retried, since Braze rejected the request without acting on it; the wait
+    is taken from Retry-After or X-RateLimit-Reset when present. 5xx responses and transport
+    errors are retried with jittered exponential backoff for reads and idempotent writes
+    (GET/PUT/DELETE and `safe_paths`), and for other writes only when `retry_writes` is set.
+    Connection failures that happened before anything was sent are retried for every method.
+
+    Args:
+        max_attempts: Total tries per request, including the first one; 1 disables retries.
+        backoff_base: Upper bound of the first backoff delay, doubled on each attempt.
+        backoff_max: Upper bound of any backoff delay.
+        max_delay: Longest advertised wait to honour; beyond it the failure is returned.
+        reset_jitter: Random spread added to header-derived waits so clients waiting on the
+            same reset do not all fire at once.
+        retry_writes: Also retry non-idempotent writes on 5xx and read errors.
+        safe_paths: POST/PATCH paths that are safe to resend.
+    """
+    max_attempts: int = 5
+    backoff_base: float = 0.5
+    backoff_max: float = 30.0
+    max_delay: float = 300.0
+    reset_jitter: float = 0.25
+    retry_writes: bool = False
+    safe_paths: FrozenSet[str] = field(default=READ_ONLY_POST_PATHS)
+
+    def is_idempotent(self, method: str, path: str) -> bool:
+        return method.upper() in IDEMPOTENT_METHODS or path in self.safe_paths
+
+    def backoff(self, attempt: int) -> float:
+        return random.uniform(0, min(self.backoff_max, self.backoff_base * 2 ** (attempt - 1)))
+
+    def retry_delay(self, attempt: int, method: str, url: str, response: Optional[httpx.Response] = None, error: Optional[Exception] = None) -> Optional[float]:
+        """Returns seconds to wait before the next attempt, or None to give up after `attempt` tries."""
+        if attempt >= self.max_attempts:
+            return None
+        retry_unsafe = self.retry_writes or self.is_idempotent(method, httpx.URL(url).path)
+        if error is not None:
+            if isinstance(error, _NOT_SENT_ERRORS) or (isinstance(error, httpx.TransportError) and retry_unsafe):
+                return self.backoff(attempt)
+            return None
+        if response is None:
+            return None
+        if response.status_code == 429:
+            delay = _header_delay(response)
+        elif response.status_code in RETRYABLE_SERVER_ERRORS and retry_unsafe:
+            delay = _header_delay(response) if response.status_code == 503 else None
+        else:
+            return None
+        if delay is None:
+            return self.backoff(attempt)
+        if delay > self.max_delay:
+            return None
+        return delay + random.uniform(0, self.reset_jitter)
@@ -0,0 +1,145 @@
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - optional dependency
+    np = None
+
+_PERIODS = ('day', 'week', 'month')
+
+
+def _require_numpy() -> None:
+    if np is None:
+        raise ImportError("SeriesFrame requires numpy; install the 'columnar' extra.")
+
+
+def _flatten(value: Any, prefix: str) -> Iterator[Tuple[str, float]]:
+    """Yields (dotted column name, number) for every numeric leaf of a data point."""
+    if isinstance(value, bool):
+        return
+    if isinstance(value, (int, float)):
+        yield prefix, float(value)
+    elif isinstance(value, dict):
+        for key, child in value.items():
+            if key != 'time':
+                yield from _flatten(child, f'{prefix}.{key}' if prefix else str(key))
+    elif isinstance(value, list):
+        # Per-channel message stats are lists with one entry per variation.
+        for index, child in enumerate(value):
+            label = index
+            if isinstance(child, dict):
+                label = child.get('variation_api_id') or child.get('variation_name') or index
+            yield from _flatten(child, f'{prefix}.{label}')
+
+
+def _points(response: Any) -> List[dict[str, Any]]:
+    data = (response or {}).get('data') if isinstance(response, dict) else None
+    if isinstance(data, dict):
+        # Canvas series nest their points under data.stats.
+        return data.get('stats') or []
+    return data or []
+
+
+class SeriesFrame:
+    """
+    A data series response held as NumPy columns.
+
+    `index` is a datetime64 array with one entry per point, and `values` is a 2-D float
+    array with one column per numeric field. Nested fields are flattened into dotted
+    names, such as 'messages.email.<variation_api_id>.sent' for campaigns and
+    'step_stats.<step_id>.conversions' for Canvases. Missing values are NaN.
+
+    Rollups work on whole columns at once: `total` adds a metric across every
+    channel and variation, `rate` divides two totals, and `resample` sums points into
+    weeks or months.
+    """
+
+    def __init__(self, index: 'np.ndarray', columns: List[str], values: 'np.ndarray') -> None:
+        _require_numpy()
+        self.index = index
+        self.columns = list(columns)
+        self.values = values
+        self._positions = {name: position for position, name in enumerate(self.columns)}
+
+    @classmethod
+    def from_response(cls, response: Any) -> 'SeriesFrame':
+        """Builds a frame from the decoded response of any data series endpoint."""
+        _require_numpy()
+        points = _points(response)
+        rows: List[Dict[str, float]] = []
+        positions: Dict[str, int] = {}
+        for point in points:
+            row = dict(_flatten(point, ''))
+            for name in row:
+                positions.setdefault(name, len(positions))
+            rows.append(row)
+        values = np.full((len(rows), len(positions)), np.nan)
+        for row_number, row in enumerate(rows):
+            for name, value in row.items():
+                values[row_number, positions[name]] = value
+        index = np.array([str(point.get('time', ''))[:19] for point in points], dtype='datetime64[s]')
+        return cls(index, list(positions), values)
+
+    def __len__(self) -> int:
+        return len(self.index)
+
+    def __contains__(self, name: object) -> bool:
+        return name in self._positions
+
+    def __getitem__(self, name: str) -> 'np.ndarray':
+        """One column as a 1-D array."""
+        return self.values[:, self._positions[name]]
+
+    def columns_for(self, metric: str) -> List[str]:
+        """The columns that hold `metric`, at any nesting level."""
+        return [name for name in self.columns if name == metric or name.endswith(f'.{metric}')]
+
+    def total(self, metric: str, prefix: str = '') -> 'np.ndarray':
+        """
+        Per-point sum of `metric` over every column that holds it (channels, variations, steps).
+
+        Args:
+            metric: The leaf field name, e.g. 'sent' or 'unique_recipients'.
+            prefix: Only columns starting with this, e.g. 'messages.email'.
+        """
+        positions = [self._positions[name] for name in self.columns_for(metric) if name.startswith(prefix)]
+        if not positions:
+            return np.zeros(len(self))
+        return np.nansum(self.values[:, positions], axis=1)
+
+    def sum(self) -> Dict[str, float]:
+        """Totals of every column over the whole series."""
+        return dict(zip(self.columns, np.nansum(self.values, axis=0).tolist()))
+
+    def rate(self, numerator: str, denominator: str, prefix: str = '') -> 'np.ndarray':
+        """Per-point ratio of two metric totals, e.g. rate('unique_opens', 'delivered'); NaN where the denominator is 0."""
+        top, bottom = self.total(numerator, prefix), self.total(denominator, prefix)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            return np.where(bottom != 0, top / bottom, np.nan)
+
+    def resample(self, period: str) -> 'SeriesFrame':
+        """Sums points into days, ISO weeks (starting Monday) or calendar months."""
+        if period not in _PERIODS:
+            raise ValueError(f"'period' must be one of {', '.join(_PERIODS)}.")
+        days = self.index.astype('datetime64[D]')
+        if period == 'day':
+            keys = days
+        elif period == 'week':
+            # 1970-01-01 was a Thursday, so day numbers shifted by 3 are 0 on Mondays.
+            keys = days - (days.astype('int64') + 3) % 7
+        else:
+            keys = days.astype('datetime64[M]').astype('datetime64[D]')
+        periods, groups = np.unique(keys, return_inverse=True)
+        present = ~np.isnan(self.values)
+        sums = np.zeros((len(periods), len(self.columns)))
+        np.add.at(sums, groups, np.where(present, self.values, 0.0))
+        counts = np.zeros((len(periods), len(self.columns)))
+        np.add.at(counts, groups, present)
+        return SeriesFrame(periods.astype('datetime64[s]'), self.columns, np.where(counts > 0, sums, np.nan))
+
+    def to_dict(self) -> Dict[str, List[Optional[float]]]:
+        """Plain lists keyed by column, plus 'time' as ISO strings, e.g. for JSON output."""
+        result: Dict[str, List[Optional[float]]] = {'time': [str(moment) for moment in self.index]}
+        for name in self.columns:
+            result[name] = [None if np.isnan(value) else value for value in self[name].tolist()]
+        return result
@@ -0,0 +1,147 @@
+import sqlite3
+from datetime import date, datetime, timedelta, timezone
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
+
+from universal_mcp_braze.bulk import dispatch
+
+if TYPE_CHECKING:
+    from universal_mcp_braze.app import BrazeApp
+
+# Longest window, in days, the data series endpoints return in one request.
+MAX_SERIES_LENGTH = 100
+
+# Metrics whose endpoint accepts a `segment_id` filter and a `unit`.
+SEGMENTED_METRICS = frozenset({'sessions', 'events'})
+
+# Metric name -> (BrazeApp method, key of the value in each data point).
+SERIES_METRICS: Dict[str, Tuple[str, str]] = {
+    'dau': ('get_daily_active_users_series', 'dau'),
+    'mau': ('get_kpimau_data_series', 'mau'),
+    'new_users': ('list_new_user_kpi_series', 'new_users'),
+    'uninstalls': ('get_kpi_uninstalls_data_series', 'uninstalls'),
+    'sessions': ('get_sessions_data_series', 'sessions'),
+    'events': ('fetch_event_series_data', 'count'),
+}
+
+_SCHEMA = '''
+CREATE TABLE IF NOT EXISTS series_points (
+    metric TEXT NOT NULL,
+    event TEXT NOT NULL,
+    app_id TEXT NOT NULL,
+    segment_id TEXT NOT NULL,
+    day TEXT NOT NULL,
+    value REAL,
+    PRIMARY KEY (metric, event, app_id, segment_id, day)
+) WITHOUT ROWID
+'''
+
+
+def _windows(start: date, end: date) -> List[Tuple[date, int]]:
+    """Splits the days from `start` to `end` (inclusive) into (last day, length) request windows."""
+    windows = []
+    while end >= start:
+        length = min(MAX_SERIES_LENGTH, (end - start).days + 1)
+        windows.append((end, length))
+        end -= timedelta(days=length)
+    return windows
+
+
+class SeriesStore:
+    """
+    A local SQLite copy of daily KPI and custom event series, kept current incrementally.
+
+    Each series is identified by its metric and the `event`, `app_id` and `segment_id` it
+    was filtered by. `sync` only requests the days after the last stored point (that day is
+    fetched again, since it may have been incomplete), split into windows of at most 100
+    days, so a nightly refresh costs one small request per series.
+
+    Args:
+        app: The client used for reads.
+        path: SQLite database file.
+    """
+
+    def __init__(self, app: 'BrazeApp', path: str = ':memory:') -> None:
+        self.app = app
+        self.db = sqlite3.connect(path)
+        self.db.execute(_SCHEMA)
+        self.db.commit()
+
+    def close(self) -> None:
+        self.db.close()
+
+    @staticmethod
+    def _scope(metric: str, event: Optional[str], app_id: Optional[str], segment_id: Optional[str]) -> Tuple[str, str, str, str]:
+        if metric not in SERIES_METRICS:
+            raise ValueError(f"Unknown metric '{metric}'; expected one of {', '.join(SERIES_METRICS)}.")
+        if (metric == 'events') != (event is not None):
+            raise ValueError("Pass 'event' with, and only with, the 'events' metric.")
+        if segment_id is not None and metric not in SEGMENTED_METRICS:
+            raise ValueError("'segment_id' only applies to the 'sessions' and 'events' metrics.")
+        return metric, event or '', app_id or '', segment_id or ''
+
+    def last_day(self, metric: str, event: Optional[str] = None, app_id: Optional[str] = None, segment_id: Optional[str] = None) -> Optional[date]:
+        """The most recent day stored for a series, or None if it has never been synced."""
+        row = self.db.execute(
+            'SELECT MAX(day) FROM series_points WHERE metric = ? AND event = ? AND app_id = ? AND segment_id = ?',
+            self._scope(metric, event, app_id, segment_id),
+        ).fetchone()
+        return date.fromisoformat(row[0]) if row[0] else None
+
+    def points(self, metric: str, event: Optional[str] = None, app_id: Optional[str] = None, segment_id: Optional[str] = None, start: Optional[date] = None, end: Optional[date] = None) -> List[Tuple[date, Optional[float]]]:
+        """The stored (day, value) points of a series, oldest first, optionally limited to a range of days."""
+        query = 'SELECT day, value FROM series_points WHERE metric = ? AND event = ? AND app_id = ? AND segment_id = ?'
+        args: List[Any] = list(self._scope(metric, event, app_id, segment_id))
+        if start is not None:
+            query += ' AND day >= ?'
+            args.append(start.isoformat())
+        if end is not None:
+            query += ' AND day <= ?'
+            args.append(end.isoformat())
+        return [(date.fromisoformat(day), value) for day, value in self.db.execute(query + ' ORDER BY day', args)]
+
+    def sync(self, metric: str, event: Optional[str] = None, app_id: Optional[str] = None, segment_id: Optional[str] = None, start: Optional[date] = None, end: Optional[date] = None, max_workers: int = 4) -> int:
+        """
+        Fetches the days of a series that are not stored yet and stores them.
+
+        Args:
+            metric: One of 'dau', 'mau', 'new_users', 'uninstalls', 'sessions' or 'events'.
+            event: The custom event, for the 'events' metric.
+            app_id: Only this app.
+            segment_id: Only this segment, for the 'sessions' and 'events' metrics.
+            start: First day of the history to backfill on the first sync; defaults to the
+                last 100 days. Ignored once points are stored.
+            end: Last day to fetch; defaults to today (UTC).
+            max_workers: Windows requested at once during a backfill.
+
+        Returns:
+            int: The number of points written.
+        """
+        scope = self._scope(metric, event, app_id, segment_id)
+        end = end or datetime.now(timezone.utc).date()
+        first = self.last_day(metric, event, app_id, segment_id) or start or end - timedelta(days=MAX_SERIES_LENGTH - 1)
+        method_name, value_key = SERIES_METRICS[metric]
+        method = getattr(self.app, method_name)
+        filters = {'app_id': app_id}
+        if metric in SEGMENTED_METRICS:
+            filters.update(segment_id=segment_id, unit='day')
+        if metric == 'events':
+            filters['event'] = event
+
+        def fetch(window: Tuple[date, int]) -> Any:
+            last, length = window
+            return method(length=length, ending_at=f'{last.isoformat()}T23:59:59Z', **filters)
+
+        rows = []
+        for _, response, error in dispatch(fetch, _windows(first, end), max_workers=max_workers):
+            if error is not None:
+                raise error
+            for point in (response or {}).get('data') or []:
+                day = str(point.get('time', ''))[:10]
+                if first.isoformat() <= day <= end.isoformat():
+                    rows.append((*scope, day, point.get(value_key)))
+        with self.db:
+            self.db.executemany(
+                'INSERT OR REPLACE INTO series_points (metric, event, app_id, segment_id, day, value) VALUES (?, ?, ?, ?, ?, ?)',
+                rows,
+            )
+        return len(rows)
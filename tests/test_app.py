@@ -1,11 +1,17 @@
+import json
+import time
+from concurrent.futures import ThreadPoolExecutor
 from unittest.mock import MagicMock
 
+import httpx
 import pytest
 from universal_mcp.utils.testing import (
     check_application_instance,
 )
 
 from universal_mcp_braze.app import BrazeApp
+from universal_mcp_braze.cache import SeriesCache
+from universal_mcp_braze.retry import RetryPolicy
 
 @pytest.fixture
 def app_instance():
@@ -15,3 +21,308 @@ def app_instance():
 
 def test_application(app_instance):
     check_application_instance(app_instance, app_name="braze")
+
+def test_client_is_pooled_across_threads(app_instance):
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        clients = set(executor.map(lambda _: id(app_instance.client), range(32)))
+    assert len(clients) == 1
+    with app_instance.get_sync_client() as client:
+        assert client is app_instance.client
+    app_instance.close()
+    assert app_instance._client is None
+
+def test_retries_rate_limited_requests(app_instance):
+    responses = iter([
+        httpx.Response(429, headers={"X-RateLimit-Reset": str(int(time.time()))}),
+        httpx.Response(200, json={"message": "success"}),
+    ])
+    app_instance.retry_policy = RetryPolicy(reset_jitter=0)
+    app_instance._client = httpx.Client(base_url=app_instance.base_url, transport=httpx.MockTransport(lambda request: next(responses)))
+    assert app_instance.track_user_activity(events=[{"name": "login"}]) == {"message": "success"}
+
+def test_series_cache_serves_closed_windows(app_instance):
+    calls = []
+
+    def handler(request):
+        calls.append(request.url.path)
+        return httpx.Response(200, json={"data": [{"time": "2020-01-01", "dau": 5}], "message": "success"})
+
+    app_instance.series_cache = SeriesCache()
+    app_instance._client = httpx.Client(base_url=app_instance.base_url, transport=httpx.MockTransport(handler))
+    for _ in range(3):
+        series = app_instance.get_daily_active_users_series(length=7, ending_at="2020-01-07T00:00:00Z")
+    assert series["data"][0]["dau"] == 5
+    app_instance.list_campaigns(page=0)
+    app_instance.list_campaigns(page=0)
+    assert calls == ["/kpi/dau/data_series", "/campaigns/list", "/campaigns/list"]
+
+def test_series_cache_is_scoped_to_the_api_key(app_instance):
+    calls = []
+
+    def handler(request):
+        calls.append(request.headers["Authorization"])
+        return httpx.Response(200, json={"data": [{"time": "2020-01-01", "dau": len(calls)}], "message": "success"})
+
+    shared = SeriesCache()
+    other = BrazeApp(integration=MagicMock())
+    for app, token in ((app_instance, "first"), (other, "second")):
+        app.series_cache = shared
+        app._client = httpx.Client(base_url=app.base_url, headers={"Authorization": f"Bearer {token}"}, transport=httpx.MockTransport(handler))
+    assert app_instance.get_daily_active_users_series(length=7, ending_at="2020-01-07T00:00:00Z")["data"][0]["dau"] == 1
+    assert other.get_daily_active_users_series(length=7, ending_at="2020-01-07T00:00:00Z")["data"][0]["dau"] == 2
+    assert app_instance.get_daily_active_users_series(length=7, ending_at="2020-01-07T00:00:00Z")["data"][0]["dau"] == 1
+    assert calls == ["Bearer first", "Bearer second"]
+
+def test_iter_campaigns_walks_every_page(app_instance):
+    def handler(request):
+        page = int(request.url.params["page"])
+        campaigns = [{"id": f"c{page}-{i}"} for i in range(100 if page < 2 else 7)]
+        return httpx.Response(200, json={"campaigns": campaigns, "message": "success"})
+
+    app_instance._client = httpx.Client(base_url=app_instance.base_url, transport=httpx.MockTransport(handler))
+    campaigns = list(app_instance.iter_campaigns(prefetch=2))
+    assert len(campaigns) == 207
+    assert campaigns[0]["id"] == "c0-0" and campaigns[-1]["id"] == "c2-6"
+
+def test_iter_hard_bounces_splits_date_range(app_instance):
+    def handler(request):
+        params = request.url.params
+        day = int(params["start_date"][-2:])
+        offset, limit = int(params["offset"]), int(params["limit"])
+        rows = [{"email": f"{day}-{i}@example.com"} for i in range(offset, min(offset + limit, 600))]
+        return httpx.Response(200, json={"emails": rows, "message": "success"})
+
+    app_instance._client = httpx.Client(base_url=app_instance.base_url, transport=httpx.MockTransport(handler))
+    bounces = list(app_instance.iter_hard_bounces(start_date="2024-01-01", end_date="2024-01-05", parallel=2, date_splits=2))
+    assert len(bounces) == 1200
+    assert bounces[0]["email"] == "1-0@example.com" and bounces[-1]["email"] == "3-599@example.com"
+
+def test_iter_hard_bounces_dedupes_boundary_records(app_instance):
+    def handler(request):
+        params = request.url.params
+        rows = [{"email": f"{params['start_date']}@example.com"}, {"email": "midnight@example.com", "hard_bounced_at": "2024-01-03T00:00:00Z"}]
+        return httpx.Response(200, json={"emails": rows if params["offset"] == "0" else [], "message": "success"})
+
+    app_instance._client = httpx.Client(base_url=app_instance.base_url, transport=httpx.MockTransport(handler))
+    bounces = list(app_instance.iter_hard_bounces(start_date="2024-01-01", end_date="2024-01-05", date_splits=2))
+    assert [bounce["email"] for bounce in bounces] == ["2024-01-01@example.com", "midnight@example.com", "2024-01-03@example.com"]
+
+def test_iter_catalog_items_follows_link_cursor(app_instance):
+    def handler(request):
+        cursor = int(request.url.params.get("cursor", 0))
+        headers = {}
+        if cursor < 2:
+            headers["Link"] = f'<{app_instance.base_url}/catalogs/restaurants/items?cursor={cursor + 1}>; rel="next"'
+        items = [{"id": f"{cursor}-{i}"} for i in range(50 if cursor < 2 else 3)]
+        return httpx.Response(200, json={"items": items, "message": "success"}, headers=headers)
+
+    app_instance._client = httpx.Client(base_url=app_instance.base_url, transport=httpx.MockTransport(handler))
+    items = list(app_instance.iter_catalog_items("restaurants"))
+    assert len(items) == 103
+    assert items[-1]["id"] == "2-2"
+
+def test_upsert_catalog_items_chunks_to_request_limit(app_instance):
+    sizes = []
+
+    def handler(request):
+        assert request.method == "PUT"
+        sizes.append(len(json.loads(request.content)["items"]))
+        return httpx.Response(202, json={"message": "success"})
+
+    app_instance._client = httpx.Client(base_url=app_instance.base_url, transport=httpx.MockTransport(handler))
+    result = app_instance.upsert_catalog_items("restaurants", ({"id": str(i), "name": f"r{i}"} for i in range(120)), max_workers=3)
+    assert sorted(sizes) == [20, 50, 50]
+    assert sorted(result.succeeded, key=int) == [str(i) for i in range(120)]
+    assert result.ok
+
+def test_upsert_catalog_items_reports_items_without_id(app_instance):
+    app_instance._client = httpx.Client(base_url=app_instance.base_url, transport=httpx.MockTransport(lambda request: httpx.Response(202, json={"message": "success"})))
+    items = [*({"id": str(i)} for i in range(200)), {"name": "no id"}, "not an item", {"id": "200"}]
+    result = app_instance.upsert_catalog_items("restaurants", iter(items))
+    assert len(result.succeeded) == 201
+    assert result.invalid == [200, 201]
+    assert not result.failed and not result.ok
+
+def test_upsert_catalog_items_keeps_ids_apart_from_positions(app_instance):
+    app_instance._client = httpx.Client(base_url=app_instance.base_url, transport=httpx.MockTransport(lambda request: httpx.Response(400, json={"message": "Invalid"})))
+    result = app_instance.upsert_catalog_items("restaurants", [{"name": "no id"}, {"id": 0}])
+    assert result.invalid == [0]
+    assert list(result.failed) == [0] and result.failed[0] == {"message": "Invalid"}
+
+def test_delete_catalog_items_sends_ids_in_body(app_instance):
+    bodies = []
+
+    def handler(request):
+        assert request.method == "DELETE"
+        bodies.append(json.loads(request.content))
+        return httpx.Response(202, json={"message": "success"})
+
+    app_instance._client = httpx.Client(base_url=app_instance.base_url, transport=httpx.MockTransport(handler))
+    result = app_instance.delete_catalog_items("restaurants", (f"sku-{i}" for i in range(60)))
+    assert sorted(len(body["items"]) for body in bodies) == [10, 50]
+    assert {"id": "sku-59"} in [item for body in bodies for item in body["items"]]
+    assert len(result.succeeded) == 60 and result.ok
+
+def test_lookup_users_dedupes_and_merges(app_instance):
+    requested = []
+
+    def handler(request):
+        body = json.loads(request.content)
+        requested.append(body)
+        users = [{"external_id": external_id} for external_id in body.get("external_ids", []) if external_id != "ghost"]
+        users += [{"user_aliases": [alias]} for alias in body.get("user_aliases", [])]
+        invalid = ["ghost"] if "ghost" in body.get("external_ids", []) else []
+        return httpx.Response(201, json={"users": users, "invalid_user_ids": invalid, "message": "success"})
+
+    app_instance._client = httpx.Client(base_url=app_instance.base_url, transport=httpx.MockTransport(handler))
+    alias = {"alias_name": "device123", "alias_label": "my_device"}
+    ids = [f"user_{i}" for i in range(70)] + ["user_0", "ghost", alias]
+    result = app_instance.lookup_users(ids, fields=["email"])
+
+    assert sorted(len(body.get("external_ids", [])) + len(body.get("user_aliases", [])) for body in requested) == [22, 50]
+    assert all("external_id" in body["fields_to_export"] for body in requested)
+    assert len(result["users"]) == 71
+    assert result["users"]["9:my_device:device123"] == {"user_aliases": [alias]}
+    assert result["invalid_user_ids"] == ["ghost"]
+    assert result["errors"] == []
+
+def test_get_campaigns_analytics_reports_per_id_errors(app_instance):
+    def handler(request):
+        campaign_id = request.url.params["campaign_id"]
+        if campaign_id == "missing":
+            return httpx.Response(400, json={"message": "Invalid campaign_id"})
+        if request.url.path == "/campaigns/details":
+            return httpx.Response(200, json={"name": campaign_id, "message": "success"})
+        return httpx.Response(200, json={"data": [{"time": "2024-01-01", "conversions": 1}], "message": "success"})
+
+    app_instance._client = httpx.Client(base_url=app_instance.base_url, transport=httpx.MockTransport(handler))
+    result = app_instance.get_campaigns_analytics(["c1", "c2", "c1", "missing"], length=1)
+    assert list(result["campaigns"]) == ["c1", "c2", "missing"]
+    assert result["campaigns"]["c2"]["details"]["name"] == "c2"
+    assert result["campaigns"]["c1"]["data_series"]["data"][0]["conversions"] == 1
+    assert result["campaigns"]["missing"] == {}
+    assert sorted(error["endpoint"] for error in result["errors"]) == ["data_series", "details"]
+    assert result["errors"][0]["error"] == {"message": "Invalid campaign_id"}
+
+def test_kpi_snapshot_aligns_series(app_instance):
+    def handler(request):
+        metric = request.url.path.split("/")[-2]
+        if request.url.path == "/sessions/data_series":
+            metric = "sessions"
+        if request.url.params["app_id"] == "a2" and metric == "mau":
+            return httpx.Response(500, json={"message": "Internal error"})
+        days = ["2024-01-02"] if metric == "uninstalls" else ["2024-01-01", "2024-01-02"]
+        return httpx.Response(200, json={"data": [{"time": day, metric: 1} for day in days], "message": "success"})
+
+    app_instance.retry_policy = RetryPolicy(max_attempts=1)
+    app_instance._client = httpx.Client(base_url=app_instance.base_url, transport=httpx.MockTransport(handler))
+    snapshot = app_instance.kpi_snapshot(["a1", "a2"], length=2)
+    assert snapshot["dates"] == ["2024-01-01", "2024-01-02"]
+    assert snapshot["metrics"] == ["dau", "mau", "new_users", "uninstalls", "sessions"]
+    assert snapshot["values"]["a1"]["uninstalls"] == [None, 1]
+    assert snapshot["values"]["a1"]["sessions"] == [1, 1]
+    assert snapshot["values"]["a2"]["mau"] == [None, None]
+    assert [(error["app_id"], error["metric"]) for error in snapshot["errors"]] == [("a2", "mau")]
+
+def test_lookup_users_keeps_colliding_aliases_apart(app_instance):
+    def handler(request):
+        aliases = json.loads(request.content).get("user_aliases", [])
+        return httpx.Response(201, json={"users": [{"user_aliases": [alias], "email": alias["alias_name"]} for alias in aliases], "message": "success"})
+
+    app_instance._client = httpx.Client(base_url=app_instance.base_url, transport=httpx.MockTransport(handler))
+    first = {"alias_label": "a:b", "alias_name": "c"}
+    second = {"alias_label": "a", "alias_name": "b:c"}
+    result = app_instance.lookup_users([first, second])
+    assert {key: user["email"] for key, user in result["users"].items()} == {"3:a:b:c": "c", "1:a:b:c": "b:c"}
+
+def test_send_messages_fans_out_recipients(app_instance):
+    bodies = []
+
+    def handler(request):
+        body = json.loads(request.content)
+        bodies.append(body)
+        if "bad" in body.get("external_user_ids", []):
+            return httpx.Response(400, json={"message": "Invalid external_user_ids"})
+        return httpx.Response(201, json={"dispatch_id": f"d{len(bodies)}", "message": "success"})
+
+    app_instance._client = httpx.Client(base_url=app_instance.base_url, transport=httpx.MockTransport(handler))
+    recipients = (f"u{i}" for i in range(120))
+    result = app_instance.send_messages([*recipients, "u0", {"alias_name": "a", "alias_label": "crm"}, "bad"], messages={"email": {"app_id": "app"}})
+    assert sorted(len(body.get("external_user_ids", [])) + len(body.get("user_aliases", [])) for body in bodies) == [22, 50, 50]
+    assert all(body["messages"] == {"email": {"app_id": "app"}} for body in bodies)
+    assert result.sent == 100 and len(result.dispatch_ids) == 2
+    assert len(result.failures) == 1 and "3:crm:a" in result.failures[0]["recipients"]
+    assert not result.ok
+
+def test_send_messages_reports_invalid_recipients(app_instance):
+    bodies = []
+
+    def handler(request):
+        bodies.append(json.loads(request.content))
+        return httpx.Response(201, json={"dispatch_id": f"d{len(bodies)}", "message": "success"})
+
+    app_instance._client = httpx.Client(base_url=app_instance.base_url, transport=httpx.MockTransport(handler))
+    recipients = [*(f"u{i}" for i in range(60)), 123, {"alias_name": "a"}, *(f"u{i}" for i in range(60, 120))]
+    result = app_instance.send_messages(recipients, messages={"email": {"app_id": "app"}}, chunk_size=50, max_workers=2)
+    assert result.sent == 120 and len(result.dispatch_ids) == 3
+    assert [failure["recipients"] for failure in result.failures] == [[123], [{"alias_name": "a"}]]
+    assert "Invalid user identifier" in result.failures[0]["error"]
+
+def test_send_messages_keeps_colliding_aliases(app_instance):
+    bodies = []
+
+    def handler(request):
+        bodies.append(json.loads(request.content))
+        return httpx.Response(201, json={"dispatch_id": "d1", "message": "success"})
+
+    app_instance._client = httpx.Client(base_url=app_instance.base_url, transport=httpx.MockTransport(handler))
+    aliases = [{"alias_label": "a:b", "alias_name": "c"}, {"alias_label": "a", "alias_name": "b:c"}]
+    result = app_instance.send_messages([*aliases, dict(aliases[0])], messages={"email": {"app_id": "app"}})
+    assert bodies[0]["user_aliases"] == aliases
+    assert result.sent == 2 and result.ok
+
+def test_send_canvas_triggers_hoists_shared_properties(app_instance):
+    bodies = []
+
+    def handler(request):
+        bodies.append(json.loads(request.content))
+        return httpx.Response(201, json={"dispatch_id": f"d{len(bodies)}", "message": "success"})
+
+    app_instance._client = httpx.Client(base_url=app_instance.base_url, transport=httpx.MockTransport(handler))
+    pairs = [(f"u{i}", {"sale": "spring", "rank": i}) for i in range(60)]
+    pairs.append(({"alias_name": "a", "alias_label": "crm"}, {"sale": "spring", "rank": 60, "locale": "en"}))
+    result = app_instance.send_canvas_triggers("canvas-1", iter(pairs), canvas_entry_properties={"brand": "x"}, max_workers=1)
+
+    assert [len(body["recipients"]) for body in bodies] == [50, 11]
+    assert bodies[0]["canvas_entry_properties"] == {"brand": "x", "sale": "spring"}
+    assert bodies[0]["recipients"][3] == {"external_user_id": "u3", "canvas_entry_properties": {"rank": 3}}
+    assert bodies[1]["recipients"][-1] == {"user_alias": {"alias_name": "a", "alias_label": "crm"}, "canvas_entry_properties": {"rank": 60, "locale": "en"}}
+    assert result.sent == 61 and result.dispatch_ids == ["d1", "d2"]
+
+def test_send_campaign_triggers_reports_invalid_recipients(app_instance):
+    bodies = []
+
+    def handler(request):
+        bodies.append(json.loads(request.content))
+        return httpx.Response(201, json={"dispatch_id": f"d{len(bodies)}", "message": "success"})
+
+    app_instance._client = httpx.Client(base_url=app_instance.base_url, transport=httpx.MockTransport(handler))
+    pairs = [(f"u{i}", None) for i in range(60)]
+    pairs += [(5, None), ({"user_alias": {"alias_name": "a"}}, None)]
+    pairs += [(f"u{i}", None) for i in range(60, 120)]
+    result = app_instance.send_campaign_triggers("campaign-1", iter(pairs), max_workers=2)
+
+    assert sorted(len(body["recipients"]) for body in bodies) == [20, 50, 50]
+    assert result.sent == 120 and len(result.dispatch_ids) == 3
+    assert [failure["recipients"] for failure in result.failures] == [[5], [{"user_alias": {"alias_name": "a"}}]]
+
+def test_decode_writes_keeps_dispatch_ids(app_instance):
+    def handler(request):
+        if request.url.path == "/users/track":
+            return httpx.Response(201, json={"message": "success", "attributes_processed": 1})
+        return httpx.Response(201, json={"dispatch_id": "d1", "message": "success"})
+
+    app_instance.decode_writes = False
+    app_instance._client = httpx.Client(base_url=app_instance.base_url, transport=httpx.MockTransport(handler))
+    assert app_instance.track_user_activity(attributes=[{"external_id": "a"}]) is None
+    assert app_instance.send_messages(["a", "b"], messages={}).dispatch_ids == ["d1"]
@@ -0,0 +1,58 @@
+import asyncio
+import inspect
+from unittest.mock import MagicMock
+
+import httpx
+import pytest
+
+from universal_mcp_braze.app import BrazeApp
+from universal_mcp_braze.async_app import AsyncBrazeApp
+
+@pytest.fixture
+def async_app_instance():
+    mock_integration = MagicMock()
+    mock_integration.get_credentials.return_value = {"access_token": "dummy_access_token"}
+    return AsyncBrazeApp(integration=mock_integration)
+
+def _mock_client(app, handler):
+    app._async_client = httpx.AsyncClient(base_url=app.base_url, transport=httpx.MockTransport(handler))
+
+# BrazeApp tools that combine several endpoint calls; AsyncBrazeApp only covers raw endpoints.
+COMPOSITE_TOOLS = {"lookup_users", "get_campaigns_analytics", "get_canvases_analytics", "kpi_snapshot"}
+
+def test_covers_every_endpoint(async_app_instance):
+    sync_tools = [tool.__name__ for tool in BrazeApp(integration=MagicMock()).list_tools() if tool.__name__ not in COMPOSITE_TOOLS]
+    async_tools = async_app_instance.list_tools()
+    assert [tool.__name__ for tool in async_tools] == sync_tools
+    assert all(inspect.iscoroutinefunction(tool) for tool in async_tools)
+
+def test_returns_json_body(async_app_instance):
+    def handler(request):
+        assert request.url.path == "/campaigns/details"
+        assert request.url.params["campaign_id"] == "c1"
+        return httpx.Response(200, json={"name": "Spring Sale"})
+
+    _mock_client(async_app_instance, handler)
+    assert asyncio.run(async_app_instance.get_campaign_details(campaign_id="c1")) == {"name": "Spring Sale"}
+
+def test_returns_none_for_empty_body(async_app_instance):
+    _mock_client(async_app_instance, lambda request: httpx.Response(204))
+    assert asyncio.run(async_app_instance.track_user_activity(events=[{"name": "login"}])) is None
+
+def test_coalesces_identical_reads(async_app_instance):
+    paths = []
+
+    async def handler(request):
+        paths.append(request.url.path)
+        await asyncio.sleep(0.01)
+        return httpx.Response(200, json={"name": "Spring Sale"})
+
+    async def main():
+        calls = [async_app_instance.get_campaign_details(campaign_id="c1") for _ in range(5)]
+        return await asyncio.gather(*calls, async_app_instance.get_campaign_details(campaign_id="c2"))
+
+    _mock_client(async_app_instance, handler)
+    results = asyncio.run(main())
+    assert all(result == {"name": "Spring Sale"} for result in results)
+    assert results[0] is not results[1]
+    assert len(paths) == 2
@@ -0,0 +1,40 @@
+import time
+from unittest.mock import MagicMock
+
+from universal_mcp_braze.batching import TrackBatcher
+
+
+def test_packs_full_payloads_per_type():
+    app = MagicMock()
+    with TrackBatcher(app, max_per_type=3, max_wait=60) as batcher:
+        for i in range(7):
+            batcher.add_event({'external_id': f'user_{i}', 'name': 'rented_movie'})
+        batcher.add_purchase({'external_id': 'user_0', 'product_id': 'sku'})
+
+    sent = [call.kwargs for call in app.track_user_activity.call_args_list]
+    assert [len(payload.get('events', [])) for payload in sent] == [3, 3, 1]
+    assert sum(len(payload.get('purchases', [])) for payload in sent) == 1
+
+
+def test_flushes_on_deadline():
+    app = MagicMock()
+    batcher = TrackBatcher(app, max_wait=0.05)
+    batcher.add_attributes({'external_id': 'user_1', 'plan': 'gold'})
+    for _ in range(100):
+        if app.track_user_activity.called:
+            break
+        time.sleep(0.01)
+    batcher.close()
+
+    app.track_user_activity.assert_called_once_with(attributes=[{'external_id': 'user_1', 'plan': 'gold'}])
+
+
+def test_errors_are_reported_to_callback():
+    app = MagicMock()
+    app.track_user_activity.side_effect = RuntimeError('boom')
+    errors = []
+    with TrackBatcher(app, on_error=lambda exc, payload: errors.append((exc, payload))) as batcher:
+        batcher.add_event({'external_id': 'user_1', 'name': 'login'})
+
+    assert len(errors) == 1
+    assert errors[0][1] == {'events': [{'external_id': 'user_1', 'name': 'login'}]}
@@ -0,0 +1,66 @@
+import threading
+
+import httpx
+import pytest
+
+from universal_mcp_braze.bulk import BulkResult, chunked, dispatch, hoist_properties, record_chunk, resending
+
+
+def test_chunked_streams_fixed_size_lists():
+    assert list(chunked(iter(range(7)), 3)) == [[0, 1, 2], [3, 4, 5], [6]]
+    with pytest.raises(ValueError):
+        list(chunked([], 0))
+
+
+def test_dispatch_reports_results_and_errors():
+    def send(payload):
+        if payload == 3:
+            raise RuntimeError('boom')
+        return payload * 10
+
+    outcomes = {payload: (result, error) for payload, result, error in dispatch(send, range(6), max_workers=2)}
+    assert outcomes[2] == (20, None)
+    assert outcomes[3][0] is None and isinstance(outcomes[3][1], RuntimeError)
+    assert len(outcomes) == 6
+
+
+def test_resending_drops_items_named_in_error():
+    body = {'errors': [{'id': 'invalid-fields', 'message': 'Bad field', 'parameters': ['id'], 'parameter_values': ['b']}]}
+    request = httpx.Request('PUT', 'https://rest.iad-01.braze.com/catalogs/c/items')
+    error = httpx.HTTPStatusError('400', request=request, response=httpx.Response(400, json=body, request=request))
+    sent = []
+
+    def send(items):
+        sent.append(items)
+        if len(sent) == 1:
+            raise error
+        return {'message': 'success'}
+
+    outcomes = resending(send, lambda item: item['id'])([{'id': 'a'}, {'id': 'b'}, {'id': 'c'}])
+    assert sent[1] == [{'id': 'a'}, {'id': 'c'}]
+
+    result = BulkResult()
+    for elements, response, request_error in outcomes:
+        record_chunk(result, elements, response, request_error, lambda item: item['id'])
+    assert result.succeeded == ['a', 'c']
+    assert result.failed == {'b': body['errors'][0]}
+    assert not result.ok
+
+
+def test_resending_runs_in_the_dispatch_workers():
+    threads = []
+
+    def send(items):
+        threads.append(threading.current_thread().name)
+        raise RuntimeError('boom')
+
+    outcomes = [outcome for _, outcome, _ in dispatch(resending(send, lambda item: item), [[1, 2]], max_workers=1)]
+    assert outcomes[0][0][0] == [1, 2] and isinstance(outcomes[0][0][2], RuntimeError)
+    assert all(name.startswith('braze-bulk') for name in threads)
+
+
+def test_hoist_properties_keeps_effective_values():
+    top, remaining = hoist_properties([{'a': 1, 'b': 2}, {'a': 1, 'b': 3}, {'a': 1, 'c': 4, 'd': 0}], shared={'d': 0, 'e': 5})
+    assert top == {'a': 1, 'd': 0, 'e': 5}
+    assert remaining == [{'b': 2}, {'b': 3}, {'c': 4}]
+    assert hoist_properties([None, {'a': 1}]) == ({}, [{}, {'a': 1}])
@@ -0,0 +1,66 @@
+from datetime import datetime, timedelta, timezone
+
+import httpx
+
+from universal_mcp_braze.cache import MemoryCache, SeriesCache, SQLiteCache, credential_namespace, parse_ending_at
+
+BASE = 'https://rest.iad-01.braze.com'
+
+
+def _response(body=b'{"data": []}'):
+    return httpx.Response(200, content=body, request=httpx.Request('GET', BASE))
+
+
+def test_parses_braze_offsets():
+    assert parse_ending_at('2020-06-28T23:59:59-5:00') == datetime(2020, 6, 29, 4, 59, 59, tzinfo=timezone.utc)
+    assert parse_ending_at('2020-06-28') == datetime(2020, 6, 28, tzinfo=timezone.utc)
+    assert parse_ending_at('yesterday') is None
+
+
+def test_equivalent_parameters_share_a_key():
+    cache = SeriesCache()
+    first = cache.key(f'{BASE}/kpi/dau/data_series', {'length': 7, 'ending_at': '2020-06-28T23:59:59-5:00', 'app_id': None})
+    second = cache.key(f'{BASE}/kpi/dau/data_series', {'ending_at': '2020-06-29T04:59:59Z', 'length': '7'})
+    assert first == second
+    assert cache.key(f'{BASE}/campaigns/list', {'page': 0}) is None
+
+
+def test_workspaces_never_share_a_key():
+    cache = SeriesCache()
+    first = credential_namespace({'Authorization': 'Bearer first'})
+    second = credential_namespace({'Authorization': 'Bearer second'})
+    url = f'{BASE}/kpi/dau/data_series'
+    assert cache.key(url, {'length': 7}, first) != cache.key(url, {'length': 7}, second)
+    assert cache.key(url, {'length': 7}, first) != cache.key('https://rest.fra-01.braze.eu/kpi/dau/data_series', {'length': 7}, first)
+
+
+def test_closed_windows_never_expire():
+    cache = SeriesCache(recent_ttl=60)
+    old = (datetime.now(timezone.utc) - timedelta(days=30)).isoformat()
+    recent = (datetime.now(timezone.utc) - timedelta(hours=1)).isoformat()
+    assert cache.ttl({'ending_at': old}) is None
+    assert cache.ttl({'ending_at': recent}) == 60
+    assert cache.ttl({}) == 60
+
+
+def test_memory_cache_evicts_least_recently_used():
+    backend = MemoryCache(max_entries=2)
+    backend.set('a', b'1', None)
+    backend.set('b', b'2', None)
+    backend.get('a')
+    backend.set('c', b'3', None)
+    assert backend.get('b') is None
+    assert backend.get('a') == b'1'
+    backend.set('d', b'4', -1)
+    assert backend.get('d') is None
+
+
+def test_sqlite_cache_round_trip(tmp_path):
+    cache = SeriesCache(SQLiteCache(str(tmp_path / 'series.db')))
+    url = f'{BASE}/segments/data_series'
+    params = {'segment_id': 's1', 'length': 14, 'ending_at': '2020-01-01'}
+    assert cache.lookup(url, params) is None
+    cache.store(url, params, _response(b'{"data": [{"size": 3}]}'))
+    assert cache.lookup(url, params).json() == {'data': [{'size': 3}]}
+    cache.store(url, {'segment_id': 's2'}, httpx.Response(429, request=httpx.Request('GET', url)))
+    assert cache.lookup(url, {'segment_id': 's2'}) is None
@@ -0,0 +1,81 @@
+from unittest.mock import MagicMock
+
+from universal_mcp_braze.bulk import BulkResult
+from universal_mcp_braze.catalog_mirror import CatalogMirror, content_hash
+
+
+def _accept_all(catalog_name, items, mode, max_workers):
+    return BulkResult(succeeded=[item['id'] for item in items])
+
+
+def test_content_hash_ignores_key_order():
+    assert content_hash({'id': '1', 'name': 'a'}) == content_hash({'name': 'a', 'id': '1'})
+    assert content_hash({'id': '1', 'name': 'a'}) != content_hash({'id': '1', 'name': 'b'})
+
+
+def test_sync_only_writes_changes(tmp_path):
+    app = MagicMock()
+    app.iter_catalog_items.return_value = iter([{'id': '1', 'name': 'a'}, {'id': '2', 'name': 'b'}, {'id': '3', 'name': 'c'}])
+    app.upsert_catalog_items.side_effect = _accept_all
+    app.delete_catalog_items.side_effect = lambda catalog_name, item_ids, max_workers: BulkResult(succeeded=list(item_ids))
+    mirror = CatalogMirror(app, 'restaurants', str(tmp_path / 'mirror.db'))
+    assert mirror.hydrate() == 3
+
+    result = mirror.sync([{'id': '1', 'name': 'a'}, {'id': '2', 'name': 'B'}, {'id': '4', 'name': 'd'}], delete_missing=True)
+
+    writes = {call.kwargs['mode']: [item['id'] for item in call.args[1]] for call in app.upsert_catalog_items.call_args_list}
+    assert writes == {'create': ['4'], 'update': ['2']}
+    assert app.delete_catalog_items.call_args.args == ('restaurants', ['3'])
+    assert result.ok
+    assert mirror.diff([{'id': '1', 'name': 'a'}, {'id': '2', 'name': 'B'}, {'id': '4', 'name': 'd'}]).unchanged == 3
+
+
+def test_rejected_writes_stay_pending():
+    app = MagicMock()
+    app.iter_catalog_items.return_value = iter([])
+    app.upsert_catalog_items.return_value = BulkResult(succeeded=['1'], failed={'2': 'invalid'})
+    mirror = CatalogMirror(app, 'restaurants')
+    mirror.hydrate()
+
+    mirror.sync([{'id': '1'}, {'id': '2'}])
+    assert [item['id'] for item in mirror.diff([{'id': '1'}, {'id': '2'}]).created] == ['2']
+
+
+def test_sync_streams_the_feed_in_chunks(monkeypatch):
+    monkeypatch.setattr('universal_mcp_braze.catalog_mirror.LOOKUP_CHUNK_SIZE', 2)
+    app = MagicMock()
+    app.iter_catalog_items.return_value = iter([{'id': '1'}, {'id': '2'}, {'id': '9'}])
+    app.delete_catalog_items.side_effect = lambda catalog_name, item_ids, max_workers: BulkResult(succeeded=list(item_ids))
+    mirror = CatalogMirror(app, 'restaurants')
+    mirror.hydrate()
+    read = []
+
+    def feed():
+        for item_id in '12345':
+            read.append(item_id)
+            yield {'id': item_id}
+
+    def upsert(catalog_name, items, mode, max_workers):
+        assert len(read) < 5 or [item['id'] for item in items] == ['5']
+        return _accept_all(catalog_name, items, mode, max_workers)
+
+    app.upsert_catalog_items.side_effect = upsert
+    result = mirror.sync(feed(), delete_missing=True)
+    assert [[item['id'] for item in call.args[1]] for call in app.upsert_catalog_items.call_args_list] == [['3', '4'], ['5']]
+    assert result.created.succeeded == ['3', '4', '5']
+    assert result.deleted.succeeded == ['9']
+    assert len(mirror) == 5
+
+
+def test_fields_limit_what_is_compared():
+    app = MagicMock()
+    app.iter_catalog_items.return_value = iter([{'id': '1', 'name': 'a', 'created_at': '2024-01-01'}])
+    everything = CatalogMirror(app, 'restaurants')
+    everything.hydrate()
+    assert len(everything.diff([{'id': '1', 'name': 'a'}]).updated) == 1
+
+    app.iter_catalog_items.return_value = iter([{'id': '1', 'name': 'a', 'created_at': '2024-01-01'}])
+    named = CatalogMirror(app, 'restaurants', fields=['name'])
+    named.hydrate()
+    assert named.diff([{'id': '1', 'name': 'a'}]).unchanged == 1
+    assert len(named.diff([{'id': '1', 'name': 'b'}]).updated) == 1
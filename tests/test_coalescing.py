@@ -0,0 +1,69 @@
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from universal_mcp_braze.coalescing import AsyncSingleFlight, SingleFlight, request_key
+
+
+def test_request_key_ignores_order_and_none():
+    assert request_key('/campaigns/details', {'campaign_id': 'c1', 'x': None}) == request_key('/campaigns/details', {'campaign_id': 'c1'})
+    assert request_key('/a', {'b': 1, 'c': 2}) == request_key('/a', {'c': 2, 'b': 1})
+    assert request_key('/a', {'b': 1}) != request_key('/a', {'b': 2})
+
+
+def test_request_key_follows_the_encoded_query():
+    assert request_key('/a', {'b': True}) != request_key('/a', {'b': 'True'})
+    assert request_key('/a', {'b': ['x', 'y']}) != request_key('/a', {'b': "['x', 'y']"})
+    assert request_key('/a', {'b': ['x', 'y']}) != request_key('/a', {'b': ['y', 'x']})
+    assert request_key('/a', {'b': 1}) == request_key('/a', {'b': '1'})
+
+
+def test_concurrent_calls_share_one_execution():
+    flight = SingleFlight()
+    release = threading.Event()
+    calls = []
+
+    def fetch():
+        calls.append(1)
+        release.wait(5)
+        return {'name': 'Spring Sale'}
+
+    with ThreadPoolExecutor(max_workers=5) as executor:
+        futures = [executor.submit(flight.do, 'key', fetch) for _ in range(5)]
+        time.sleep(0.2)
+        release.set()
+        results = [future.result() for future in futures]
+
+    assert len(calls) == 1
+    assert all(result is results[0] for result in results)
+    assert flight.do('key', lambda: 'fresh') == 'fresh'
+
+
+def test_errors_release_the_key():
+    flight = SingleFlight()
+
+    def fail():
+        raise RuntimeError('boom')
+
+    with pytest.raises(RuntimeError):
+        flight.do('key', fail)
+    assert flight.do('key', lambda: 'recovered') == 'recovered'
+
+
+def test_async_calls_share_one_task():
+    flight = AsyncSingleFlight()
+    calls = []
+
+    async def fetch():
+        calls.append(1)
+        await asyncio.sleep(0.01)
+        return 'ok'
+
+    async def main():
+        return await asyncio.gather(*(flight.do('key', fetch) for _ in range(5)))
+
+    assert asyncio.run(main()) == ['ok'] * 5
+    assert len(calls) == 1
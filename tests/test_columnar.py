@@ -0,0 +1,77 @@
+import gzip
+import json
+import math
+import zipfile
+
+import pytest
+
+pa = pytest.importorskip('pyarrow')
+pq = pytest.importorskip('pyarrow.parquet')
+
+from universal_mcp_braze.columnar import archive_to_numpy, archive_to_parquet, archive_to_table, export_schema  # noqa: E402
+
+FIELDS = ['external_id', 'created_at', 'random_bucket', 'total_revenue', 'custom_attributes', 'dob']
+
+
+@pytest.fixture
+def archive_path(tmp_path):
+    parts = {
+        'part-0.txt': [
+            {'external_id': 'a', 'created_at': '2024-01-02T03:04:05.000Z', 'random_bucket': 7, 'total_revenue': 9.5, 'custom_attributes': {'tier': 'gold'}, 'dob': '1990-05-01'},
+            {'external_id': 'b', 'random_bucket': 8},
+        ],
+        'part-1.txt.gz': [{'external_id': 'c', 'total_revenue': 1.25, 'email': 'ignored@example.com'}],
+        'part-2.txt': [],
+        'part-3.txt': [
+            {'external_id': 'd', 'created_at': '2020-07-10 15:00:00.000 UTC'},
+            {'external_id': 'e', 'created_at': '2020-07-10T15:00:00.123456Z'},
+        ],
+        'part-4.txt': [
+            {'external_id': 'f', 'created_at': '2020-07-10 15:00:00.000 UTC', 'dob': '1990-05-01T00:00:00'},
+            {'external_id': 'g', 'created_at': 'last tuesday', 'dob': 'unknown'},
+        ],
+    }
+    path = tmp_path / 'export.zip'
+    with zipfile.ZipFile(path, 'w') as archive:
+        for name, users in parts.items():
+            content = ''.join(json.dumps(user) + '\n' for user in users).encode()
+            archive.writestr(name, gzip.compress(content) if name.endswith('.gz') else content)
+    return str(path)
+
+
+def test_schema_follows_fields_to_export():
+    schema = export_schema(['email', 'created_at', 'random_bucket', 'not_a_braze_field'])
+    assert schema.names == ['email', 'created_at', 'random_bucket', 'not_a_braze_field']
+    assert schema.field('created_at').type == pa.timestamp('ms', tz='UTC')
+    assert schema.field('random_bucket').type == pa.int64()
+    assert schema.field('not_a_braze_field').type == pa.string()
+
+
+@pytest.mark.parametrize('max_workers', [1, 2])
+def test_archive_to_table(archive_path, max_workers):
+    table = archive_to_table(archive_path, FIELDS, max_workers=max_workers)
+    assert table.schema == export_schema(FIELDS)
+    assert table.column('external_id').to_pylist() == ['a', 'b', 'c', 'd', 'e', 'f', 'g']
+    assert table.column('random_bucket').to_pylist() == [7, 8, None, None, None, None, None]
+    assert json.loads(table.column('custom_attributes')[0].as_py()) == {'tier': 'gold'}
+    assert table.column('created_at')[0].as_py().isoformat() == '2024-01-02T03:04:05+00:00'
+
+
+def test_parses_braze_time_formats_and_nulls_the_rest(archive_path):
+    table = archive_to_table(archive_path, FIELDS, max_workers=1)
+    created = [value.isoformat() if value else None for value in table.column('created_at').to_pylist()[3:]]
+    assert created == ['2020-07-10T15:00:00+00:00', '2020-07-10T15:00:00.123000+00:00', '2020-07-10T15:00:00+00:00', None]
+    assert [str(value) if value else None for value in table.column('dob').to_pylist()[5:]] == ['1990-05-01', None]
+
+
+def test_archive_to_parquet(archive_path, tmp_path):
+    destination = str(tmp_path / 'export.parquet')
+    assert archive_to_parquet(archive_path, destination, FIELDS, max_workers=2) == 7
+    assert pq.read_table(destination).column('total_revenue').to_pylist()[:3] == [9.5, None, 1.25]
+
+
+def test_archive_to_numpy(archive_path):
+    columns = archive_to_numpy(archive_path, FIELDS, max_workers=1)
+    assert list(columns['external_id'])[:3] == ['a', 'b', 'c']
+    assert math.isnan(columns['total_revenue'][1])
+    assert columns['created_at'].dtype.kind == 'M'
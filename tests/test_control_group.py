@@ -0,0 +1,45 @@
+import pytest
+
+from universal_mcp_braze.control_group import ControlGroupIndex
+
+MEMBERS = [
+    {'external_id': 'u1', 'braze_id': 'b1'},
+    {'braze_id': 'b2', 'user_aliases': [{'alias_label': 'crm', 'alias_name': 'x9'}]},
+    {'external_id': 'u3'},
+]
+
+
+def test_lookups(tmp_path):
+    path = str(tmp_path / 'gcg.idx')
+    ControlGroupIndex.build(iter(MEMBERS), path).close()
+
+    with ControlGroupIndex.open(path) as index:
+        assert len(index) == 5
+        assert 'u1' in index and 'u3' in index
+        assert 'u2' not in index and 'b1' not in index
+        assert index.contains(braze_id='b2')
+        assert index.contains(user_alias={'alias_label': 'crm', 'alias_name': 'x9'})
+        assert not index.contains(user_alias={'alias_label': 'crm', 'alias_name': 'u1'})
+        assert index.contains(external_id='nobody', braze_id='b1')
+        assert index.exclude(['u0', 'u1', 'u2', 'u3']) == ['u0', 'u2']
+
+
+def test_empty_index(tmp_path):
+    path = str(tmp_path / 'gcg.idx')
+    with ControlGroupIndex.build([], path) as index:
+        assert len(index) == 0
+        assert 'u1' not in index
+
+
+def test_rejects_other_files(tmp_path):
+    path = tmp_path / 'not-an-index'
+    path.write_bytes(b'x' * 32)
+    with pytest.raises(ValueError):
+        ControlGroupIndex.open(str(path))
+
+
+def test_alias_keys_are_unambiguous(tmp_path):
+    path = str(tmp_path / 'gcg.idx')
+    with ControlGroupIndex.build([{'user_aliases': [{'alias_label': 'a:b', 'alias_name': 'c'}]}], path) as index:
+        assert index.contains(user_alias={'alias_label': 'a:b', 'alias_name': 'c'})
+        assert not index.contains(user_alias={'alias_label': 'a', 'alias_name': 'b:c'})
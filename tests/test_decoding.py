@@ -0,0 +1,45 @@
+import json
+
+import httpx
+import pytest
+
+from universal_mcp_braze.decoding import decode_response, is_write
+
+
+def _response(status_code, content=b'', method='GET', path='/campaigns/list'):
+    return httpx.Response(status_code, content=content, request=httpx.Request(method, f'https://rest.iad-01.braze.com{path}'))
+
+
+def test_empty_bodies_decode_to_none():
+    assert decode_response(_response(204)) is None
+    assert decode_response(_response(200)) is None
+    assert decode_response(_response(200, b' \n')) is None
+    assert decode_response(_response(200, b'not json')) is None
+
+
+def test_parses_raw_bytes_with_pluggable_backend():
+    seen = []
+
+    def loads(content):
+        seen.append(content)
+        return json.loads(content)
+
+    assert decode_response(_response(200, b'{"message": "success"}'), loads) == {'message': 'success'}
+    assert seen == [b'{"message": "success"}']
+
+
+def test_errors_raise_and_skip_body_returns_none():
+    with pytest.raises(httpx.HTTPStatusError):
+        decode_response(_response(400, b'{"message": "bad"}'))
+    assert decode_response(_response(201, b'{"message": "queued"}', method='POST'), skip_body=True) is None
+
+
+def test_is_write_only_matches_acknowledgements():
+    assert is_write(_response(201, method='POST', path='/users/track'))
+    assert is_write(_response(202, method='PUT', path='/catalogs/restaurants/items'))
+    assert not is_write(_response(201, method='POST', path='/users/export/ids'))
+    assert not is_write(_response(201, method='POST', path='/messages/send'))
+    assert not is_write(_response(201, method='POST', path='/canvas/trigger/send'))
+    assert not is_write(_response(201, method='POST', path='/messages/schedule/create'))
+    assert not is_write(_response(201, method='POST', path='/catalogs'))
+    assert not is_write(_response(200))
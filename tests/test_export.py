@@ -0,0 +1,121 @@
+import gzip
+import io
+import json
+import threading
+import zipfile
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import httpx
+import pytest
+
+from universal_mcp_braze.export import CallbackReceiver, iter_archive_records, stream_export
+
+
+def _archive(parts):
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, 'w') as archive:
+        for name, users in parts.items():
+            content = ''.join(json.dumps(user) + '\n' for user in users).encode()
+            archive.writestr(name, gzip.compress(content) if name.endswith('.gz') else content)
+    return buffer.getvalue()
+
+
+@pytest.fixture
+def file_host():
+    """A stand-in for the object storage host that serves the archive after a few polls."""
+    state = {'polls_before_ready': 2, 'archive': _archive({'part-0.txt': [{'external_id': 'a'}], 'part-1.txt.gz': [{'external_id': 'b'}, {'external_id': 'c'}]})}
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            if state['polls_before_ready'] > 0:
+                state['polls_before_ready'] -= 1
+                self.send_response(404)
+                self.end_headers()
+                return
+            self.send_response(200)
+            self.send_header('Content-Length', str(len(state['archive'])))
+            self.end_headers()
+            self.wfile.write(state['archive'])
+
+        def log_message(self, format, *args):
+            pass
+
+    server = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield f'http://127.0.0.1:{server.server_address[1]}/export.zip', state
+    server.shutdown()
+    server.server_close()
+
+
+def test_polls_then_streams_records(file_host):
+    url, state = file_host
+    started = []
+
+    def start(callback_endpoint):
+        started.append(callback_endpoint)
+        return {'url': url, 'message': 'success'}
+
+    records = list(stream_export(start, poll_interval=0.01))
+    assert started == [None]
+    assert [record['external_id'] for record in records] == ['a', 'b', 'c']
+    assert state['polls_before_ready'] == 0
+
+
+def test_callback_receiver_delivers_url(file_host, tmp_path):
+    url, state = file_host
+    state['polls_before_ready'] = 0
+
+    with CallbackReceiver(host='127.0.0.1') as receiver:
+        def start(callback_endpoint):
+            httpx.post(callback_endpoint, json={'success': True, 'url': url, 'time': '2024-01-01T00:00:00Z'})
+            return {'message': 'success'}
+
+        records = list(stream_export(start, callback=receiver, archive_path=str(tmp_path / 'export.zip'), timeout=5))
+
+    assert len(records) == 3
+    assert [record['external_id'] for record in iter_archive_records(str(tmp_path / 'export.zip'))] == ['a', 'b', 'c']
+
+
+def test_failed_export_raises():
+    with CallbackReceiver(host='127.0.0.1') as receiver:
+        def start(callback_endpoint):
+            httpx.post(callback_endpoint, json={'success': False})
+            return {}
+
+        with pytest.raises(RuntimeError):
+            list(stream_export(start, callback=receiver, timeout=5))
+
+
+def test_rejects_callbacks_without_token():
+    with CallbackReceiver() as receiver:
+        forged = receiver.url.rsplit('/', 1)[0] + '/guess'
+        assert httpx.post(forged, json={'success': True, 'url': 'http://evil.example/x.zip'}).status_code == 404
+        assert receiver.received() is None
+        assert httpx.post(receiver.url, json={'success': True}).status_code == 200
+        assert receiver.received() == {'success': True}
+
+
+def test_reset_forgets_previous_export():
+    with CallbackReceiver() as receiver:
+        first_url = receiver.url
+        httpx.post(first_url, json={'success': True, 'url': 'old'})
+        receiver.reset()
+        assert receiver.received() is None
+        assert receiver.url != first_url
+        assert httpx.post(first_url, json={'success': True}).status_code == 404
+
+
+def test_external_interfaces_require_public_url():
+    with pytest.raises(ValueError):
+        CallbackReceiver(host='0.0.0.0')
+    receiver = CallbackReceiver(host='0.0.0.0', public_url='https://hooks.example.com/')
+    assert receiver.url.startswith('https://hooks.example.com/braze/export-callback/')
+    receiver.stop()
+
+
+def test_polls_when_callback_never_arrives(file_host):
+    url, state = file_host
+    with CallbackReceiver() as receiver:
+        records = list(stream_export(lambda callback_endpoint: {'url': url}, callback=receiver, poll_interval=0.01, timeout=5))
+    assert len(records) == 3
+    assert state['polls_before_ready'] == 0
@@ -0,0 +1,49 @@
+from unittest.mock import MagicMock
+
+import pytest
+
+from universal_mcp_braze.inventory import Inventory
+
+
+def test_incremental_refresh_and_lookups():
+    app = MagicMock()
+    app.iter_campaigns.return_value = iter([
+        {'id': 'c1', 'name': 'Spring Sale', 'tags': ['promo'], 'last_edited': '2024-03-01T10:00:00+00:00'},
+        {'id': 'c2', 'name': 'Welcome', 'tags': ['onboarding', 'promo'], 'last_edited': '2024-03-05T09:00:00+00:00'},
+    ])
+    inventory = Inventory(app)
+
+    assert inventory.id_for('spring sale') == 'c1'
+    assert {item['id'] for item in inventory.find_by_tag('promo')} == {'c1', 'c2'}
+    app.iter_campaigns.assert_called_once_with(include_archived=None, last_edit_time_gt=None)
+    assert inventory.high_water_mark == '2024-03-05T09:00:00+00:00'
+
+    app.iter_campaigns.return_value = iter([
+        {'id': 'c1', 'name': 'Summer Sale', 'tags': [], 'last_edited': '2024-03-06T00:00:00+00:00'},
+    ])
+    assert inventory.refresh() == 1
+    app.iter_campaigns.assert_called_with(include_archived=None, last_edit_time_gt='2024-03-05T09:00:00+00:00')
+    assert inventory.find_by_name('Spring Sale') == []
+    assert inventory.get('c1')['name'] == 'Summer Sale'
+    assert [item['id'] for item in inventory.find_by_tag('promo')] == ['c2']
+    assert len(inventory) == 2
+
+
+def test_duplicate_names_are_ambiguous():
+    app = MagicMock()
+    app.iter_canvases.return_value = iter([{'id': 'v1', 'name': 'Onboarding'}, {'id': 'v2', 'name': 'onboarding'}])
+    inventory = Inventory(app, kind='canvases')
+    assert len(inventory.find_by_name('ONBOARDING')) == 2
+    with pytest.raises(ValueError):
+        inventory.id_for('Onboarding')
+    assert inventory.high_water_mark is None
+
+
+def test_unparseable_last_edited_is_reported(caplog):
+    app = MagicMock()
+    app.iter_campaigns.return_value = iter([{'id': 'c1', 'name': 'Spring Sale', 'last_edited': 'March 1st'}])
+    inventory = Inventory(app)
+    with caplog.at_level('WARNING', logger='universal_mcp_braze.inventory'):
+        assert inventory.refresh() == 1
+    assert inventory.high_water_mark is None
+    assert "'March 1st'" in caplog.text and 'lists everything again' in caplog.text
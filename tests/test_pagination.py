@@ -0,0 +1,66 @@
+import threading
+
+import pytest
+
+from universal_mcp_braze.pagination import iter_concurrently, iter_offsets, iter_pages, page_items, split_date_range, unique_records
+
+
+def _fetcher(total, page_size, calls):
+    lock = threading.Lock()
+
+    def fetch(page):
+        with lock:
+            calls.append(page)
+        return list(range(page * page_size, min((page + 1) * page_size, total)))
+
+    return fetch
+
+
+def test_stops_after_short_page():
+    calls = []
+    assert list(iter_pages(_fetcher(25, 10, calls), 10)) == list(range(25))
+    assert calls == [0, 1, 2]
+
+
+def test_prefetch_keeps_page_order():
+    calls = []
+    assert list(iter_pages(_fetcher(95, 10, calls), 10, prefetch=3)) == list(range(95))
+    assert set(range(10)) <= set(calls)
+
+
+def test_exact_multiple_ends_on_empty_page():
+    calls = []
+    assert list(iter_pages(_fetcher(20, 10, calls), 10)) == list(range(20))
+    assert calls == [0, 1, 2]
+
+
+def test_page_items_handles_empty_bodies():
+    assert page_items(None, 'campaigns') == []
+    assert page_items({'campaigns': [{'id': 'c1'}]}, 'campaigns') == [{'id': 'c1'}]
+
+
+def test_offset_windows_in_parallel_keep_order():
+    rows = list(range(1234))
+    assert list(iter_offsets(lambda offset, limit: rows[offset:offset + limit], 100, parallel=4)) == rows
+
+
+def test_split_date_range():
+    assert split_date_range('2024-01-01', '2024-01-31', 3) == [('2024-01-01', '2024-01-11'), ('2024-01-11', '2024-01-21'), ('2024-01-21', '2024-01-31')]
+    assert split_date_range('2024-01-01', '2024-01-03', 5) == [('2024-01-01', '2024-01-02'), ('2024-01-02', '2024-01-03')]
+    assert split_date_range('2024-01-01', '2024-01-01', 4) == [('2024-01-01', '2024-01-01')]
+
+
+def test_iter_concurrently_yields_in_iterator_order_and_reraises():
+    assert list(iter_concurrently([lambda: iter(range(5)), lambda: iter(range(5, 9))], buffer=2)) == list(range(9))
+
+    def failing():
+        yield 1
+        raise RuntimeError('boom')
+
+    with pytest.raises(RuntimeError):
+        list(iter_concurrently([lambda: iter([0]), failing]))
+
+
+def test_unique_records_drops_repeats():
+    records = [{'email': 'a', 'at': '2024-01-11T00:00:00Z'}, {'email': 'b'}, {'at': '2024-01-11T00:00:00Z', 'email': 'a'}]
+    assert list(unique_records(iter(records))) == records[:2]
@@ -0,0 +1,28 @@
+from universal_mcp_braze.ratelimit import DEFAULT_RATE_LIMIT, RateLimit, RateLimiter
+
+
+def test_resolves_path_templates_and_shared_buckets():
+    limiter = RateLimiter()
+    assert limiter.resolve('POST', '/users/track') == ('POST /users/track', RateLimit(3000, 3.0))
+    assert limiter.resolve('POST', '/catalogs/restaurants/items')[0] == 'catalog-items-async'
+    assert limiter.resolve('DELETE', '/catalogs/restaurants/items')[0] == 'catalog-items-async'
+    assert limiter.resolve('GET', '/catalogs/restaurants/items')[0] == 'catalog-item-sync'
+    assert limiter.resolve('GET', '/catalogs/restaurants/items/item_1')[0] == 'catalog-item-sync'
+    assert limiter.resolve('POST', '/canvas/trigger/send')[0] == limiter.resolve('POST', '/messages/send')[0]
+    assert limiter.resolve('GET', '/campaigns/list') == ('default', DEFAULT_RATE_LIMIT)
+
+
+def test_paces_requests_beyond_the_quota():
+    limiter = RateLimiter({'POST /users/export/ids': RateLimit(2, 1.0)})
+    delays = [limiter.reserve('POST', '/users/export/ids') for _ in range(4)]
+    assert delays[:2] == [0.0, 0.0]
+    assert 0.4 < delays[2] <= 0.5
+    assert 0.9 < delays[3] <= 1.0
+    assert limiter.reserve('POST', '/users/track') == 0.0
+
+
+def test_overrides_can_disable_limits():
+    limiter = RateLimiter({'POST /users/track': None}, default=None)
+    assert limiter.resolve('POST', '/users/track') == (None, None)
+    assert limiter.resolve('GET', '/campaigns/list') == (None, None)
+    assert all(limiter.reserve('POST', '/users/track') == 0.0 for _ in range(10000))
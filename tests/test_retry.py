@@ -0,0 +1,38 @@
+import time
+
+import httpx
+
+from universal_mcp_braze.retry import RetryPolicy
+
+URL = 'https://rest.iad-01.braze.com'
+
+
+def test_429_waits_until_rate_limit_reset():
+    policy = RetryPolicy(reset_jitter=0)
+    response = httpx.Response(429, headers={'X-RateLimit-Reset': str(int(time.time()) + 10)})
+    delay = policy.retry_delay(1, 'POST', f'{URL}/users/track', response=response)
+    assert 8 < delay <= 10
+    assert policy.retry_delay(1, 'POST', f'{URL}/users/track', response=httpx.Response(429, headers={'Retry-After': '3'})) == 3
+
+
+def test_waits_beyond_max_delay_give_up():
+    policy = RetryPolicy(max_delay=60)
+    response = httpx.Response(429, headers={'X-RateLimit-Reset': str(int(time.time()) + 3600)})
+    assert policy.retry_delay(1, 'GET', f'{URL}/events/list', response=response) is None
+
+
+def test_server_errors_retry_reads_but_not_unsafe_writes():
+    policy = RetryPolicy(backoff_base=1)
+    error = httpx.Response(502)
+    assert 0 <= policy.retry_delay(1, 'GET', f'{URL}/campaigns/list', response=error) <= 1
+    assert 0 <= policy.retry_delay(3, 'POST', f'{URL}/users/export/ids', response=error) <= 4
+    assert policy.retry_delay(1, 'POST', f'{URL}/messages/send', response=error) is None
+    assert RetryPolicy(retry_writes=True).retry_delay(1, 'POST', f'{URL}/messages/send', response=error) is not None
+    assert policy.retry_delay(5, 'GET', f'{URL}/campaigns/list', response=error) is None
+
+
+def test_transport_errors():
+    policy = RetryPolicy()
+    assert policy.retry_delay(1, 'POST', f'{URL}/messages/send', error=httpx.ConnectError('refused')) is not None
+    assert policy.retry_delay(1, 'POST', f'{URL}/messages/send', error=httpx.ReadTimeout('slow')) is None
+    assert policy.retry_delay(1, 'GET', f'{URL}/campaigns/list', error=httpx.ReadTimeout('slow')) is not None
@@ -0,0 +1,65 @@
+import math
+
+import pytest
+
+np = pytest.importorskip('numpy')
+
+from universal_mcp_braze.series_frame import SeriesFrame  # noqa: E402
+
+CAMPAIGN = {
+    'data': [
+        {
+            'time': '2024-01-01',
+            'messages': {
+                'email': [{'variation_api_id': 'v1', 'sent': 10, 'unique_opens': 4}, {'variation_api_id': 'v2', 'sent': 10, 'unique_opens': 6}],
+                'ios_push': [{'variation_api_id': 'v1', 'sent': 5, 'direct_opens': 1}],
+            },
+            'conversions': 2,
+            'revenue': 1.5,
+        },
+        {'time': '2024-01-07', 'messages': {'email': [{'variation_api_id': 'v1', 'sent': 0, 'unique_opens': 0}]}, 'conversions': 1, 'revenue': 0.5},
+        {'time': '2024-01-08', 'messages': {}, 'conversions': 3, 'revenue': 0.0},
+    ],
+    'message': 'success',
+}
+
+CANVAS = {
+    'data': {
+        'name': 'Onboarding',
+        'stats': [
+            {'time': '2024-01-01', 'total_stats': {'entries': 8, 'conversions': 2}, 'variant_stats': {'a': {'name': 'A', 'entries': 5}, 'b': {'name': 'B', 'entries': 3}}},
+        ],
+    },
+    'message': 'success',
+}
+
+
+def test_flattens_channels_and_variations():
+    frame = SeriesFrame.from_response(CAMPAIGN)
+    assert len(frame) == 3
+    assert frame.index.dtype == np.dtype('datetime64[s]')
+    assert 'messages.email.v2.sent' in frame
+    assert frame.total('sent').tolist() == [25.0, 0.0, 0.0]
+    assert frame.total('sent', prefix='messages.email').tolist() == [20.0, 0.0, 0.0]
+    assert math.isnan(frame['messages.ios_push.v1.sent'][1])
+    assert frame.sum()['conversions'] == 6.0
+
+
+def test_rate_and_resample():
+    frame = SeriesFrame.from_response(CAMPAIGN)
+    rate = frame.rate('unique_opens', 'sent', prefix='messages.email')
+    assert rate[0] == 0.5 and math.isnan(rate[1])
+
+    weekly = frame.resample('week')
+    assert [str(day)[:10] for day in weekly.index] == ['2024-01-01', '2024-01-08']
+    assert weekly['conversions'].tolist() == [3.0, 3.0]
+    assert math.isnan(weekly['messages.ios_push.v1.sent'][1])
+    assert frame.resample('month')['revenue'].tolist() == [2.0]
+    with pytest.raises(ValueError):
+        frame.resample('year')
+
+
+def test_canvas_stats():
+    frame = SeriesFrame.from_response(CANVAS)
+    assert frame.total('entries', prefix='variant_stats').tolist() == [8.0]
+    assert frame.to_dict()['total_stats.conversions'] == [2.0]
@@ -0,0 +1,60 @@
+from datetime import date, timedelta
+from unittest.mock import MagicMock
+
+import pytest
+
+from universal_mcp_braze.timeseries import SeriesStore, _windows
+
+
+def _series(key):
+    def fetch(length, ending_at, **filters):
+        last = date.fromisoformat(ending_at[:10])
+        return {'data': [{'time': (last - timedelta(days=offset)).isoformat(), key: offset} for offset in reversed(range(length))], 'message': 'success'}
+    return MagicMock(side_effect=fetch)
+
+
+def test_windows_cover_range_in_chunks():
+    windows = _windows(date(2024, 1, 1), date(2024, 5, 1))
+    assert [length for _, length in windows] == [100, 22]
+    assert windows[1][0] == date(2024, 1, 22)
+
+
+def test_sync_fetches_only_new_days():
+    app = MagicMock()
+    app.get_daily_active_users_series = _series('dau')
+    store = SeriesStore(app)
+
+    assert store.sync('dau', app_id='a1', start=date(2024, 1, 1), end=date(2024, 5, 1)) == 122
+    assert app.get_daily_active_users_series.call_count == 2
+    assert store.last_day('dau', app_id='a1') == date(2024, 5, 1)
+
+    app.get_daily_active_users_series.reset_mock()
+    assert store.sync('dau', app_id='a1', end=date(2024, 5, 3)) == 3
+    app.get_daily_active_users_series.assert_called_once_with(length=3, ending_at='2024-05-03T23:59:59Z', app_id='a1')
+    assert len(store.points('dau', app_id='a1')) == 124
+    assert store.points('dau', app_id='a1', start=date(2024, 5, 3)) == [(date(2024, 5, 3), 0)]
+    assert store.last_day('dau') is None
+
+
+def test_event_series_are_scoped_by_event():
+    app = MagicMock()
+    app.fetch_event_series_data = _series('count')
+    store = SeriesStore(app)
+    store.sync('events', event='login', start=date(2024, 1, 1), end=date(2024, 1, 3))
+    assert app.fetch_event_series_data.call_args.kwargs['unit'] == 'day'
+    assert store.last_day('events', event='login') == date(2024, 1, 3)
+    assert store.last_day('events', event='purchase') is None
+    with pytest.raises(ValueError):
+        store.sync('events')
+
+
+def test_session_series_are_scoped_by_segment():
+    app = MagicMock()
+    app.get_sessions_data_series = _series('sessions')
+    store = SeriesStore(app)
+    store.sync('sessions', segment_id='s1', start=date(2024, 1, 1), end=date(2024, 1, 3))
+    app.get_sessions_data_series.assert_called_once_with(length=3, ending_at='2024-01-03T23:59:59Z', app_id=None, segment_id='s1', unit='day')
+    assert store.last_day('sessions', segment_id='s1') == date(2024, 1, 3)
+    assert store.last_day('sessions') is None
+    with pytest.raises(ValueError):
+        store.sync('dau', segment_id='s1')